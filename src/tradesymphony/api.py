@@ -1,30 +1,65 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-import httpx
-from typing import Dict, Any
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Dict, Any, Optional
 import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
 import datetime
 import os
 import json
+import time
 from pathlib import Path
 from .utils.logger import get_logger
+from .utils.http_clients import get_http_clients
+from .utils.fundamentals_snapshot import get_fundamentals_snapshot
 
 # Import TradeSymphony components
-from .crew import InvestmentFirmCrew
+from .crew_executor import get_crew_executor
+from .jobs import Job, JobQueue, JobQueueFull
+from .portfolio_client import PortfolioFetchError, get_portfolio_client
+from .result_cache import analysis_cache_key, get_analysis_cache
+from .utils.event_bus import Event, Subscription, get_event_bus
+
+# Add a logger
+logger = get_logger()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the shared HTTP connection pools, start the crew worker processes
+    with their warm crews and start the analysis workers at startup; release
+    them at shutdown. The portfolio is fetched and the screener's
+    fundamentals snapshot is built in the background while the crews warm up.
+    """
+    http_clients = get_http_clients()
+    http_clients.start()
+    http_clients.async_client()
+    get_portfolio_client().revalidate()
+    await asyncio.to_thread(get_fundamentals_snapshot().ensure_fresh)
+    crew_executor = get_crew_executor()
+    try:
+        await asyncio.to_thread(crew_executor.start)
+    except Exception as exc:
+        # Requests will retry building the crew when they need one
+        logger.error(f"Could not prebuild the investment crew: {str(exc)}")
+    analysis_jobs = get_analysis_jobs()
+    await asyncio.to_thread(analysis_jobs.start)
+    yield
+    analysis_jobs.shutdown()
+    await asyncio.to_thread(crew_executor.shutdown)
+    await http_clients.aclose()
+
 
 app = FastAPI(
     title="TradeSymphony API",
     description="API for running investment analysis using TradeSymphony",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-# External API endpoint to fetch portfolio data
-PORTFOLIO_API_URL = "https://tradesymphony-client-app.vercel.app/api/trades"
-MAX_RETRIES = 3
-RETRY_DELAY = 2  # seconds
 FALLBACK_DATA_PATH = Path(__file__).parent / "data" / "fallback_portfolio.json"
-
-# Add a logger
-logger = get_logger()
+SSE_HEARTBEAT_SECONDS = 15  # idle time before a keep-alive comment on event streams
 
 
 @app.get("/")
@@ -34,7 +69,10 @@ async def root():
         "app": "TradeSymphony API",
         "status": "online",
         "endpoints": {
-            "/analysis": "POST - Run investment analysis",
+            "/analysis": "POST - Queue an investment analysis",
+            "/analysis/custom": "POST - Queue an analysis of a supplied portfolio",
+            "/analysis/{job_id}": "GET - Status and result of an analysis",
+            "/analysis/{job_id}/events": "GET - Server-sent progress events",
             "/health": "GET - Check API health status",
         },
     }
@@ -43,58 +81,30 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "TradeSymphony API"}
+    return {
+        "status": "healthy",
+        "service": "TradeSymphony API",
+        "crew_workers": get_crew_executor().ready_workers,
+        "warm_crews": get_crew_executor().warm_crews,
+        "queued_analyses": get_analysis_jobs().queued,
+    }
 
 
 async def fetch_portfolio_data() -> Dict[str, Any]:
-    """Fetch portfolio data from the external API with retries and fallback."""
-    retries = 0
-
-    while retries < MAX_RETRIES:
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info(
-                    f"Attempting to fetch portfolio data from {PORTFOLIO_API_URL}"
-                )
-                response = await client.get(PORTFOLIO_API_URL)
-                response.raise_for_status()
-                data = response.json()
-                logger.info("Successfully fetched portfolio data")
-
-                # If the API returns a list, wrap it in a dictionary
-                if isinstance(data, list):
-                    return {"portfolio_items": data}
-                return data
-
-        except httpx.TimeoutException as exc:
-            logger.error(f"Timeout while fetching portfolio data: {str(exc)}")
-            retries += 1
-            if retries < MAX_RETRIES:
-                logger.info(
-                    f"Retrying in {RETRY_DELAY} seconds... (Attempt {retries+1}/{MAX_RETRIES})"
-                )
-                await asyncio.sleep(RETRY_DELAY)
-
-        except httpx.RequestError as exc:
-            logger.error(f"Network error while fetching portfolio data: {str(exc)}")
-            retries += 1
-            if retries < MAX_RETRIES:
-                logger.info(
-                    f"Retrying in {RETRY_DELAY} seconds... (Attempt {retries+1}/{MAX_RETRIES})"
-                )
-                await asyncio.sleep(RETRY_DELAY)
-
-        except httpx.HTTPStatusError as exc:
-            logger.error(
-                f"Error response from portfolio API: {exc.response.status_code} - {exc.response.text}"
-            )
-            break  # Don't retry on HTTP status errors
-
-        except Exception as exc:
-            logger.error(f"Unexpected error fetching portfolio data: {str(exc)}")
-            break
-
-    # If we've exhausted retries or encountered a non-retriable error, use fallback data
+    """
+    Return the portfolio from the client app, or the fallback data.
+
+    Once a portfolio has been fetched it is served from the portfolio
+    client's cache and refreshed in the background, so this only waits on
+    the upstream for the very first fetch.
+    """
+    try:
+        return await get_portfolio_client().get()
+    except PortfolioFetchError as exc:
+        logger.error(str(exc))
+    except Exception as exc:
+        logger.error(f"Unexpected error fetching portfolio data: {str(exc)}")
+
     logger.warning("Using fallback portfolio data")
     return await load_fallback_portfolio_data()
 
@@ -133,82 +143,175 @@ async def load_fallback_portfolio_data() -> Dict[str, Any]:
         return {"portfolio_items": []}
 
 
-async def run_investment_analysis(portfolio_data: Dict[str, Any]) -> Dict[str, Any]:
+def run_investment_analysis(
+    portfolio_data: Dict[str, Any], job_id: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Run the investment analysis using the InvestmentFirmCrew.
 
-    This runs in a separate thread to avoid blocking the event loop since
-    the crew execution might be computationally intensive.
+    Blocking; it runs on a job worker thread while the crew itself runs in
+    one of the crew worker processes. With a `job_id`, task and tool
+    progress is published on the event bus under that id.
     """
-    # Create and kickoff the crew
-    try:
-        crew = InvestmentFirmCrew(portfolio_data).crew()
-        result = crew.kickoff(inputs=portfolio_data)
+    return get_crew_executor().run(portfolio_data, job_id)
 
-        # Check if we have structured Pydantic output
-        if hasattr(result, "pydantic") and result.pydantic:
-            # Convert Pydantic model to dictionary
-            return result.pydantic.model_dump()
-        return result
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error during investment analysis: {str(e)}"
-        )
 
-
-@app.post("/analysis")
-async def analysis(background_tasks: BackgroundTasks):
+def execute_analysis_job(job: Job) -> Dict[str, Any]:
     """
-    Trigger an investment analysis by fetching portfolio data
-    and running it through the InvestmentFirmCrew.
+    Run one analysis job on the portfolio stored with it.
+
+    Jobs queued before portfolios were resolved at submit time have none, so
+    the portfolio is fetched for them here. The result is stored in the
+    result cache for later identical analyses.
     """
-    start_time = datetime.datetime.now()
+    portfolio_data = job.payload
+    if portfolio_data is None and job.kind == "analysis":
+        portfolio_data = get_http_clients().run_coroutine(fetch_portfolio_data())
+    return get_analysis_cache().get_or_compute(
+        analysis_cache_key(portfolio_data),
+        lambda: run_investment_analysis(portfolio_data, job.id),
+    )
 
-    # Fetch portfolio data
-    portfolio_data = await fetch_portfolio_data()
 
-    # Run the analysis in a worker thread to not block the event loop
-    # for this potentially long-running task
-    result = await asyncio.to_thread(
-        lambda: asyncio.run(run_investment_analysis(portfolio_data))
-    )
+@lru_cache(maxsize=1)
+def get_analysis_jobs() -> JobQueue:
+    """Return the queue that runs analysis jobs on a bounded set of workers."""
+    return JobQueue(execute_analysis_job)
 
-    end_time = datetime.datetime.now()
 
-    return {
-        "status": "success",
-        "message": "Investment analysis completed",
-        "execution_time": {
-            "start": start_time.isoformat(),
-            "end": end_time.isoformat(),
-            "duration_seconds": (end_time - start_time).total_seconds(),
+def _timestamp(epoch: Optional[float]) -> Optional[str]:
+    if epoch is None:
+        return None
+    return datetime.datetime.fromtimestamp(epoch).isoformat()
+
+
+def queue_analysis(kind: str, portfolio_data: Dict[str, Any]) -> Job:
+    """
+    Create the job of an analysis without spending a worker on known results.
+
+    Identical analyses (same portfolio, model, crew configuration and
+    market-data period) finish at once from the result cache, and jobs
+    identical to one still queued or running join it rather than queueing.
+    """
+    key = analysis_cache_key(portfolio_data)
+    result = get_analysis_cache().get(key)
+    if result is not None:
+        logger.info(f"Serving cached analysis {key[:12]}")
+        return get_analysis_jobs().record(kind, portfolio_data, result)
+    return get_analysis_jobs().submit(kind, portfolio_data, key)
+
+
+async def submit_analysis(
+    kind: str, portfolio_data: Dict[str, Any], message: str
+) -> JSONResponse:
+    """Queue an analysis job and answer 202 Accepted with where to poll for it."""
+    try:
+        job = await asyncio.to_thread(queue_analysis, kind, portfolio_data)
+    except JobQueueFull as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+
+    status_url = f"/analysis/{job.id}"
+    return JSONResponse(
+        status_code=202,
+        headers={"Location": status_url},
+        content={
+            "status": "accepted",
+            "message": message,
+            "job_id": job.id,
+            "status_url": status_url,
         },
-        "data": result,  # Changed from "results" to "data" to match desired structure
-    }
+    )
 
 
-@app.post("/analysis/custom")
+@app.post("/analysis", status_code=202)
+async def analysis():
+    """
+    Queue an investment analysis of the portfolio fetched from the client app.
+
+    Returns a job id at once; poll ``GET /analysis/{job_id}`` for the result.
+    """
+    portfolio_data = await fetch_portfolio_data()
+    return await submit_analysis(
+        "analysis", portfolio_data, "Investment analysis queued"
+    )
+
+
+@app.post("/analysis/custom", status_code=202)
 async def analysis_with_custom_data(portfolio: Dict[str, Any]):
     """
-    Trigger an investment analysis using custom portfolio data provided in the request.
+    Queue an investment analysis of the portfolio data provided in the request.
+
+    Returns a job id at once; poll ``GET /analysis/{job_id}`` for the result.
     """
-    start_time = datetime.datetime.now()
+    return await submit_analysis(
+        "custom", portfolio, "Custom investment analysis queued"
+    )
+
 
-    result = await asyncio.to_thread(
-        lambda: asyncio.run(run_investment_analysis(portfolio))
+async def stream_analysis_events(job: Job, subscription: Subscription):
+    """Yield the events of an analysis job as server-sent events."""
+    with subscription:
+        if job.done and subscription.empty:
+            # Finished before this process started; only the stored state is left
+            yield Event(job.id, 0, "status", job.to_dict(), time.time()).to_sse()
+            return
+        while True:
+            try:
+                event = await subscription.get(timeout=SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                return
+            yield event.to_sse()
+
+
+@app.get("/analysis/{job_id}/events")
+async def analysis_events(job_id: str, request: Request):
+    """
+    Stream the progress of an analysis job as server-sent events.
+
+    Sends "status" events when the job is queued, starts and finishes,
+    "task_started" and "task_completed" (with the task output) for each crew
+    task, and "step" and "tool_call" events while agents work. Events
+    published before the client connected are replayed first; reconnecting
+    clients resume after their ``Last-Event-ID``. The stream ends once the
+    job has finished.
+    """
+    job = await asyncio.to_thread(get_analysis_jobs().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown analysis job {job_id}")
+
+    last_event_id = request.headers.get("last-event-id", "")
+    after = int(last_event_id) if last_event_id.isdigit() else 0
+    subscription = get_event_bus().subscribe(job_id, after=after)
+    return StreamingResponse(
+        stream_analysis_events(job, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
-    end_time = datetime.datetime.now()
 
+@app.get("/analysis/{job_id}")
+async def analysis_status(job_id: str):
+    """Return the status of an analysis job and its result once it has finished."""
+    job = await asyncio.to_thread(get_analysis_jobs().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown analysis job {job_id}")
+
+    end = job.finished_at or (time.time() if job.started_at else None)
     return {
-        "status": "success",
-        "message": "Custom investment analysis completed",
+        "job_id": job.id,
+        "status": job.status,
+        "kind": job.kind,
         "execution_time": {
-            "start": start_time.isoformat(),
-            "end": end_time.isoformat(),
-            "duration_seconds": (end_time - start_time).total_seconds(),
+            "queued": _timestamp(job.created_at),
+            "start": _timestamp(job.started_at),
+            "end": _timestamp(job.finished_at),
+            "duration_seconds": end - job.started_at if end else None,
         },
-        "data": result,  # Changed from "results" to "data" to match desired structure
+        "data": job.result,
+        "error": job.error,
     }
 
 
@@ -35,6 +35,7 @@ from .tools import (
     get_firecrawl_crawl_website_tool,
     get_firecrawl_scrape_website_tool,
     StockSymbolFetcherTool,
+    shared_tools,
 )
 
 load_dotenv()
@@ -172,15 +173,15 @@ class InvestmentFirmCrew:
         The Chief Investment Officer (CIO) is responsible for overall investment
         strategy and making final portfolio decisions.
         """
-        financial_tools = [
-            PortfolioOptimizationTool(),
-            MacroeconomicAnalysisTool(),
-            RiskAssessmentTool(),
-            TavilySearchTool(),
-            FinancialDataTool(),
-            SentimentAnalysisTool(),
-            StockSymbolFetcherTool(),
-        ]
+        financial_tools = shared_tools(
+            PortfolioOptimizationTool,
+            MacroeconomicAnalysisTool,
+            RiskAssessmentTool,
+            TavilySearchTool,
+            FinancialDataTool,
+            SentimentAnalysisTool,
+            StockSymbolFetcherTool,
+        )
         return Agent(
             config=self.agents_config["chief_investment_officer"],
             tools=financial_tools,
@@ -201,13 +202,13 @@ class InvestmentFirmCrew:
         The Investment Committee reviews and votes on all major investment
         decisions before final implementation.
         """
-        committee_tools = [
-            RiskAssessmentTool(),
-            PortfolioOptimizationTool(),
-            ComplianceCheckTool(),
-            FinancialDataTool(),
-            StockSymbolFetcherTool(),
-        ]
+        committee_tools = shared_tools(
+            RiskAssessmentTool,
+            PortfolioOptimizationTool,
+            ComplianceCheckTool,
+            FinancialDataTool,
+            StockSymbolFetcherTool,
+        )
         return Agent(
             config=self.agents_config["investment_committee"],
             tools=committee_tools,
@@ -226,13 +227,13 @@ class InvestmentFirmCrew:
         The Chief Compliance Officer ensures all investment decisions
         comply with regulations and internal policies.
         """
-        compliance_tools = [
-            ComplianceCheckTool(),
-            TavilySearchTool(),
-            FirecrawlResearchTool(),
-            SentimentAnalysisTool(),
-            StockSymbolFetcherTool(),
-        ]
+        compliance_tools = shared_tools(
+            ComplianceCheckTool,
+            TavilySearchTool,
+            FirecrawlResearchTool,
+            SentimentAnalysisTool,
+            StockSymbolFetcherTool,
+        )
         return Agent(
             config=self.agents_config["chief_compliance_officer"],
             tools=compliance_tools,
@@ -251,16 +252,16 @@ class InvestmentFirmCrew:
         Portfolio Manager is responsible for executing investment strategies
         and managing specific portfolios.
         """
-        portfolio_tools = [
-            PortfolioOptimizationTool(),
-            StockScreenerTool(),
-            FinancialDataTool(),
-            TechnicalAnalysisTool(),
-            RiskAssessmentTool(),
-            TavilySearchTool(),
-            StockSymbolFetcherTool(),
-            MarketSimulationTool(),
-        ]
+        portfolio_tools = shared_tools(
+            PortfolioOptimizationTool,
+            StockScreenerTool,
+            FinancialDataTool,
+            TechnicalAnalysisTool,
+            RiskAssessmentTool,
+            TavilySearchTool,
+            StockSymbolFetcherTool,
+            MarketSimulationTool,
+        )
         return Agent(
             config=self.agents_config["portfolio_manager"],
             tools=portfolio_tools,
@@ -278,15 +279,15 @@ class InvestmentFirmCrew:
         """
         Risk Manager evaluates and mitigates risks in investment portfolios.
         """
-        risk_tools = [
-            RiskAssessmentTool(),
-            PortfolioOptimizationTool(),
-            MacroeconomicAnalysisTool(),
-            TechnicalAnalysisTool(),
-            FinancialDataTool(),
-            MarketSimulationTool(),
-            StockSymbolFetcherTool(),
-        ]
+        risk_tools = shared_tools(
+            RiskAssessmentTool,
+            PortfolioOptimizationTool,
+            MacroeconomicAnalysisTool,
+            TechnicalAnalysisTool,
+            FinancialDataTool,
+            MarketSimulationTool,
+            StockSymbolFetcherTool,
+        )
         return Agent(
             config=self.agents_config["risk_manager"],
             tools=risk_tools,
@@ -304,20 +305,20 @@ class InvestmentFirmCrew:
         """
         Fundamental Research Analyst performs detailed company and industry analysis.
         """
-        research_tools = [
-            TavilySearchTool(),
-            FirecrawlResearchTool(),
-            CompanyResearchTool(),
-            FinancialDataTool(),
-            YFinanceTool(),
-            AlphaVantageTool(),
-            MacroeconomicAnalysisTool(),
-            get_firecrawl_crawl_website_tool(),
-            get_firecrawl_scrape_website_tool(),
-            StockSymbolFetcherTool(),
-            # BrowserBasedResearchTool(),
-            FinancialAnalysisTool(),
-        ]
+        research_tools = shared_tools(
+            TavilySearchTool,
+            FirecrawlResearchTool,
+            CompanyResearchTool,
+            FinancialDataTool,
+            YFinanceTool,
+            AlphaVantageTool,
+            MacroeconomicAnalysisTool,
+            get_firecrawl_crawl_website_tool,
+            get_firecrawl_scrape_website_tool,
+            StockSymbolFetcherTool,
+            # BrowserBasedResearchTool,
+            FinancialAnalysisTool,
+        )
 
         return Agent(
             config=self.agents_config["fundamental_research_analyst"],
@@ -337,17 +338,17 @@ class InvestmentFirmCrew:
         Quantitative Analyst applies mathematical and statistical techniques
         to analyze investment opportunities and risks.
         """
-        quant_tools = [
-            StockScreenerTool(),
-            FinancialDataTool(),
-            TechnicalAnalysisTool(),
-            YFinanceTool(),
-            AlphaVantageTool(),
-            PortfolioOptimizationTool(),
-            RiskAssessmentTool(),
-            StockSymbolFetcherTool(),
-            FinancialAnalysisTool(),
-        ]
+        quant_tools = shared_tools(
+            StockScreenerTool,
+            FinancialDataTool,
+            TechnicalAnalysisTool,
+            YFinanceTool,
+            AlphaVantageTool,
+            PortfolioOptimizationTool,
+            RiskAssessmentTool,
+            StockSymbolFetcherTool,
+            FinancialAnalysisTool,
+        )
         return Agent(
             config=self.agents_config["quantitative_analyst"],
             tools=quant_tools,
@@ -365,15 +366,15 @@ class InvestmentFirmCrew:
         """
         ESG Analyst assesses environmental, social, and governance factors.
         """
-        esg_tools = [
-            TavilySearchTool(),
-            CompanyResearchTool(),
-            SentimentAnalysisTool(),
-            FirecrawlResearchTool(),
-            get_firecrawl_crawl_website_tool(),
-            get_firecrawl_scrape_website_tool(),
-            StockSymbolFetcherTool(),
-        ]
+        esg_tools = shared_tools(
+            TavilySearchTool,
+            CompanyResearchTool,
+            SentimentAnalysisTool,
+            FirecrawlResearchTool,
+            get_firecrawl_crawl_website_tool,
+            get_firecrawl_scrape_website_tool,
+            StockSymbolFetcherTool,
+        )
         return Agent(
             config=self.agents_config["esg_analyst"],
             tools=esg_tools,
@@ -391,15 +392,15 @@ class InvestmentFirmCrew:
         """
         Macro Analyst focuses on macroeconomic trends and their investment implications.
         """
-        macro_tools = [
-            MacroeconomicAnalysisTool(),
-            TavilySearchTool(),
-            FinancialDataTool(),
-            SentimentAnalysisTool(),
-            FirecrawlResearchTool(),
-            # BrowserBasedResearchTool(),
-            StockSymbolFetcherTool(),
-        ]
+        macro_tools = shared_tools(
+            MacroeconomicAnalysisTool,
+            TavilySearchTool,
+            FinancialDataTool,
+            SentimentAnalysisTool,
+            FirecrawlResearchTool,
+            # BrowserBasedResearchTool,
+            StockSymbolFetcherTool,
+        )
 
         return Agent(
             config=self.agents_config["macro_analyst"],
@@ -418,16 +419,16 @@ class InvestmentFirmCrew:
         """
         Investment Strategist develops and communicates the firm's investment outlook.
         """
-        strategy_tools = [
-            MacroeconomicAnalysisTool(),
-            FinancialDataTool(),
-            SentimentAnalysisTool(),
-            TavilySearchTool(),
-            PortfolioOptimizationTool(),
-            StockScreenerTool(),
-            RiskAssessmentTool(),
-            StockSymbolFetcherTool(),
-        ]
+        strategy_tools = shared_tools(
+            MacroeconomicAnalysisTool,
+            FinancialDataTool,
+            SentimentAnalysisTool,
+            TavilySearchTool,
+            PortfolioOptimizationTool,
+            StockScreenerTool,
+            RiskAssessmentTool,
+            StockSymbolFetcherTool,
+        )
 
         return Agent(
             config=self.agents_config["investment_strategist"],
@@ -483,13 +484,13 @@ class InvestmentFirmCrew:
             agent=self.portfolio_manager(),
             async_execution=True,  # Enable async for I/O-bound portfolio analysis
             callback=self.log_task_completion,
-            tools=[
-                PortfolioOptimizationTool(),
-                FinancialDataTool(),
-                YFinanceTool(),
-                AlphaVantageTool(),
-                StockSymbolFetcherTool(),
-            ],
+            tools=shared_tools(
+                PortfolioOptimizationTool,
+                FinancialDataTool,
+                YFinanceTool,
+                AlphaVantageTool,
+                StockSymbolFetcherTool,
+            ),
             verbose=True,
         )
 
@@ -502,18 +503,18 @@ class InvestmentFirmCrew:
             agent=self.fundamental_research_analyst(),
             async_execution=True,  # Enable async for research tasks which are I/O heavy
             callback=self.log_task_completion,
-            tools=[
-                CompanyResearchTool(),
-                FirecrawlResearchTool(),
-                get_firecrawl_crawl_website_tool(),
-                get_firecrawl_scrape_website_tool(),
-                FinancialDataTool(),
-                YFinanceTool(),
-                AlphaVantageTool(),
-                StockSymbolFetcherTool(),
-                # BrowserBasedResearchTool(),
-                FinancialAnalysisTool(),
-            ],
+            tools=shared_tools(
+                CompanyResearchTool,
+                FirecrawlResearchTool,
+                get_firecrawl_crawl_website_tool,
+                get_firecrawl_scrape_website_tool,
+                FinancialDataTool,
+                YFinanceTool,
+                AlphaVantageTool,
+                StockSymbolFetcherTool,
+                # BrowserBasedResearchTool,
+                FinancialAnalysisTool,
+            ),
             verbose=True,
         )
 
@@ -526,14 +527,14 @@ class InvestmentFirmCrew:
             agent=self.quantitative_analyst(),
             async_execution=True,  # Enable async for data-intensive screening
             callback=self.log_task_completion,
-            tools=[
-                StockScreenerTool(),
-                TechnicalAnalysisTool(),
-                YFinanceTool(),
-                StockSymbolFetcherTool(),
-                AlphaVantageTool(),
-                FinancialAnalysisTool(),
-            ],
+            tools=shared_tools(
+                StockScreenerTool,
+                TechnicalAnalysisTool,
+                YFinanceTool,
+                StockSymbolFetcherTool,
+                AlphaVantageTool,
+                FinancialAnalysisTool,
+            ),
             verbose=True,
         )
 
@@ -546,13 +547,13 @@ class InvestmentFirmCrew:
             agent=self.risk_manager(),
             async_execution=True,
             callback=self.log_task_completion,
-            tools=[
-                RiskAssessmentTool(),
-                MacroeconomicAnalysisTool(),
-                PortfolioOptimizationTool(),
-                StockSymbolFetcherTool(),
-                MarketSimulationTool(),
-            ],
+            tools=shared_tools(
+                RiskAssessmentTool,
+                MacroeconomicAnalysisTool,
+                PortfolioOptimizationTool,
+                StockSymbolFetcherTool,
+                MarketSimulationTool,
+            ),
             verbose=True,
         )
 
@@ -565,13 +566,13 @@ class InvestmentFirmCrew:
             agent=self.esg_analyst(),
             async_execution=True,
             callback=self.log_task_completion,
-            tools=[
-                SentimentAnalysisTool(),
-                FirecrawlResearchTool(),
-                get_firecrawl_crawl_website_tool(),
-                get_firecrawl_scrape_website_tool(),
-                StockSymbolFetcherTool(),
-            ],
+            tools=shared_tools(
+                SentimentAnalysisTool,
+                FirecrawlResearchTool,
+                get_firecrawl_crawl_website_tool,
+                get_firecrawl_scrape_website_tool,
+                StockSymbolFetcherTool,
+            ),
             context=[],  # ESG analysis builds on fundamental research
             verbose=True,
         )
@@ -585,13 +586,13 @@ class InvestmentFirmCrew:
             agent=self.macro_analyst(),
             async_execution=True,
             callback=self.log_task_completion,
-            tools=[
-                MacroeconomicAnalysisTool(),
-                SentimentAnalysisTool(),
-                TavilySearchTool(),
-                StockSymbolFetcherTool(),
-                # BrowserBasedResearchTool(),
-            ],
+            tools=shared_tools(
+                MacroeconomicAnalysisTool,
+                SentimentAnalysisTool,
+                TavilySearchTool,
+                StockSymbolFetcherTool,
+                # BrowserBasedResearchTool,
+            ),
             verbose=True,
         )
 
@@ -604,13 +605,13 @@ class InvestmentFirmCrew:
             agent=self.investment_strategist(),
             async_execution=False,  # Strategy task should run synchronously as it depends on multiple inputs
             callback=self.log_task_completion,
-            tools=[
-                MacroeconomicAnalysisTool(),
-                PortfolioOptimizationTool(),
-                RiskAssessmentTool(),
-                StockSymbolFetcherTool(),
-                MarketSimulationTool(),
-            ],
+            tools=shared_tools(
+                MacroeconomicAnalysisTool,
+                PortfolioOptimizationTool,
+                RiskAssessmentTool,
+                StockSymbolFetcherTool,
+                MarketSimulationTool,
+            ),
             context=[
                 self.fundamental_research_task(),
                 self.quantitative_screening_task(),
@@ -630,11 +631,11 @@ class InvestmentFirmCrew:
             agent=self.chief_compliance_officer(),
             async_execution=False,  # Compliance review should be thorough and sequential
             callback=self.log_task_completion,
-            tools=[
-                ComplianceCheckTool(),
-                StockSymbolFetcherTool(),
-                TavilySearchTool(),
-            ],
+            tools=shared_tools(
+                ComplianceCheckTool,
+                StockSymbolFetcherTool,
+                TavilySearchTool,
+            ),
             context=[
                 self.investment_strategy_task(),
                 self.portfolio_analysis_task(),  # Added for compliance context
@@ -651,11 +652,11 @@ class InvestmentFirmCrew:
             agent=self.investment_committee(),
             async_execution=False,  # Committee review is a critical decision point requiring synchronous execution
             callback=self.log_task_completion,
-            tools=[
-                RiskAssessmentTool(),
-                PortfolioOptimizationTool(),
-                StockSymbolFetcherTool(),
-            ],
+            tools=shared_tools(
+                RiskAssessmentTool,
+                PortfolioOptimizationTool,
+                StockSymbolFetcherTool,
+            ),
             context=[
                 self.investment_strategy_task(),
                 self.compliance_review_task(),
@@ -675,12 +676,12 @@ class InvestmentFirmCrew:
             output_file="reports/investment_recommendations.md",
             async_execution=False,  # Final recommendations should be sequential and carefully considered
             callback=self.log_task_completion,
-            tools=[
-                PortfolioOptimizationTool(),
-                RiskAssessmentTool(),
-                MacroeconomicAnalysisTool(),
-                StockSymbolFetcherTool(),
-            ],
+            tools=shared_tools(
+                PortfolioOptimizationTool,
+                RiskAssessmentTool,
+                MacroeconomicAnalysisTool,
+                StockSymbolFetcherTool,
+            ),
             context=[
                 self.investment_committee_task(),
                 self.investment_strategy_task(),
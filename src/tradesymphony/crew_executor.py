@@ -0,0 +1,338 @@
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from .crew_pool import get_crew_pool
+from .progress import AnalysisProgress
+from .utils.event_bus import EventBus, get_event_bus
+from .utils.logger import get_logger
+
+logger = get_logger()
+
+
+def run_crew(
+    portfolio_data: Dict[str, Any],
+    job_id: Optional[str] = None,
+    bus: Optional[EventBus] = None,
+) -> Any:
+    """
+    Run the investment crew on one portfolio in the current process.
+
+    Args:
+        portfolio_data (Dict[str, Any]): Portfolio bound at kickoff
+        job_id (str, optional): Topic for progress events; none are published
+            without it
+        bus (EventBus, optional): Bus receiving the progress events
+
+    Returns:
+        Any: Structured recommendations as a dict when the crew produced
+            them, otherwise the dumped crew output
+    """
+    # Take a prebuilt crew and bind this portfolio at kickoff
+    crew = get_crew_pool().acquire()
+    if job_id is None:
+        result = crew.kickoff(inputs=portfolio_data)
+    else:
+        with AnalysisProgress(job_id, bus).attach(crew):
+            result = crew.kickoff(inputs=portfolio_data)
+
+    # Check if we have structured Pydantic output
+    if hasattr(result, "pydantic") and result.pydantic:
+        # Convert Pydantic model to dictionary
+        return result.pydantic.model_dump()
+    if hasattr(result, "model_dump"):
+        return result.model_dump()
+    return result
+
+
+class _QueueBus:
+    """Event bus stand-in of a worker process, forwarding to the parent."""
+
+    def __init__(self, messages):
+        self._messages = messages
+
+    def publish(self, topic: str, type: str, data: Optional[Dict[str, Any]] = None):
+        self._messages.put(("event", topic, type, data or {}))
+
+
+def _worker_main(tasks, messages) -> None:
+    """Entry point of a crew worker process."""
+    try:
+        get_crew_pool().start()
+    except Exception as e:
+        # Runs will retry building the crew when they need one
+        logger.error(f"Could not prebuild the investment crew: {e}")
+    pid = os.getpid()
+    bus = _QueueBus(messages)
+    messages.put(("ready", pid))
+
+    while True:
+        item = tasks.get()
+        if item is None:
+            return
+        portfolio_data, job_id = item
+        try:
+            result = run_crew(portfolio_data, job_id, bus)
+            # Round-trip through JSON so the result always pickles
+            message = ("result", pid, json.loads(json.dumps(result, default=str)))
+        except Exception as e:
+            message = ("error", pid, f"{type(e).__name__}: {e}")
+        messages.put(message)
+
+
+@dataclass
+class _Worker:
+    process: Any
+    tasks: Any
+    future: Optional[Future] = None
+    ready: bool = False
+
+
+class CrewExecutor:
+    """
+    Runs crews in a pool of worker processes, each with its own warm state.
+
+    Crew runs execute pandas- and NumPy-heavy tools, so running them on
+    threads of the API process makes every analysis, and the event loop,
+    share one GIL. Each worker process instead builds its own crew pool at
+    start and keeps its HTTP client pools and caches for its lifetime;
+    analyses therefore scale with CPU cores.
+
+    Each worker runs one crew at a time and gets its portfolios over its own
+    task queue. Results, errors and the progress events of
+    `AnalysisProgress` come back over a shared message queue, which a
+    dispatcher thread turns into resolved futures and events on the parent's
+    event bus. A worker that dies fails its current run and is replaced.
+
+    With ``processes=0`` crews run on the calling thread instead, as before.
+
+    Attributes:
+        processes (int): Number of worker processes (0 runs in-process)
+        bus (EventBus): Bus receiving the progress events
+    """
+
+    def __init__(self, processes: Optional[int] = None, bus: Optional[EventBus] = None):
+        """
+        Initialise the executor; workers start with `start`.
+
+        Args:
+            processes (int, optional): Defaults to ``CREW_EXECUTOR_PROCESSES``,
+                or one per concurrent analysis (``ANALYSIS_MAX_CONCURRENCY``
+                or 2).
+            bus (EventBus, optional): Defaults to the process-wide event bus
+        """
+        if processes is None:
+            processes = int(
+                os.getenv(
+                    "CREW_EXECUTOR_PROCESSES",
+                    os.getenv("ANALYSIS_MAX_CONCURRENCY", "2"),
+                )
+            )
+        self.processes = processes
+        self.bus = bus or get_event_bus()
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._workers: Dict[int, _Worker] = {}
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._all_ready = threading.Event()
+        self._closed = threading.Event()
+        self._messages = None
+        self._dispatcher: Optional[threading.Thread] = None
+
+    def start(self, timeout: Optional[float] = None) -> None:
+        """
+        Start the workers and wait until each has built its crew.
+
+        Blocking; call it from a worker thread when running on an event loop.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the workers.
+                Defaults to ``CREW_EXECUTOR_START_TIMEOUT`` or 300.
+        """
+        if self.processes <= 0:
+            get_crew_pool().start()
+            return
+        with self._lock:
+            if self._workers:
+                return
+            self._closed.clear()
+            self._messages = self._context.Queue()
+            self._idle = queue.Queue()
+            self._all_ready.clear()
+            for _ in range(self.processes):
+                self._spawn()
+            self._dispatcher = threading.Thread(
+                target=self._dispatch, name="crew-executor", daemon=True
+            )
+            self._dispatcher.start()
+
+        timeout = timeout or float(os.getenv("CREW_EXECUTOR_START_TIMEOUT", "300"))
+        if not self._all_ready.wait(timeout):
+            logger.warning(
+                f"Only {self.ready_workers} of {self.processes} crew workers were "
+                f"ready after {timeout:.0f}s"
+            )
+
+    def _spawn(self) -> None:
+        tasks = self._context.Queue()
+        process = self._context.Process(
+            target=_worker_main, args=(tasks, self._messages), name="crew-worker"
+        )
+        process.start()
+        self._workers[process.pid] = _Worker(process, tasks)
+
+    def run(self, portfolio_data: Dict[str, Any], job_id: Optional[str] = None) -> Any:
+        """
+        Run the crew on one portfolio and wait for its result.
+
+        Waits for a free worker first when all of them are busy.
+
+        Args:
+            portfolio_data (Dict[str, Any]): Portfolio bound at kickoff
+            job_id (str, optional): Topic for progress events
+
+        Returns:
+            Any: Result of `run_crew`
+
+        Raises:
+            RuntimeError: If the run failed, its worker process died or the
+                executor was shut down
+        """
+        if self.processes <= 0:
+            return run_crew(portfolio_data, job_id, self.bus)
+
+        self.start()
+        future: Future = Future()
+        while True:
+            if self._closed.is_set():
+                raise RuntimeError("The crew executor was shut down")
+            try:
+                worker = self._idle.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            with self._lock:
+                # Skip workers that died while idle
+                if self._workers.get(worker.process.pid) is worker:
+                    worker.future = future
+                    break
+        worker.tasks.put((portfolio_data, job_id))
+        return future.result()
+
+    def _dispatch(self) -> None:
+        checked_at = time.monotonic()
+        while not self._closed.is_set():
+            try:
+                message = self._messages.get(timeout=1.0)
+            except queue.Empty:
+                message = None
+            except (EOFError, OSError):
+                return
+            if time.monotonic() - checked_at >= 1.0:
+                self._replace_dead_workers()
+                checked_at = time.monotonic()
+            if message is not None:
+                self._handle(message)
+
+    def _handle(self, message: tuple) -> None:
+        kind = message[0]
+        if kind == "event":
+            self.bus.publish(*message[1:])
+            return
+
+        with self._lock:
+            worker = self._workers.get(message[1])
+            if worker is None:
+                return
+            if kind == "ready":
+                worker.ready = True
+                if self._count_ready() >= self.processes:
+                    self._all_ready.set()
+                future = None
+            else:
+                future, worker.future = worker.future, None
+        if future is not None:
+            if kind == "result":
+                future.set_result(message[2])
+            else:
+                future.set_exception(RuntimeError(message[2]))
+        self._idle.put(worker)
+
+    def _replace_dead_workers(self) -> None:
+        futures = []
+        with self._lock:
+            if self._closed.is_set():
+                return
+            for pid, worker in list(self._workers.items()):
+                if worker.process.is_alive():
+                    continue
+                logger.error(
+                    f"Crew worker {pid} exited with code {worker.process.exitcode}"
+                )
+                del self._workers[pid]
+                if worker.future is not None:
+                    futures.append(worker.future)
+                self._spawn()
+        for future in futures:
+            future.set_exception(RuntimeError("The crew worker process died"))
+
+    @property
+    def warm_crews(self) -> Optional[int]:
+        """Warm crews of the in-process pool; None when workers hold them."""
+        return get_crew_pool().available if self.processes <= 0 else None
+
+    def _count_ready(self) -> int:
+        return sum(worker.ready for worker in self._workers.values())
+
+    @property
+    def ready_workers(self) -> int:
+        """Worker processes that have built their crew and take work."""
+        if self.processes <= 0:
+            return 0
+        with self._lock:
+            return self._count_ready()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Stop the workers, terminating those still running a crew.
+
+        Args:
+            timeout (float): Seconds to let idle workers exit on their own
+        """
+        if self.processes <= 0:
+            get_crew_pool().close()
+            return
+        with self._lock:
+            self._closed.set()
+            workers = list(self._workers.values())
+            self._workers.clear()
+            for worker in workers:
+                worker.tasks.put(None)
+
+        deadline = time.monotonic() + timeout
+        for worker in workers:
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            if worker.future is not None and not worker.future.done():
+                worker.future.set_exception(
+                    RuntimeError("The crew executor was shut down")
+                )
+
+
+@lru_cache(maxsize=1)
+def get_crew_executor() -> CrewExecutor:
+    """
+    Return the process-wide crew executor.
+
+    Returns:
+        CrewExecutor: Shared executor used by the API
+    """
+    return CrewExecutor()
@@ -0,0 +1,156 @@
+import os
+import queue
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Optional
+
+from crewai import Crew
+
+from .crew import InvestmentFirmCrew
+from .utils.logger import get_logger
+
+logger = get_logger()
+
+
+def build_investment_crew() -> Crew:
+    """
+    Build the investment crew from its YAML configuration.
+
+    Portfolio details are not needed here: they are bound per run through
+    ``kickoff(inputs=...)``, which interpolates them into the task and agent
+    templates.
+
+    Returns:
+        Crew: Fully constructed crew
+    """
+    return InvestmentFirmCrew({}).crew()
+
+
+class CrewPool:
+    """
+    Prebuilt crew template with a few warm copies ready for requests.
+
+    Building the crew parses the YAML configs, creates every agent and task,
+    and sets up memory storage and tracing clients. The pool does that once
+    (normally at API startup) and hands each request a ``Crew.copy()`` of the
+    template, the same mechanism crewai uses for ``kickoff_for_each``. Copies
+    share the template's memory storage, tools and clients but have their own
+    agents and tasks, so concurrent runs do not interfere.
+
+    A crew keeps outputs and usage metrics from its run, so copies are used
+    once and discarded. A daemon thread keeps `size` fresh copies queued, so
+    `acquire` normally returns without building anything.
+
+    Attributes:
+        size (int): Number of warm copies kept ready
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Crew] = build_investment_crew,
+        size: Optional[int] = None,
+    ):
+        """
+        Initialise the pool; nothing is built until `start` or `acquire`.
+
+        Args:
+            factory (Callable[[], Crew]): Builds the template crew. Defaults to
+                `build_investment_crew`.
+            size (int, optional): Warm copies to keep. Defaults to
+                ``CREW_POOL_SIZE`` or 2.
+        """
+        self.factory = factory
+        self.size = size if size is not None else int(os.getenv("CREW_POOL_SIZE", "2"))
+        self._lock = threading.Lock()
+        self._template: Optional[Crew] = None
+        self._warm: "queue.Queue[Crew]" = queue.Queue()
+        self._wanted = threading.Event()
+        self._closed = threading.Event()
+        self._filler: Optional[threading.Thread] = None
+
+    def _get_template(self) -> Crew:
+        with self._lock:
+            if self._template is None:
+                started = time.perf_counter()
+                self._template = self.factory()
+                logger.info(
+                    f"Built crew template in {time.perf_counter() - started:.2f}s"
+                )
+            return self._template
+
+    def _copy(self) -> Crew:
+        template = self._get_template()
+        with self._lock:
+            return template.copy()
+
+    def start(self) -> None:
+        """
+        Build the template and the warm copies, then keep the pool topped up.
+
+        Blocking; call it from a worker thread when running on an event loop.
+        """
+        self._closed.clear()
+        self._get_template()
+        while self._warm.qsize() < self.size:
+            self._warm.put(self._copy())
+        if self._filler is None or not self._filler.is_alive():
+            self._filler = threading.Thread(
+                target=self._fill, name="crew-pool", daemon=True
+            )
+            self._filler.start()
+
+    def _fill(self) -> None:
+        while not self._closed.is_set():
+            self._wanted.wait()
+            self._wanted.clear()
+            while not self._closed.is_set() and self._warm.qsize() < self.size:
+                try:
+                    self._warm.put(self._copy())
+                except Exception as e:
+                    logger.error(f"Could not prepare a warm crew: {e}")
+                    break
+
+    def acquire(self) -> Crew:
+        """
+        Return a crew ready for one ``kickoff``.
+
+        Takes a warm copy when one is queued, otherwise copies the template
+        (building it first if `start` was never called or failed).
+
+        Returns:
+            Crew: A crew that no other caller holds
+        """
+        try:
+            crew = self._warm.get_nowait()
+        except queue.Empty:
+            logger.info("No warm crew available, copying the template")
+            crew = self._copy()
+        self._wanted.set()
+        return crew
+
+    @property
+    def available(self) -> int:
+        """Number of warm copies currently queued."""
+        return self._warm.qsize()
+
+    def close(self) -> None:
+        """Stop topping up the pool and drop the queued copies."""
+        self._closed.set()
+        self._wanted.set()
+        while True:
+            try:
+                self._warm.get_nowait()
+            except queue.Empty:
+                break
+
+
+@lru_cache(maxsize=1)
+def get_crew_pool() -> CrewPool:
+    """
+    Return the process-wide crew pool.
+
+    Returns:
+        CrewPool: Shared pool used by the API
+    """
+    return CrewPool()
@@ -0,0 +1,418 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .utils.cache_paths import get_cache_dir
+from .utils.event_bus import EventBus, get_event_bus
+from .utils.logger import get_logger
+
+logger = get_logger()
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when too many jobs are already waiting to run."""
+
+
+@dataclass
+class Job:
+    """
+    One background analysis run.
+
+    Attributes:
+        id (str): Job identifier returned to the client
+        kind (str): What the job runs (e.g. "analysis", "custom")
+        status (str): One of queued, running, succeeded, failed
+        payload (Any): JSON input of the job
+        result (Any): JSON result once succeeded
+        error (str): Error message once failed
+        created_at (float): Epoch seconds when the job was submitted
+        started_at (float): Epoch seconds when a worker picked it up
+        finished_at (float): Epoch seconds when it succeeded or failed
+    """
+
+    id: str
+    kind: str
+    status: str
+    payload: Any = None
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job as a JSON-serialisable dict, without its payload."""
+        data = asdict(self)
+        data.pop("payload")
+        return data
+
+
+class JobStore:
+    """
+    SQLite table of jobs, so their state and results survive restarts.
+
+    Attributes:
+        db_path (Path): Location of the SQLite database
+    """
+
+    _COLUMNS = (
+        "id, kind, status, payload, result, error, created_at, started_at, finished_at"
+    )
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialise the store and create the table if needed.
+
+        Args:
+            db_path (Path, optional): SQLite file. Defaults to ``JOB_STORE_PATH``
+                or ``<CACHE_PATH>/jobs/jobs.db``.
+        """
+        if db_path is None and os.getenv("JOB_STORE_PATH"):
+            db_path = os.getenv("JOB_STORE_PATH")
+        self.db_path = Path(db_path) if db_path else get_cache_dir("jobs") / "jobs.db"
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    payload TEXT,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def _from_row(row) -> Job:
+        return Job(
+            id=row[0],
+            kind=row[1],
+            status=row[2],
+            payload=json.loads(row[3]) if row[3] is not None else None,
+            result=json.loads(row[4]) if row[4] is not None else None,
+            error=row[5],
+            created_at=row[6],
+            started_at=row[7],
+            finished_at=row[8],
+        )
+
+    def create(self, kind: str, payload: Any = None) -> Job:
+        """
+        Insert a new queued job.
+
+        Args:
+            kind (str): What the job runs
+            payload (Any): JSON input of the job
+
+        Returns:
+            Job: The stored job
+        """
+        job = Job(
+            id=uuid.uuid4().hex,
+            kind=kind,
+            status=QUEUED,
+            payload=payload,
+            created_at=time.time(),
+        )
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    job.id,
+                    kind,
+                    QUEUED,
+                    json.dumps(payload, default=str),
+                    job.created_at,
+                ),
+            )
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, or None if it does not exist."""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {self._COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._from_row(row) if row else None
+
+    def with_status(self, *statuses: str) -> List[Job]:
+        """Return the jobs in any of the given states, oldest first."""
+        placeholders = ", ".join("?" for _ in statuses)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {self._COLUMNS} FROM jobs WHERE status IN ({placeholders}) "
+                "ORDER BY created_at",
+                statuses,
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def claim(self, job_id: str) -> bool:
+        """
+        Move a queued job to running.
+
+        Returns:
+            bool: False if the job is not queued (e.g. another worker took it)
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ? "
+                "WHERE id = ? AND status = ?",
+                (RUNNING, time.time(), job_id, QUEUED),
+            )
+        return cursor.rowcount == 1
+
+    def mark_succeeded(self, job_id: str, result: Any) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, finished_at = ? WHERE id = ?",
+                (SUCCEEDED, json.dumps(result, default=str), time.time(), job_id),
+            )
+
+    def mark_failed(self, job_id: str, error: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (FAILED, error, time.time(), job_id),
+            )
+
+
+class JobQueue:
+    """
+    Runs jobs in the background on a fixed number of worker threads.
+
+    ``submit`` stores the job and returns at once; callers poll the store for
+    its status and result. At most `max_workers` jobs run at the same time
+    and at most `max_queued` wait, so expensive crew runs cannot pile up
+    without bound.
+
+    Workers are daemon threads, so shutting down does not wait for a crew
+    run to finish. On the next `start`, jobs that were still queued are run
+    again and jobs that were running are marked as failed.
+
+    Jobs submitted with a `key` are deduplicated: while a job with that key
+    is queued or running, later ones join it instead of taking a worker.
+    They are not queued themselves, start when it starts, finish with its
+    result or error, and receive its progress events on their own topic.
+
+    Every status change is published as a "status" event on the event bus,
+    with the job id as topic; the topic is closed once the job has finished.
+
+    Attributes:
+        store (JobStore): Persistent job state
+        bus (EventBus): Bus receiving the status events
+        runner (Callable[[Job], Any]): Blocking function executing one job
+        max_workers (int): Jobs allowed to run concurrently
+        max_queued (int): Jobs allowed to wait for a worker
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[Job], Any],
+        store: Optional[JobStore] = None,
+        max_workers: Optional[int] = None,
+        max_queued: Optional[int] = None,
+        bus: Optional[EventBus] = None,
+    ):
+        """
+        Initialise the queue; workers start with `start`.
+
+        Args:
+            runner (Callable[[Job], Any]): Executes a job and returns its JSON
+                result; exceptions mark the job as failed
+            store (JobStore, optional): Defaults to a store at the default path
+            max_workers (int, optional): Defaults to ``ANALYSIS_MAX_CONCURRENCY``
+                or 2.
+            max_queued (int, optional): Defaults to ``ANALYSIS_MAX_QUEUED`` or 100.
+            bus (EventBus, optional): Defaults to the process-wide event bus
+        """
+        self.runner = runner
+        self.store = store or JobStore()
+        self.bus = bus or get_event_bus()
+        self.max_workers = max_workers or int(
+            os.getenv("ANALYSIS_MAX_CONCURRENCY", "2")
+        )
+        self.max_queued = max_queued or int(os.getenv("ANALYSIS_MAX_QUEUED", "100"))
+        self._pending: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        # Deduplication: key -> leading job id, leader id -> joined job ids
+        self._leaders: Dict[str, str] = {}
+        self._followers: Dict[str, List[str]] = {}
+        self._keys: Dict[str, str] = {}
+
+    def start(self) -> None:
+        """Recover jobs left over from a previous process and start the workers."""
+        with self._lock:
+            if self._workers:
+                return
+            for job in self.store.with_status(RUNNING):
+                self.store.mark_failed(job.id, "Interrupted by a server restart")
+                self._publish_status(job.id)
+            self._pending = queue.Queue()
+            self._leaders.clear()
+            self._followers.clear()
+            self._keys.clear()
+            for job in self.store.with_status(QUEUED):
+                self._pending.put(job.id)
+            self._workers = [
+                threading.Thread(
+                    target=self._work,
+                    args=(self._pending,),
+                    name=f"analysis-worker-{i}",
+                    daemon=True,
+                )
+                for i in range(self.max_workers)
+            ]
+            for worker in self._workers:
+                worker.start()
+
+    def submit(self, kind: str, payload: Any = None, key: Optional[str] = None) -> Job:
+        """
+        Store a job and queue it for a worker, or join an identical one.
+
+        Args:
+            kind (str): What the job runs
+            payload (Any): JSON input passed to the runner
+            key (str, optional): Identity of the work; a job with the same key
+                that is still queued or running is joined instead
+
+        Returns:
+            Job: The queued, or joined and possibly already running, job
+
+        Raises:
+            JobQueueFull: If `max_queued` jobs are already waiting
+        """
+        self.start()
+        with self._lock:
+            leader = self._leaders.get(key) if key is not None else None
+            if leader is None and self._pending.qsize() >= self.max_queued:
+                raise JobQueueFull(
+                    f"{self.max_queued} analysis jobs are already queued"
+                )
+            job = self.store.create(kind, payload)
+            self._publish_status(job.id, job)
+            if leader is None:
+                if key is not None:
+                    self._leaders[key] = job.id
+                    self._followers[job.id] = []
+                    self._keys[job.id] = key
+                self._pending.put(job.id)
+                return job
+
+            logger.info(f"Job {job.id} joins identical job {leader}")
+            self._followers[leader].append(job.id)
+            if self.store.get(leader).status == RUNNING and self.store.claim(job.id):
+                job = self.store.get(job.id)
+                self._publish_status(job.id, job)
+            self.bus.forward(leader, job.id, skip={"status"})
+            return job
+
+    def record(self, kind: str, payload: Any, result: Any) -> Job:
+        """
+        Store a job that is already finished, e.g. served from a cache.
+
+        Args:
+            kind (str): What the job ran
+            payload (Any): JSON input of the job
+            result (Any): JSON result of the job
+
+        Returns:
+            Job: The succeeded job
+        """
+        job = self.store.create(kind, payload)
+        self.store.claim(job.id)
+        self.store.mark_succeeded(job.id, result)
+        self._publish_status(job.id)
+        return self.store.get(job.id)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, or None if it does not exist."""
+        return self.store.get(job_id)
+
+    def _publish_status(self, job_id: str, job: Optional[Job] = None) -> None:
+        job = job or self.store.get(job_id)
+        self.bus.publish(job.id, "status", job.to_dict())
+        if job.done:
+            self.bus.close(job.id)
+
+    @property
+    def queued(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._pending.qsize()
+
+    def _work(self, pending: "queue.Queue[Optional[str]]") -> None:
+        while True:
+            job_id = pending.get()
+            if job_id is None:
+                return
+            if not self.store.claim(job_id):
+                continue
+            job = self.store.get(job_id)
+            self._publish_status(job_id, job)
+            with self._lock:
+                for follower in self._followers.get(job_id, []):
+                    if self.store.claim(follower):
+                        self._publish_status(follower)
+            self._execute(job)
+
+    def _execute(self, job: Job) -> None:
+        logger.info(f"Job {job.id} ({job.kind}) started")
+        error = result = None
+        try:
+            result = self.runner(job)
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            error = str(e)
+        with self._lock:
+            # Jobs submitted from now on start a new run
+            key = self._keys.pop(job.id, None)
+            if key is not None and self._leaders.get(key) == job.id:
+                del self._leaders[key]
+            followers = self._followers.pop(job.id, [])
+        for job_id in [job.id] + followers:
+            if error is None:
+                self.store.mark_succeeded(job_id, result)
+            else:
+                self.store.mark_failed(job_id, error)
+            self._publish_status(job_id)
+        if error is None:
+            logger.info(f"Job {job.id} succeeded")
+
+    def shutdown(self) -> None:
+        """Stop the workers once their current job ends; queued jobs stay stored."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+            pending = self._pending
+            # Queued jobs stay queued in the store and are picked up by `start`
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in workers:
+                pending.put(None)
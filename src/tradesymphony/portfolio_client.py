@@ -0,0 +1,252 @@
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+from .utils.cache_paths import atomic_write, get_cache_dir
+from .utils.http_clients import get_http_clients
+from .utils.logger import get_logger
+
+logger = get_logger()
+
+# External API endpoint to fetch portfolio data
+PORTFOLIO_API_URL = "https://tradesymphony-client-app.vercel.app/api/trades"
+
+# Upstream answers worth retrying; other HTTP errors fail at once
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class PortfolioFetchError(RuntimeError):
+    """Raised when the portfolio API could not provide a portfolio."""
+
+
+class PortfolioClient:
+    """
+    Fetches the portfolio from the client app with a stale-while-revalidate cache.
+
+    Requests go through the shared aiohttp session of the HTTP client
+    registry, so connections to the upstream are reused across fetches and
+    retries. Failed attempts are retried with exponential backoff and full
+    jitter.
+
+    The last good payload is kept in memory and on disk. Within
+    `fresh_seconds` it is served as is; after that it is still served at
+    once while a single background fetch refreshes it, so an analysis never
+    waits on a slow upstream once any portfolio has been fetched. Only the
+    very first fetch, with nothing cached, is awaited.
+
+    Attributes:
+        url (str): Portfolio API endpoint
+        max_attempts (int): Attempts per fetch
+        base_delay (float): Backoff before the second attempt, in seconds
+        max_delay (float): Upper bound of a single backoff, in seconds
+        timeout (float): Total timeout of one attempt, in seconds
+        fresh_seconds (float): Age up to which the cached payload is fresh
+        cache_path (Path): File holding the last good payload
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        timeout: Optional[float] = None,
+        fresh_seconds: Optional[float] = None,
+        cache_path: Optional[Path] = None,
+    ):
+        """
+        Initialise the client; the cached payload is loaded on first use.
+
+        Args:
+            url (str, optional): Defaults to ``PORTFOLIO_API_URL``.
+            max_attempts (int, optional): Defaults to
+                ``PORTFOLIO_FETCH_ATTEMPTS`` or 3.
+            base_delay (float, optional): Defaults to
+                ``PORTFOLIO_RETRY_BASE_DELAY`` or 0.5.
+            max_delay (float, optional): Defaults to
+                ``PORTFOLIO_RETRY_MAX_DELAY`` or 8.
+            timeout (float, optional): Defaults to ``PORTFOLIO_FETCH_TIMEOUT``
+                or 30.
+            fresh_seconds (float, optional): Defaults to
+                ``PORTFOLIO_FRESH_SECONDS`` or 300.
+            cache_path (Path, optional): Defaults to
+                ``<CACHE_PATH>/portfolio/last_portfolio.json``.
+        """
+        self.url = url or os.getenv("PORTFOLIO_API_URL", PORTFOLIO_API_URL)
+        self.max_attempts = max_attempts or int(
+            os.getenv("PORTFOLIO_FETCH_ATTEMPTS", "3")
+        )
+        self.base_delay = base_delay or float(
+            os.getenv("PORTFOLIO_RETRY_BASE_DELAY", "0.5")
+        )
+        self.max_delay = max_delay or float(os.getenv("PORTFOLIO_RETRY_MAX_DELAY", "8"))
+        self.timeout = timeout or float(os.getenv("PORTFOLIO_FETCH_TIMEOUT", "30"))
+        self.fresh_seconds = (
+            fresh_seconds
+            if fresh_seconds is not None
+            else float(os.getenv("PORTFOLIO_FRESH_SECONDS", "300"))
+        )
+        self.cache_path = (
+            Path(cache_path)
+            if cache_path
+            else get_cache_dir("portfolio") / "last_portfolio.json"
+        )
+        self._lock = threading.Lock()
+        self._entry: Optional[Tuple[Dict[str, Any], float]] = None
+        self._loaded = False
+        self._pending: Optional["Future[Dict[str, Any]]"] = None
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Return the wait before retrying after `attempt` failed attempts.
+
+        Args:
+            attempt (int): Number of failed attempts so far, starting at 1
+
+        Returns:
+            float: Random delay between 0 and the capped exponential backoff
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def cached(self) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Return the last good payload and its fetch time, if any.
+
+        Returns:
+            Tuple[Dict[str, Any], float] or None: Payload and epoch seconds
+        """
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                try:
+                    stored = json.loads(self.cache_path.read_text())
+                    self._entry = (stored["payload"], stored["fetched_at"])
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable portfolio cache: {e}")
+            return self._entry
+
+    def _store(self, payload: Dict[str, Any]) -> None:
+        entry = (payload, time.time())
+        with self._lock:
+            self._entry = entry
+            self._loaded = True
+        try:
+            text = json.dumps({"payload": payload, "fetched_at": entry[1]})
+            atomic_write(self.cache_path, lambda tmp: tmp.write_text(text))
+        except Exception as e:
+            logger.warning(f"Could not persist the portfolio cache: {e}")
+
+    async def _fetch(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        last_error: Any = None
+        for attempt in range(1, self.max_attempts + 1):
+            if attempt > 1:
+                delay = self.backoff_delay(attempt - 1)
+                logger.info(
+                    f"Retrying portfolio fetch in {delay:.1f}s "
+                    f"(attempt {attempt}/{self.max_attempts})"
+                )
+                await asyncio.sleep(delay)
+            try:
+                async with session.get(
+                    self.url, timeout=aiohttp.ClientTimeout(total=self.timeout)
+                ) as response:
+                    if response.status in RETRY_STATUSES:
+                        last_error = f"HTTP {response.status}"
+                        logger.warning(f"Portfolio API answered {last_error}")
+                        continue
+                    if response.status >= 400:
+                        text = await response.text()
+                        raise PortfolioFetchError(
+                            f"Error response from portfolio API: "
+                            f"{response.status} - {text[:200]}"
+                        )
+                    data = await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = repr(e)
+                logger.warning(f"Network error while fetching portfolio data: {e!r}")
+                continue
+            except ValueError as e:
+                # A 200 with a body that is not JSON, e.g. a maintenance page
+                last_error = f"invalid JSON body ({e})"
+                logger.warning(f"Portfolio API answered with an {last_error}")
+                continue
+
+            # If the API returns a list, wrap it in a dictionary
+            if isinstance(data, list):
+                data = {"portfolio_items": data}
+            if not isinstance(data, dict):
+                last_error = f"unexpected payload of type {type(data).__name__}"
+                logger.warning(f"Portfolio API answered with an {last_error}")
+                continue
+            self._store(data)
+            logger.info("Successfully fetched portfolio data")
+            return data
+
+        raise PortfolioFetchError(
+            f"Portfolio API unavailable after {self.max_attempts} attempts: "
+            f"{last_error}"
+        )
+
+    def revalidate(self) -> "Future[Dict[str, Any]]":
+        """
+        Start a background fetch unless one is already running.
+
+        Safe to call from any thread or event loop; the fetch runs on the
+        I/O loop of the HTTP client registry.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the fetched payload
+        """
+        with self._lock:
+            if self._pending is None or self._pending.done():
+                self._pending = get_http_clients().submit(self._fetch)
+                self._pending.add_done_callback(self._log_failure)
+            return self._pending
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Portfolio refresh failed: {future.exception()}")
+
+    async def get(self) -> Dict[str, Any]:
+        """
+        Return the portfolio, from the cache whenever one has been fetched.
+
+        Returns:
+            Dict[str, Any]: Portfolio payload
+
+        Raises:
+            PortfolioFetchError: If nothing is cached and the fetch failed
+        """
+        entry = self.cached()
+        if entry is not None and time.time() - entry[1] <= self.fresh_seconds:
+            return entry[0]
+
+        pending = self.revalidate()
+        if entry is not None:
+            logger.info("Serving cached portfolio while it is refreshed")
+            return entry[0]
+        return await asyncio.wrap_future(pending)
+
+
+@lru_cache(maxsize=1)
+def get_portfolio_client() -> PortfolioClient:
+    """
+    Return the process-wide portfolio client.
+
+    Returns:
+        PortfolioClient: Shared client used by the API
+    """
+    return PortfolioClient()
@@ -0,0 +1,202 @@
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional
+
+from crewai import Crew
+
+from .utils.event_bus import EventBus, get_event_bus
+from .utils.logger import get_logger
+
+logger = get_logger()
+
+# Longest agent thought or tool result included in a step event
+MAX_STEP_TEXT = 2000
+
+# Progress reporters of the running crews, keyed by id() of their tasks and agents
+_active: Dict[int, "AnalysisProgress"] = {}
+_active_lock = threading.Lock()
+
+
+def _truncate(value: Any, limit: int = MAX_STEP_TEXT) -> Optional[str]:
+    if value is None:
+        return None
+    text = value if isinstance(value, str) else str(value)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _model_dump(value: Any) -> Any:
+    return value.model_dump() if hasattr(value, "model_dump") else value
+
+
+class AnalysisProgress:
+    """
+    Publishes the progress of one crew run as events on the event bus.
+
+    The crew template is shared, so its own ``log_task_completion`` callback
+    cannot tell runs apart. `attach` binds this reporter to one crew copy
+    instead: its ``task_callback`` and ``step_callback`` (which crewai calls
+    next to the task callbacks) publish on `topic`, and crewai's event bus
+    feeds task starts and timed tool calls for the tasks and agents of that
+    copy.
+
+    Events:
+        task_started: ``task``, ``agent``
+        task_completed: ``task``, ``agent``, ``output`` and ``structured``
+            (the pydantic or JSON output, if any) of a finished task
+        step: ``tool``, ``tool_input``, ``thought`` and ``result`` of an
+            agent reasoning step
+        tool_call: ``tool``, ``agent``, ``duration_seconds``, ``from_cache``
+            and ``error`` of a finished tool call
+
+    Attributes:
+        topic (str): Topic the events are published on (the job id)
+        bus (EventBus): Bus receiving the events
+    """
+
+    def __init__(self, topic: str, bus: Optional[EventBus] = None):
+        self.topic = topic
+        self.bus = bus or get_event_bus()
+
+    def _publish(self, type: str, data: Dict[str, Any]) -> None:
+        try:
+            self.bus.publish(self.topic, type, data)
+        except Exception as e:
+            # Progress reporting must never fail the analysis itself
+            logger.error(f"Could not publish {type} event: {e}")
+
+    @contextmanager
+    def attach(self, crew: Crew) -> Iterator["AnalysisProgress"]:
+        """
+        Report the progress of `crew` while the block runs.
+
+        Args:
+            crew (Crew): Crew copy used for a single kickoff
+        """
+        _register_crewai_listeners()
+        crew.task_callback = self.task_completed
+        crew.step_callback = self.step
+        keys = [id(task) for task in crew.tasks] + [id(agent) for agent in crew.agents]
+        with _active_lock:
+            for key in keys:
+                _active[key] = self
+        try:
+            yield self
+        finally:
+            with _active_lock:
+                for key in keys:
+                    _active.pop(key, None)
+
+    def task_started(self, task: Any) -> None:
+        agent = getattr(task, "agent", None)
+        self._publish(
+            "task_started",
+            {
+                "task": getattr(task, "name", None),
+                "agent": getattr(agent, "role", None),
+            },
+        )
+
+    def task_completed(self, task_output: Any) -> None:
+        structured = getattr(task_output, "pydantic", None) or getattr(
+            task_output, "json_dict", None
+        )
+        self._publish(
+            "task_completed",
+            {
+                "task": getattr(task_output, "name", None),
+                "agent": getattr(task_output, "agent", None),
+                "output": getattr(task_output, "raw", None),
+                "structured": _model_dump(structured),
+            },
+        )
+
+    def step(self, step_output: Any) -> None:
+        if isinstance(step_output, dict):
+            get = step_output.get
+        else:
+
+            def get(name):
+                return getattr(step_output, name, None)
+
+        self._publish(
+            "step",
+            {
+                "tool": get("tool"),
+                "tool_input": _truncate(get("tool_input")),
+                "thought": _truncate(get("thought") or get("text")),
+                "result": _truncate(get("result") or get("output")),
+            },
+        )
+
+    def tool_finished(self, event: Any, error: Any = None) -> None:
+        started_at = getattr(event, "started_at", None)
+        finished_at = getattr(event, "finished_at", None)
+        duration = None
+        if started_at is not None and finished_at is not None:
+            duration = (finished_at - started_at).total_seconds()
+        self._publish(
+            "tool_call",
+            {
+                "tool": getattr(event, "tool_name", None),
+                "agent": getattr(event, "agent_role", None),
+                "duration_seconds": duration,
+                "from_cache": getattr(event, "from_cache", None),
+                "error": _truncate(error) if error is not None else None,
+            },
+        )
+
+
+def _progress_for(source: Any) -> Optional[AnalysisProgress]:
+    """Find the reporter of the crew a task, agent or tool usage belongs to."""
+    candidates = (
+        source,
+        getattr(source, "task", None),
+        getattr(source, "agent", None),
+    )
+    with _active_lock:
+        for candidate in candidates:
+            if candidate is not None and id(candidate) in _active:
+                return _active[id(candidate)]
+    return None
+
+
+@lru_cache(maxsize=1)
+def _register_crewai_listeners() -> bool:
+    """
+    Subscribe once to crewai's task start and tool usage events.
+
+    Returns:
+        bool: False if this crewai version has no event bus, in which case
+            only task completions and steps are reported
+    """
+    try:
+        from crewai.utilities.events import (
+            TaskStartedEvent,
+            ToolUsageErrorEvent,
+            ToolUsageFinishedEvent,
+            crewai_event_bus,
+        )
+    except ImportError:
+        logger.warning("crewai has no event bus; task start and tool events are off")
+        return False
+
+    @crewai_event_bus.on(TaskStartedEvent)
+    def on_task_started(source, event):
+        progress = _progress_for(source)
+        if progress is not None:
+            progress.task_started(source)
+
+    @crewai_event_bus.on(ToolUsageFinishedEvent)
+    def on_tool_finished(source, event):
+        progress = _progress_for(source)
+        if progress is not None:
+            progress.tool_finished(event)
+
+    @crewai_event_bus.on(ToolUsageErrorEvent)
+    def on_tool_error(source, event):
+        progress = _progress_for(source)
+        if progress is not None:
+            progress.tool_finished(event, error=getattr(event, "error", None))
+
+    return True
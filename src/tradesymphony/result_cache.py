@@ -0,0 +1,244 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .utils.api_fetch import SingleFlight
+from .utils.cache_paths import get_cache_dir
+from .utils.logger import get_logger
+
+logger = get_logger()
+
+CONFIG_DIR = Path(__file__).parent / "config"
+CONFIG_FILES = ("agents.yaml", "tasks.yaml")
+
+
+def canonical_json(value: Any) -> str:
+    """Serialise a value so equal inputs always give identical text."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def config_fingerprint(config_dir: Path = CONFIG_DIR) -> str:
+    """
+    Return a hash of the agent and task YAML configuration.
+
+    Args:
+        config_dir (Path): Directory holding agents.yaml and tasks.yaml
+
+    Returns:
+        str: SHA-256 hex digest; changes whenever either file changes
+    """
+    digest = hashlib.sha256()
+    for name in CONFIG_FILES:
+        path = config_dir / name
+        digest.update(name.encode())
+        digest.update(path.read_bytes() if path.exists() else b"")
+    return digest.hexdigest()
+
+
+def market_data_bucket(
+    now: Optional[float] = None, hours: Optional[float] = None
+) -> str:
+    """
+    Return the market-data period a moment falls into.
+
+    Analyses run in the same period see the same market data, so they may
+    share a cached result; a new period forces a fresh run.
+
+    Args:
+        now (float, optional): Epoch seconds. Defaults to the current time.
+        hours (float, optional): Length of a period. Defaults to
+            ``ANALYSIS_CACHE_BUCKET_HOURS`` or 24 (one UTC day).
+
+    Returns:
+        str: UTC start of the period in ISO format
+    """
+    now = time.time() if now is None else now
+    hours = hours or float(os.getenv("ANALYSIS_CACHE_BUCKET_HOURS", "24"))
+    size = hours * 3600
+    start = time.gmtime(now // size * size)
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", start)
+
+
+def analysis_cache_key(
+    portfolio: Any,
+    model: Optional[str] = None,
+    config_dir: Path = CONFIG_DIR,
+    now: Optional[float] = None,
+) -> str:
+    """
+    Return the content address of an analysis.
+
+    Args:
+        portfolio (Any): Portfolio input of the crew
+        model (str, optional): LLM the agents run on. Defaults to ``MODEL``
+            or "gpt-4o-mini", as used by the crew.
+        config_dir (Path): Directory of the agent and task configuration
+        now (float, optional): Moment used for the market-data period
+
+    Returns:
+        str: SHA-256 hex digest of the canonical inputs
+    """
+    identity: Dict[str, Any] = {
+        "portfolio": portfolio,
+        "model": model or os.getenv("MODEL", "gpt-4o-mini"),
+        "config": config_fingerprint(config_dir),
+        "market_data": market_data_bucket(now),
+    }
+    return hashlib.sha256(canonical_json(identity).encode()).hexdigest()
+
+
+class AnalysisResultCache:
+    """
+    Results of finished analyses, keyed by `analysis_cache_key`.
+
+    Entries expire `ttl` seconds after they were stored, and once more than
+    `max_entries` are held the least recently used ones are evicted. The
+    table lives in SQLite so results survive restarts. Identical analyses
+    requested while one is already running wait for that run instead of
+    starting another crew.
+
+    Attributes:
+        db_path (Path): Location of the SQLite database
+        ttl (float): Seconds a result may be served
+        max_entries (int): Results kept before evicting
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initialise the cache and create the table if needed.
+
+        Args:
+            db_path (Path, optional): SQLite file. Defaults to
+                ``ANALYSIS_CACHE_PATH`` or ``<CACHE_PATH>/analysis/results.db``.
+            ttl (float, optional): Defaults to ``ANALYSIS_CACHE_TTL`` or 3600.
+            max_entries (int, optional): Defaults to
+                ``ANALYSIS_CACHE_MAX_ENTRIES`` or 256.
+        """
+        if db_path is None and os.getenv("ANALYSIS_CACHE_PATH"):
+            db_path = os.getenv("ANALYSIS_CACHE_PATH")
+        self.db_path = (
+            Path(db_path) if db_path else get_cache_dir("analysis") / "results.db"
+        )
+        self.ttl = (
+            ttl if ttl is not None else float(os.getenv("ANALYSIS_CACHE_TTL", "3600"))
+        )
+        self.max_entries = max_entries or int(
+            os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "256")
+        )
+        self._flight = SingleFlight()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    used_at REAL NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return a stored result that has not expired.
+
+        Args:
+            key (str): Cache key of the analysis
+
+        Returns:
+            Any: The result, or None if there is none or it has expired
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT result, created_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE results SET used_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def put(self, key: str, result: Any) -> None:
+        """
+        Store a result, evicting the least recently used ones beyond capacity.
+
+        Args:
+            key (str): Cache key of the analysis
+            result (Any): JSON-serialisable result
+        """
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, result, created_at, used_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(result, default=str), now, now),
+                )
+                conn.execute(
+                    "DELETE FROM results WHERE created_at < ? OR key NOT IN "
+                    "(SELECT key FROM results ORDER BY used_at DESC LIMIT ?)",
+                    (now - self.ttl, self.max_entries),
+                )
+        except Exception as e:
+            logger.warning(f"Could not store analysis result {key}: {e}")
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the stored result for `key`, running `compute` only on a miss.
+
+        Concurrent calls with the same key share one execution of `compute`.
+        Failures are not cached.
+
+        Args:
+            key (str): Cache key of the analysis
+            compute (Callable[[], Any]): Runs the analysis
+
+        Returns:
+            Any: Cached or freshly computed result
+        """
+        result = self.get(key)
+        if result is not None:
+            logger.info(f"Serving cached analysis {key[:12]}")
+            return result
+        return self._flight.do(key, self._compute, key, compute)
+
+    def _compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        # Another run may have stored the result since the first lookup
+        result = self.get(key)
+        if result is not None:
+            return result
+        result = compute()
+        self.put(key, result)
+        return result
+
+    def clear(self) -> None:
+        """Drop every stored result."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
+
+
+@lru_cache(maxsize=1)
+def get_analysis_cache() -> AnalysisResultCache:
+    """
+    Return the process-wide analysis result cache.
+
+    Returns:
+        AnalysisResultCache: Shared cache used by the API
+    """
+    return AnalysisResultCache()
@@ -19,6 +19,8 @@ from .default_tools import (
     get_firecrawl_scrape_website_tool,
 )
 from .stock_symbol_fetcher_tool import StockSymbolFetcherTool
+from .base import AsyncBaseTool
+from .registry import ToolRegistry, get_tool_registry, shared_tools
 
 __all__ = [
     "BrowserBasedResearchTool",
@@ -40,4 +42,8 @@ __all__ = [
     "get_firecrawl_crawl_website_tool",
     "get_firecrawl_scrape_website_tool",
     "StockSymbolFetcherTool",
+    "AsyncBaseTool",
+    "ToolRegistry",
+    "get_tool_registry",
+    "shared_tools",
 ]
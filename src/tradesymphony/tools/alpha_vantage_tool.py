@@ -1,13 +1,13 @@
-from ..utils import get_alpha_vantage_data, get_logger
-from crewai.tools import BaseTool
+from ..utils import (
+    get_alpha_vantage_client,
+    get_logger,
+    parse_time_series_payload,
+)
 from typing import Type, Dict, Any, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
 from dotenv import load_dotenv
-import os
-import asyncio
-import aiohttp
-import pandas as pd
+from .base import AsyncBaseTool
 
 
 load_dotenv()
@@ -26,8 +26,8 @@ class AlphaVantageInput(BaseModel):
         function (str): Alpha Vantage API function to call (e.g., TIME_SERIES_DAILY)
         interval (str, optional): Time interval for intraday data. Defaults to "5min".
             Valid values: 1min, 5min, 15min, 30min, 60min
-        output_format (str, optional): Desired output format. Defaults to "dict".
-            Valid values: "dict" or "pandas"
+        output_format (str, optional): Desired output format. Defaults to "columns".
+            Valid values: "columns", "dict" or "pandas"
     """
 
     ticker: str = Field(..., description="Stock ticker symbol")
@@ -40,17 +40,20 @@ class AlphaVantageInput(BaseModel):
         description="Data interval for intraday data (1min, 5min, 15min, 30min, 60min)",
     )
     output_format: Optional[str] = Field(
-        "dict", description="Output format: 'dict' or 'pandas'"
+        "columns",
+        description="Output format: 'columns' (one list per field, most compact), "
+        "'dict' (one record per timestamp) or 'pandas'",
     )
 
 
-class AlphaVantageTool(BaseTool):
+class AlphaVantageTool(AsyncBaseTool):
     """
     Tool for retrieving financial data from Alpha Vantage API.
 
     This tool enables fetching various types of financial data including time series data,
-    technical indicators, fundamental analysis, and more. The tool uses asynchronous
-    API calls to efficiently retrieve data.
+    technical indicators, fundamental analysis, and more. Responses are served from
+    a persistent cache; stale entries are returned immediately and refreshed in the
+    background, so only the first call for a request spends API quota up front.
 
     Attributes:
         name (str): Name of the tool
@@ -69,25 +72,26 @@ class AlphaVantageTool(BaseTool):
     args_schema: Type[BaseModel] = AlphaVantageInput
 
     # @traceable
-    def _run(
+    async def _arun(
         self,
         ticker: str,
         function: str,
         interval: Optional[str] = "5min",
-        output_format: Optional[str] = "dict",
+        output_format: Optional[str] = "columns",
     ) -> Dict[str, Any]:
         """
         Execute the Alpha Vantage API request and process the response.
 
-        This method makes an asynchronous request to the Alpha Vantage API
-        and formats the response according to the specified output format.
+        This method reads the response from the Alpha Vantage client, which
+        answers from its cache when it can, and formats it according to the
+        specified output format.
 
         Args:
             ticker (str): Stock ticker symbol to fetch data for
             function (str): Alpha Vantage API function to call
             interval (str, optional): Data interval for intraday data. Defaults to "5min".
-            output_format (str, optional): Desired output format. Defaults to "dict".
-                Options: "dict" or "pandas"
+            output_format (str, optional): Desired output format. Defaults to "columns".
+                Options: "columns", "dict" or "pandas"
 
         Returns:
             Dict[str, Any] or pd.DataFrame:
@@ -95,9 +99,12 @@ class AlphaVantageTool(BaseTool):
                 Otherwise, returns a dictionary with:
                 - ticker: The requested ticker symbol
                 - function: The requested function
-                - data: The actual data (as dictionary)
+                - data: The actual data. Time series are oldest bar first, either
+                  as {"timestamp": [...], "Open": [...], ...} ("columns") or as
+                  {timestamp: {"Open": ..., ...}} ("dict")
                 - metadata: Additional information about the data (for DataFrame responses)
                 - timestamp: ISO-formatted timestamp of when the data was retrieved
+                - stale: True if the data is past its TTL and being refreshed
 
                 In case of an error:
                 - ticker: The requested ticker symbol
@@ -109,51 +116,38 @@ class AlphaVantageTool(BaseTool):
             No exceptions are raised directly as they're caught and returned as error responses.
         """
 
-        # Get API key from environment or use a default one
-        api_key = os.getenv("ALPHA_VANTAGE_KEY", None)
-
-        # Create async function to call get_alphavantage_data
-        async def fetch_data() -> pd.DataFrame | dict:
-            async with aiohttp.ClientSession() as session:
-                return await get_alpha_vantage_data(
-                    ticker, api_key, session, function, interval
-                )
-
-        # Run async function in event loop
+        # Cached responses come back immediately; misses wait for the quota
         try:
-            # Get or create event loop
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            # Run the async function
-            result = loop.run_until_complete(fetch_data())
+            response = await get_alpha_vantage_client().aget(function, ticker, interval)
+            series = parse_time_series_payload(response.payload)
+            fetched_at = datetime.fromtimestamp(response.fetched_at).isoformat()
 
-            # Convert result based on output_format preference
-            if isinstance(result, pd.DataFrame):
-                if output_format.lower() == "pandas":
-                    return result
-                else:  # Convert to dict for JSON serialization
-                    return {
-                        "ticker": ticker,
-                        "function": function,
-                        "data": result.to_dict(orient="index"),
-                        "metadata": {
-                            "shape": result.shape,
-                            "columns": list(result.columns),
-                            "timestamp": datetime.now().isoformat(),
-                        },
-                    }
-            else:
+            if series is None:
                 return {
                     "ticker": ticker,
                     "function": function,
-                    "data": result,
-                    "timestamp": datetime.now().isoformat(),
+                    "data": response.payload,
+                    "timestamp": fetched_at,
+                    "stale": response.stale,
                 }
 
+            # Convert result based on output_format preference
+            output_format = (output_format or "columns").lower()
+            if output_format == "pandas":
+                return series.to_frame()
+            data = series.to_dict() if output_format == "dict" else series.to_compact()
+            return {
+                "ticker": ticker,
+                "function": function,
+                "data": data,
+                "metadata": {
+                    "shape": (len(series), len(series.columns)),
+                    "columns": list(series.columns),
+                    "timestamp": fetched_at,
+                    "stale": response.stale,
+                },
+            }
+
         except Exception as e:
             logger.error(f"Failed to fetch data from Alpha Vantage: {e}")
             return {
@@ -162,6 +156,3 @@ class AlphaVantageTool(BaseTool):
                 "error": str(e),
                 "message": "Failed to fetch data from Alpha Vantage API",
             }
-
-    async def _arun(self, *args, **kwargs):
-        return await asyncio.to_thread(self._run, *args, **kwargs)
@@ -0,0 +1,35 @@
+from abc import abstractmethod
+from typing import Any
+
+from crewai.tools import BaseTool
+
+from ..utils import get_http_clients
+
+
+class AsyncBaseTool(BaseTool):
+    """
+    Base class for tools whose implementation is a coroutine.
+
+    Subclasses implement ``_arun``; ``_run`` is a thin wrapper that runs it
+    on the process-wide I/O loop of the HTTP client registry and waits for
+    the result. Async agents await ``_arun`` directly, so neither path
+    creates an event loop or a thread pool per call: network I/O shares the
+    pooled clients of that loop, and blocking library calls should go
+    through ``asyncio.to_thread`` (the loop's shared default executor).
+
+    CPU-bound tools gain nothing from this and keep subclassing ``BaseTool``
+    with ``_arun`` delegating to ``asyncio.to_thread``.
+    """
+
+    @abstractmethod
+    async def _arun(self, *args: Any, **kwargs: Any) -> Any:
+        """Run the tool on the running event loop."""
+
+    def _run(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run ``_arun`` on the shared I/O loop and wait for it.
+
+        Returns:
+            Any: Whatever ``_arun`` returns
+        """
+        return get_http_clients().run_coroutine(self._arun(*args, **kwargs))
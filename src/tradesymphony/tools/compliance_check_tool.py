@@ -1,10 +1,21 @@
 from crewai.tools import BaseTool
-import yfinance as yf
 import json
 from typing import List, Type
 from datetime import datetime
 from pydantic import BaseModel, Field
 import asyncio
+from ..utils import get_ticker_info, is_rate_limited
+
+
+# Info fields read by this tool; they decide how long a cached payload is used
+INFO_FIELDS = [
+    "regularMarketPrice",
+    "marketCap",
+    "averageDailyVolume10Day",
+    "sector",
+    "industry",
+    "esgScores",
+]
 
 
 class ComplianceCheckInput(BaseModel):
@@ -52,8 +63,7 @@ class ComplianceCheckTool(BaseTool):
 
             # Get stock information for compliance checks
             try:
-                stock_info = yf.Ticker(ticker)
-                info = stock_info.info
+                info = get_ticker_info(ticker, fields=INFO_FIELDS)
                 if not info or "regularMarketPrice" not in info:
                     return f"Could not retrieve information for ticker {ticker}."
 
@@ -148,6 +158,8 @@ class ComplianceCheckTool(BaseTool):
                 return json.dumps(compliance_result, indent=2)
 
             except Exception as e:
+                if is_rate_limited(e):
+                    return f"Yahoo Finance is rate limiting requests; retry the compliance check for {ticker} later."
                 return f"Error while performing compliance check for {ticker}: {str(e)}"
 
         except Exception as e:
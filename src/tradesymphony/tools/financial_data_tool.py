@@ -5,6 +5,28 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Type
 import asyncio
+from ..utils import get_ticker_history, get_ticker_info, is_rate_limited
+
+
+# Info fields read by this tool; they decide how long a cached payload is used
+INFO_FIELDS = [
+    "longName",
+    "longBusinessSummary",
+    "industry",
+    "sector",
+    "marketCap",
+    "trailingPE",
+    "forwardPE",
+    "priceToSalesTrailing12Months",
+    "priceToBook",
+    "dividendYield",
+    "trailingEps",
+    "beta",
+    "fiftyTwoWeekHigh",
+    "fiftyTwoWeekLow",
+    "fiftyDayAverage",
+    "twoHundredDayAverage",
+]
 
 
 class FinancialDataInput(BaseModel):
@@ -27,7 +49,7 @@ class FinancialDataTool(BaseTool):
             stock = yf.Ticker(ticker)
 
             # First check if we can get basic history data
-            hist = stock.history(period="1d")
+            hist = get_ticker_history(ticker, period="1d")
             if hist.empty:
                 return json.dumps(
                     {
@@ -37,7 +59,7 @@ class FinancialDataTool(BaseTool):
                     indent=2,
                 )
 
-            info = stock.info
+            info = get_ticker_info(ticker, fields=INFO_FIELDS)
 
             # Check if info contains meaningful data (not just trailingPegRatio)
             if len(info) <= 1 or (len(info) == 1 and "trailingPegRatio" in info):
@@ -50,7 +72,7 @@ class FinancialDataTool(BaseTool):
                 )
 
             # Get historical data
-            hist = stock.history(period="6mo")
+            hist = get_ticker_history(ticker, period="6mo")
             recent_price = hist["Close"].iloc[-1] if not hist.empty else None
             # Get financial statements
             income_stmt = stock.income_stmt
@@ -135,6 +157,15 @@ class FinancialDataTool(BaseTool):
 
             return json.dumps(financial_data, indent=2, default=str)
         except Exception as e:
+            if is_rate_limited(e):
+                return json.dumps(
+                    {
+                        "error": True,
+                        "rate_limited": True,
+                        "message": f"Yahoo Finance is rate limiting requests; retry {ticker} later.",
+                    },
+                    indent=2,
+                )
             return f"Could not retrieve financial data for {ticker}. Error: {str(e)}"
 
     async def _arun(self, *args, **kwargs):
@@ -3,9 +3,9 @@ from typing import List, Type
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 import pandas as pd
-import yfinance as yf
 import datetime
 import asyncio
+from ..utils import download_history
 
 
 class MacroeconomicAnalysisInput(BaseModel):
@@ -44,21 +44,21 @@ class MacroeconomicAnalysisTool(BaseTool):
             if "GDP" in indicators:
                 # FRED API is better for GDP but requires API key and more setup
                 # Using a proxy with yfinance for demonstration
-                gdp_data = yf.download("GDP", start=start_date, end=end_date)
+                gdp_data = download_history("GDP", start=start_date, end=end_date)
                 if not gdp_data.empty:
                     data["GDP"] = gdp_data["Adj Close"].iloc[-1]  # Use Adj Close
                 else:
                     data["GDP"] = "Data not available"
 
             if "CPI" in indicators:
-                cpi_data = yf.download("CPIAUCSL", start=start_date, end=end_date)
+                cpi_data = download_history("CPIAUCSL", start=start_date, end=end_date)
                 if not cpi_data.empty:
                     data["CPI"] = cpi_data["Adj Close"].iloc[-1]  # Use Adj Close
                 else:
                     data["CPI"] = "Data not available"
 
             if "Unemployment" in indicators:
-                unemployment_data = yf.download(
+                unemployment_data = download_history(
                     "UNRATE", start=start_date, end=end_date
                 )
                 if not unemployment_data.empty:
@@ -70,7 +70,7 @@ class MacroeconomicAnalysisTool(BaseTool):
 
             if "InterestRates" in indicators:
                 # Example: Federal Funds Rate
-                interest_rate_data = yf.download(
+                interest_rate_data = download_history(
                     "FEDFUNDS", start=start_date, end=end_date
                 )
                 if not interest_rate_data.empty:
@@ -85,7 +85,7 @@ class MacroeconomicAnalysisTool(BaseTool):
                 try:
                     # Try a better known ETF or alternative data source
                     # Option 1: Use UMICH/SOC1 or a different reliable ticker
-                    consumer_sentiment_data = yf.download(
+                    consumer_sentiment_data = download_history(
                         "^UMICH", start=start_date, end=end_date
                     )
                     if not consumer_sentiment_data.empty:
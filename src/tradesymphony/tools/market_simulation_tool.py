@@ -1,4 +1,3 @@
-import yfinance as yf
 import json
 from typing import Type, List
 from crewai.tools import BaseTool
@@ -6,11 +5,34 @@ from datetime import datetime
 import logging
 from pydantic import BaseModel, Field
 import asyncio
+import numpy as np
+from ..utils import (
+    download_history,
+    simulate_gbm_paths,
+    bootstrap_paths,
+    summarize_paths,
+    AgentBasedMarket,
+)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Order book auctions run per simulated time step
+AUCTIONS_PER_STEP = 10
+
+# Largest paths x steps x tickers array a simulation may allocate (~160 MB)
+MAX_PATH_VALUES = 20_000_000
+
+
+def _describe_flow(flow: dict) -> str:
+    """Describe one agent type's executed volume as net buying or selling."""
+    if flow["buy_share"] is None:
+        return "no trades"
+    if flow["buy_share"] >= 0.5:
+        return f"{flow['buy_share']:.0%} buying"
+    return f"{1 - flow['buy_share']:.0%} selling"
+
 
 class MarketSimulationInput(BaseModel):
     """Input schema for Market Simulation Tool."""
@@ -30,7 +52,17 @@ class MarketSimulationInput(BaseModel):
     )
 
     time_steps: int = Field(
-        default=30, description="Number of time steps to simulate", ge=1
+        default=30, description="Number of time steps to simulate", ge=1, le=1000
+    )
+
+    num_paths: int = Field(
+        default=5000, description="Number of simulated price paths", ge=1, le=100_000
+    )
+
+    method: str = Field(
+        default="gbm",
+        description="Path model: gbm (correlated geometric Brownian motion) or "
+        "bootstrap (resampled blocks of historical returns)",
     )
 
 
@@ -43,19 +75,26 @@ class MarketSimulationTool(BaseTool):
     )
     args_schema: Type[BaseModel] = MarketSimulationInput
 
-    def _run(self, tickers, scenario, num_agents, time_steps) -> str:
+    def _run(
+        self, tickers, scenario, num_agents, time_steps, num_paths=5000, method="gbm"
+    ) -> str:
         """Run the market simulation."""
         try:
             if not tickers:
                 return "Please provide at least one ticker symbol."
+            if num_paths * (time_steps + 1) * len(tickers) > MAX_PATH_VALUES:
+                return (
+                    f"Simulating {num_paths} paths of {time_steps} steps for "
+                    f"{len(tickers)} tickers is too large; keep num_paths x "
+                    f"time_steps x tickers under {MAX_PATH_VALUES:,}."
+                )
 
-            # Get historical data for tickers
-            all_stock_data = {}
+            # Get historical data for all tickers in one request
+            closes = download_history(tickers, period="6mo")["Close"]
             for ticker in tickers:
-                stock_data = yf.download(ticker, period="6mo")
-                if stock_data.empty:
+                if ticker not in closes or closes[ticker].dropna().empty:
                     return f"Could not retrieve data for {ticker}."
-                all_stock_data[ticker] = stock_data
+            closes = closes[tickers]
 
             # Define scenario parameters
             scenario_params = {
@@ -89,65 +128,88 @@ class MarketSimulationTool(BaseTool):
             # Get scenario parameters or use baseline if not found
             params = scenario_params.get(scenario.lower(), scenario_params["baseline"])
 
+            # Simulate every ticker jointly so cross-asset correlation is kept
+            rng = np.random.default_rng(42)  # For reproducibility
+            log_returns = np.log(closes.ffill()).diff().dropna()
+            current_prices = closes.ffill().iloc[-1].values
+            drift = params["sentiment_bias"] * 0.01
+            if method.lower() == "bootstrap":
+                paths = bootstrap_paths(
+                    current_prices,
+                    log_returns.values,
+                    num_paths,
+                    time_steps,
+                    drift=drift,
+                    volatility_factor=params["volatility_factor"],
+                    rng=rng,
+                )
+            else:
+                paths = simulate_gbm_paths(
+                    current_prices,
+                    log_returns.cov().values,
+                    num_paths,
+                    time_steps,
+                    drift=drift,
+                    volatility_factor=params["volatility_factor"],
+                    rng=rng,
+                )
+            summary = summarize_paths(paths)
+            volatilities = (
+                closes.pct_change().std().values * params["volatility_factor"]
+            )
+
             # Prepare simulation results
             simulation_results = {}
-            for ticker in tickers:
-                current_price = all_stock_data[ticker]["Close"].iloc[-1]
-                volatility = (
-                    all_stock_data[ticker]["Close"].pct_change().std()
-                    * params["volatility_factor"]
+            for i, ticker in enumerate(tickers):
+                current_price = float(current_prices[i])
+                volatility = float(volatilities[i])
+                avg_final_price = float(summary["mean_final"][i])
+
+                # Agent-based order book simulation for the same scenario
+                market = AgentBasedMarket(
+                    current_price,
+                    num_agents,
+                    volatility=volatility / np.sqrt(AUCTIONS_PER_STEP),
+                    drift=drift / AUCTIONS_PER_STEP,
+                    liquidity_factor=params["liquidity_factor"],
+                    sentiment_bias=params["sentiment_bias"],
+                    seed=42 + i,
                 )
-
-                # Simulated price paths based on random walks with drift
-                import numpy as np
-
-                np.random.seed(42)  # For reproducibility
-
-                price_paths = []
-                for _ in range(5):  # Generate 5 different possible paths
-                    path = [current_price]
-                    for _ in range(time_steps):
-                        # Apply scenario parameters
-                        drift = params["sentiment_bias"] * current_price * 0.01
-                        random_shock = np.random.normal(
-                            0, volatility * current_price * 0.01
-                        )
-                        new_price = path[-1] * (1 + drift + random_shock)
-                        path.append(
-                            max(0.01, new_price)
-                        )  # Ensure price doesn't go negative
-                    price_paths.append(path)
-
-                # Calculate average final price and range
-                final_prices = [path[-1] for path in price_paths]
-                avg_final_price = sum(final_prices) / len(final_prices)
-                price_range = (min(final_prices), max(final_prices))
-
-                # Calculate probability of price movement
-                prob_increase = len(
-                    [p for p in final_prices if p > current_price]
-                ) / len(final_prices)
-
-                # Generate trader behaviors
+                microstructure = market.run(time_steps * AUCTIONS_PER_STEP).summary()
+                behavior = microstructure.pop("agent_behavior")
                 trader_behaviors = {
-                    "value_investors": f"{np.random.randint(30, 70)}% buying"
-                    if avg_final_price < current_price * 0.9
-                    else f"{np.random.randint(30, 70)}% selling",
-                    "momentum_traders": f"{np.random.randint(60, 90)}% buying"
-                    if avg_final_price > current_price
-                    else f"{np.random.randint(60, 90)}% selling",
-                    "day_traders": f"High volatility expected, {np.random.randint(1000, 5000)} trades/day",
-                    "institutional": f"Net {np.random.choice(['buying', 'selling'])} pressure detected",
+                    "value_investors": _describe_flow(behavior["value"]),
+                    "momentum_traders": _describe_flow(behavior["momentum"]),
+                    "day_traders": f"{_describe_flow(behavior['noise'])}, "
+                    f"{behavior['noise']['volume'] / time_steps:,.0f} shares/day",
+                    "institutional": f"Net {_describe_flow(behavior['institutional'])}",
                 }
+                spread = microstructure["average_spread_bps"]
 
                 simulation_results[ticker] = {
                     "current_price": current_price,
                     "avg_projected_price": avg_final_price,
-                    "price_range": price_range,
-                    "probability_increase": prob_increase,
+                    "price_range": (float(summary["p5"][i]), float(summary["p95"][i])),
+                    "price_percentiles": {
+                        "p5": float(summary["p5"][i]),
+                        "p25": float(summary["p25"][i]),
+                        "median": float(summary["median"][i]),
+                        "p75": float(summary["p75"][i]),
+                        "p95": float(summary["p95"][i]),
+                    },
+                    "probability_increase": float(summary["probability_increase"][i]),
+                    "probability_loss_10pct": float(
+                        summary["probability_loss_10pct"][i]
+                    ),
+                    "expected_max_drawdown": float(summary["expected_max_drawdown"][i]),
                     "volatility_projection": volatility * 100,  # Convert to percentage
                     "trader_behaviors": trader_behaviors,
-                    "liquidity_impact": f"{(1 - params['liquidity_factor']) * 100:.1f}% wider spreads expected",
+                    "market_microstructure": microstructure,
+                    "liquidity_impact": f"{spread:.1f} bps average spread, "
+                    f"{microstructure['kyle_lambda_bps_per_1k_shares']:.2f} bps impact "
+                    "per 1,000 shares of net order flow"
+                    if spread is not None
+                    else "No two-sided market formed in the simulation",
                     "scenario_impact": f"{params['sentiment_bias'] * 100:.1f}% scenario bias applied",
                 }
 
@@ -157,6 +219,8 @@ class MarketSimulationTool(BaseTool):
                 "scenario": scenario,
                 "num_agents": num_agents,
                 "time_steps": time_steps,
+                "num_paths": num_paths,
+                "method": method,
                 "simulation_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "simulation_results": simulation_results,
                 "scenario_parameters": params,
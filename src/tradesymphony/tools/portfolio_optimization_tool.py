@@ -1,10 +1,14 @@
 from crewai.tools import BaseTool
-import yfinance as yf
-import numpy as np
 import json
 from typing import Type
 from pydantic import BaseModel, Field
 import asyncio
+from ..utils import (
+    download_history,
+    MeanVarianceOptimizer,
+    sample_portfolios,
+    weight_bounds,
+)
 
 
 class PortfolioOptimizationInput(BaseModel):
@@ -14,11 +18,23 @@ class PortfolioOptimizationInput(BaseModel):
     )
     return_target: float = Field(None, description="Target return (optional)")
     period: str = Field("5y", description="Historical data period (e.g., 1y, 5y)")
-    constraints: dict = Field(default_factory=dict, description="Portfolio constraints")
+    constraints: dict = Field(
+        default_factory=dict,
+        description="Portfolio constraints: min_weight, max_weight, allow_short, "
+        "and bounds ({ticker: [min, max]})",
+    )
     max_weight: float = Field(
         default=1.0,
         description="Maximum weight of any single asset in the portfolio (0-1)",
     )
+    method: str = Field(
+        default="optimizer",
+        description="'optimizer' for exact solutions or 'monte_carlo' to sample "
+        "random portfolios and trace a dense efficient frontier",
+    )
+    num_portfolios: int = Field(
+        default=10000, description="Number of portfolios sampled in monte_carlo mode"
+    )
 
 
 class PortfolioOptimizationTool(BaseTool):
@@ -26,15 +42,29 @@ class PortfolioOptimizationTool(BaseTool):
     description: str = "Optimize a portfolio using Modern Portfolio Theory"
     args_schema: Type[BaseModel] = PortfolioOptimizationInput
 
-    # Keep the rest of the implementation the same
-
     def _run(
-        self, tickers, risk_preference, return_target, period, constraints, max_weight
+        self,
+        tickers,
+        risk_preference,
+        return_target,
+        period,
+        constraints,
+        max_weight,
+        method="optimizer",
+        num_portfolios=10000,
     ) -> str:
-        """Use the tool to optimize a portfolio using Modern Portfolio Theory."""
+        """
+        Use the tool to optimize a portfolio using Modern Portfolio Theory.
+
+        Portfolios are solved exactly by MeanVarianceOptimizer rather than by
+        sampling random weights, so results are deterministic and respect
+        `max_weight` and `constraints` (min_weight, max_weight, allow_short,
+        per-ticker bounds). The 'monte_carlo' method instead samples
+        `num_portfolios` random portfolios in vectorised chunks.
+        """
         try:
             # Download historical data
-            stock_data = yf.download(tickers, period=period)["Adj Close"]
+            stock_data = download_history(tickers, period=period)["Adj Close"]
             if stock_data.empty:
                 return "Could not retrieve data for the specified tickers"
 
@@ -44,76 +74,84 @@ class PortfolioOptimizationTool(BaseTool):
             # Calculate mean returns (annualized) and covariance matrix
             mean_returns = returns.mean() * 252
             cov_matrix = returns.cov() * 252
-
-            # Number of portfolios to simulate
-            num_portfolios = 10000
-
-            # Arrays to store results
-            all_weights = np.zeros((num_portfolios, len(tickers)))
-            ret_arr = np.zeros(num_portfolios)
-            vol_arr = np.zeros(num_portfolios)
-            sharpe_arr = np.zeros(num_portfolios)
+            tickers = list(stock_data.columns)
 
             # Set risk-free rate
             risk_free_rate = 0.01  # 1% as default
 
-            # Generate random portfolios
-            for i in range(num_portfolios):
-                # Generate random weights
-                weights = np.random.random(len(tickers))
-
-                # Apply max weight constraint if specified
-                if max_weight < 1.0:
-                    weights = np.minimum(weights, max_weight)
-
-                # Normalize to sum to 1
-                weights = weights / np.sum(weights)
-                all_weights[i, :] = weights
-
-                # Calculate expected return and volatility
-                ret_arr[i] = np.sum(mean_returns * weights)
-                vol_arr[i] = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
-
-                # Calculate Sharpe ratio
-                sharpe_arr[i] = (ret_arr[i] - risk_free_rate) / vol_arr[i]
+            lower, upper = weight_bounds(tickers, constraints, max_weight)
+            target = None
+            sample = None
+            if method == "monte_carlo":
+                sample = sample_portfolios(
+                    mean_returns.values,
+                    cov_matrix.values,
+                    num_portfolios,
+                    lower,
+                    upper,
+                    risk_free_rate,
+                    return_target=return_target,
+                )
+                min_volatility = sample.min_volatility
+                max_sharpe = sample.max_sharpe
+                max_return = sample.max_return
+                target = sample.target
+            else:
+                optimizer = MeanVarianceOptimizer(
+                    mean_returns.values, cov_matrix.values, lower, upper, risk_free_rate
+                )
+                min_volatility = optimizer.min_variance()
+                max_sharpe = optimizer.max_sharpe()
+                max_return = optimizer.max_return() if optimizer.bounded else None
+                if return_target:
+                    try:
+                        target = optimizer.target_return(return_target)
+                    except ValueError:
+                        target = None
 
             # Find portfolio based on risk preference
             if risk_preference == "low":
-                # Minimum volatility portfolio
-                min_vol_idx = np.argmin(vol_arr)
-                optimal_weights = all_weights[min_vol_idx, :]
-                optimal_return = ret_arr[min_vol_idx]
-                optimal_volatility = vol_arr[min_vol_idx]
-                optimal_sharpe = sharpe_arr[min_vol_idx]
+                optimal = min_volatility
                 strategy = "Minimum Volatility"
 
             elif risk_preference == "high":
-                # If return target specified, find highest return that meets target volatility
                 if return_target:
-                    eligible_idx = ret_arr >= return_target
-                    if np.sum(eligible_idx) == 0:
+                    # Lowest-volatility portfolio that meets the return target
+                    if target is None:
                         return "Return target too high for given tickers"
-                    max_return_idx = np.argmax(ret_arr[eligible_idx])
-                    max_idx = np.where(eligible_idx)[0][max_return_idx]
+                    optimal = target
+                    strategy = "Target Return"
                 else:
-                    # Otherwise just find max return
-                    max_idx = np.argmax(ret_arr)
-
-                optimal_weights = all_weights[max_idx, :]
-                optimal_return = ret_arr[max_idx]
-                optimal_volatility = vol_arr[max_idx]
-                optimal_sharpe = sharpe_arr[max_idx]
-                strategy = "Maximum Return"
+                    if max_return is None:
+                        return "Maximum return is unbounded without a weight limit"
+                    optimal = max_return
+                    strategy = "Maximum Return"
 
             else:  # medium or any other value defaults to max Sharpe ratio
-                # Maximum Sharpe ratio portfolio
-                max_sharpe_idx = np.argmax(sharpe_arr)
-                optimal_weights = all_weights[max_sharpe_idx, :]
-                optimal_return = ret_arr[max_sharpe_idx]
-                optimal_volatility = vol_arr[max_sharpe_idx]
-                optimal_sharpe = sharpe_arr[max_sharpe_idx]
+                optimal = max_sharpe
                 strategy = "Maximum Sharpe Ratio"
 
+            optimal_weights = optimal.weights
+            optimal_return = optimal.expected_return
+            optimal_volatility = optimal.volatility
+            optimal_sharpe = optimal.sharpe_ratio
+
+            efficient_frontier = {
+                "min_volatility": {
+                    "return": min_volatility.expected_return,
+                    "volatility": min_volatility.volatility,
+                },
+                "max_sharpe": {
+                    "return": max_sharpe.expected_return,
+                    "volatility": max_sharpe.volatility,
+                },
+            }
+            if max_return is not None:
+                efficient_frontier["max_return"] = {
+                    "return": max_return.expected_return,
+                    "volatility": max_return.volatility,
+                }
+
             # Create result object
             optimal_portfolio = {
                 "strategy": strategy,
@@ -126,23 +164,20 @@ class PortfolioOptimizationTool(BaseTool):
                 "expected_annual_volatility": float(optimal_volatility),
                 "sharpe_ratio": float(optimal_sharpe),
                 "period_analyzed": period,
-                "efficient_frontier": {
-                    "min_volatility": {
-                        "return": float(ret_arr[np.argmin(vol_arr)]),
-                        "volatility": float(np.min(vol_arr)),
-                    },
-                    "max_sharpe": {
-                        "return": float(ret_arr[np.argmax(sharpe_arr)]),
-                        "volatility": float(vol_arr[np.argmax(sharpe_arr)]),
-                    },
-                    "max_return": {
-                        "return": float(np.max(ret_arr)),
-                        "volatility": float(vol_arr[np.argmax(ret_arr)]),
-                    },
-                },
+                "method": method,
+                "efficient_frontier": efficient_frontier,
                 "analysis": f"Based on {risk_preference} risk preference, the {strategy} portfolio has an expected annual return of {optimal_return:.2%} with {optimal_volatility:.2%} volatility and a Sharpe ratio of {optimal_sharpe:.2f}.",
             }
 
+            if sample is not None:
+                optimal_portfolio["num_portfolios"] = sample.num_portfolios
+                optimal_portfolio["sampled_frontier"] = [
+                    {"volatility": float(vol), "return": float(ret)}
+                    for vol, ret in zip(
+                        sample.frontier_volatility, sample.frontier_return
+                    )
+                ]
+
             return json.dumps(optimal_portfolio, indent=2)
 
         except Exception as e:
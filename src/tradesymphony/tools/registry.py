@@ -0,0 +1,88 @@
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, List, TypeVar
+
+from crewai.tools import BaseTool
+
+T = TypeVar("T", bound=BaseTool)
+
+
+class ToolRegistry:
+    """
+    Process-wide tool instances, created once and shared by every agent.
+
+    Tools are keyed by the callable that builds them, which is usually the
+    tool class itself (``registry.get(YFinanceTool)``) or a factory such as
+    ``get_firecrawl_scrape_website_tool``. The first request builds the
+    instance; later requests from any agent, task or crew get the same one,
+    so clients and caches a tool holds are shared as well.
+
+    Tools registered here must not keep per-call state on the instance.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools: Dict[Callable[[], BaseTool], BaseTool] = {}
+
+    def get(self, factory: Callable[[], T]) -> T:
+        """
+        Return the shared instance built by `factory`, building it on first use.
+
+        Args:
+            factory (Callable[[], BaseTool]): Tool class or zero-argument factory
+
+        Returns:
+            BaseTool: Shared tool instance
+        """
+        tool = self._tools.get(factory)
+        if tool is None:
+            with self._lock:
+                tool = self._tools.get(factory)
+                if tool is None:
+                    tool = factory()
+                    self._tools[factory] = tool
+        return tool
+
+    def get_many(self, *factories: Callable[[], BaseTool]) -> List[BaseTool]:
+        """
+        Return the shared instances for several tools, in order.
+
+        Args:
+            *factories (Callable[[], BaseTool]): Tool classes or factories
+
+        Returns:
+            List[BaseTool]: Shared tool instances
+        """
+        return [self.get(factory) for factory in factories]
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def clear(self) -> None:
+        """Forget every instance, e.g. after configuration has changed."""
+        with self._lock:
+            self._tools.clear()
+
+
+@lru_cache(maxsize=1)
+def get_tool_registry() -> ToolRegistry:
+    """
+    Return the process-wide tool registry.
+
+    Returns:
+        ToolRegistry: Shared registry used when building crews
+    """
+    return ToolRegistry()
+
+
+def shared_tools(*factories: Callable[[], BaseTool]) -> List[BaseTool]:
+    """
+    Return shared instances of the given tools from the process-wide registry.
+
+    Args:
+        *factories (Callable[[], BaseTool]): Tool classes or factories
+
+    Returns:
+        List[BaseTool]: Shared tool instances, in the order given
+    """
+    return get_tool_registry().get_many(*factories)
@@ -1,11 +1,11 @@
 from crewai.tools import BaseTool
-import yfinance as yf
 import numpy as np
 import pandas as pd
 import json
 from typing import List, Optional, Type
 from pydantic import BaseModel, Field, root_validator
 import asyncio
+from ..utils import download_history
 
 
 class RiskAssessmentInput(BaseModel):
@@ -59,7 +59,7 @@ class RiskAssessmentTool(BaseTool):
                 ticker = ticker
                 period = period
 
-                stock_data = yf.download(ticker, period=period)
+                stock_data = download_history(ticker, period=period)
                 if stock_data.empty:
                     return f"Could not retrieve data for {ticker}"
 
@@ -88,7 +88,7 @@ class RiskAssessmentTool(BaseTool):
                 # Calculate beta if S&P 500 data is available
                 beta = None
                 try:
-                    sp500 = yf.download("^GSPC", period=period)
+                    sp500 = download_history("^GSPC", period=period)
                     sp500["Daily_Return"] = sp500["Close"].pct_change()
 
                     # Align the data
@@ -152,7 +152,7 @@ class RiskAssessmentTool(BaseTool):
                 period = period
 
                 # Download data for all tickers
-                all_data = yf.download(tickers, period=period)["Close"]
+                all_data = download_history(tickers, period=period)["Close"]
                 if all_data.empty:
                     return "Could not retrieve data for the specified tickers"
 
@@ -1,4 +1,3 @@
-import yfinance as yf
 import json
 from typing import Type
 from crewai.tools import BaseTool
@@ -6,6 +5,7 @@ from datetime import datetime
 import logging
 from pydantic import BaseModel, Field
 import asyncio
+from ..utils import download_history
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -44,7 +44,7 @@ class RlamaFinancialAnalysisTool(BaseTool):
                 return "Please provide a ticker symbol."
 
             # Get historical data using Yahoo Finance
-            stock_data = yf.download(ticker, period=timeframe)
+            stock_data = download_history(ticker, period=timeframe)
             if stock_data.empty:
                 return f"Could not retrieve data for {ticker}."
 
@@ -1,10 +1,10 @@
 from crewai.tools import BaseTool
-import yfinance as yf
 import json
-import pandas as pd
+import math
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Type
+from typing import Dict, Any, Optional, Type
 import asyncio
+from ..utils import get_fundamentals_snapshot
 
 try:
     from browserbase import BrowserBase
@@ -63,8 +63,28 @@ except ImportError:
 
 #         return result
 class StockScreenerInput(BaseModel):
-    criteria: dict = Field(..., description="Screening criteria for stocks")
-    # Add other parameters that the _run method expects
+    criteria: dict = Field(
+        default_factory=dict, description="Screening criteria for stocks"
+    )
+    expression: Optional[str] = Field(
+        None,
+        description="Boolean screening expression over fundamentals, e.g. "
+        '"marketCap > 1e10 and (trailingPE < 20 or dividendYield > 0.03) and '
+        "sector in ['Technology', 'Healthcare']\"",
+    )
+    sort_by: str = Field(
+        "marketCap",
+        description="Metric to rank the matches by, e.g. marketCap, trailingPE or dividendYield",
+    )
+    descending: bool = Field(True, description="Rank the largest values first")
+    limit: int = Field(
+        50, ge=1, le=500, description="Maximum number of matches to return"
+    )
+
+
+def _value_or_na(value: float):
+    """Return a metric as a plain float, or "N/A" when it is missing."""
+    return "N/A" if math.isnan(value) else float(value)
 
 
 class StockScreenerTool(BaseTool):
@@ -72,12 +92,24 @@ class StockScreenerTool(BaseTool):
     description: str = (
         "Useful for screening stocks based on various financial metrics. "
         "Provide criteria like market cap, P/E ratio, dividend yield, etc. "
-        "Format: {'market_cap_min': 1000000000, 'pe_ratio_max': 20, 'dividend_yield_min': 0.02}"
+        "Format: {'market_cap_min': 1000000000, 'pe_ratio_max': 20, 'dividend_yield_min': 0.02, "
+        "'sector': 'Technology'}, or a boolean expression such as "
+        '"marketCap > 1e10 and (trailingPE < 20 or dividendYield > 0.03)" '
+        "using info fields (marketCap, trailingPE, dividendYield, sector, ...). "
+        "Returns the number of matches and the top `limit` (default 50) ranked by "
+        "`sort_by` (default marketCap, largest first)."
     )
 
     args_schema: Type[BaseModel] = StockScreenerInput
 
-    def _run(self, criteria: Dict[str, Any]) -> str:
+    def _run(
+        self,
+        criteria: Optional[Dict[str, Any]] = None,
+        expression: Optional[str] = None,
+        sort_by: str = "marketCap",
+        descending: bool = True,
+        limit: int = 50,
+    ) -> str:
         """Use the tool."""
         try:
             # Parse criteria from string to dict if provided as string
@@ -87,54 +119,42 @@ class StockScreenerTool(BaseTool):
                 except json.JSONDecodeError:
                     return "Invalid criteria format. Please provide a JSON object."
 
-            # Default S&P 500 tickers
-            sp500_url = "https://raw.githubusercontent.com/datasets/s-and-p-500-companies/master/data/constituents.csv"
-            sp500 = pd.read_csv(sp500_url)
-            tickers = sp500["Symbol"].tolist()[:50]  # Limit to first 50 for performance
-
-            results = []
-
-            for ticker in tickers:
-                try:
-                    stock = yf.Ticker(ticker)
-                    info = stock.info
-
-                    # Check if stock meets criteria
-                    meets_criteria = True
-                    for key, value in criteria.items():
-                        if key.endswith("_min"):
-                            metric = key.replace("_min", "")
-                            if metric in info and info[metric] is not None:
-                                if float(info[metric]) < float(value):
-                                    meets_criteria = False
-                                    break
-                        elif key.endswith("_max"):
-                            metric = key.replace("_max", "")
-                            if metric in info and info[metric] is not None:
-                                if float(info[metric]) > float(value):
-                                    meets_criteria = False
-                                    break
-
-                    if meets_criteria:
-                        results.append(
-                            {
-                                "symbol": ticker,
-                                "name": info.get("longName", "Unknown"),
-                                "sector": info.get("sector", "Unknown"),
-                                "industry": info.get("industry", "Unknown"),
-                                "market_cap": info.get("marketCap", "N/A"),
-                                "pe_ratio": info.get("trailingPE", "N/A"),
-                                "dividend_yield": info.get("dividendYield", "N/A"),
-                            }
-                        )
-
-                except Exception:
-                    continue
+            # Screen the local snapshot of the whole universe; it is built and
+            # refreshed in the background, so an agent never waits for it
+            snapshot = get_fundamentals_snapshot()
+            if not snapshot.ensure_fresh():
+                return (
+                    "The stock screener is still warming up: the fundamentals "
+                    "snapshot of the S&P 500 and NASDAQ-100 is being built. "
+                    "Try the screen again in a few minutes."
+                )
+            matches = snapshot.query(criteria, expression, sort_by, descending)
+
+            results = [
+                {
+                    "symbol": row["symbol"],
+                    "name": row["longName"] or "Unknown",
+                    "sector": row["sector"] or "Unknown",
+                    "industry": row["industry"] or "Unknown",
+                    "market_cap": _value_or_na(row["marketCap"]),
+                    "pe_ratio": _value_or_na(row["trailingPE"]),
+                    "dividend_yield": _value_or_na(row["dividendYield"]),
+                }
+                for row in matches.head(limit).to_dict("records")
+            ]
 
             if not results:
                 return "No stocks found matching your criteria."
 
-            return json.dumps(results)
+            return json.dumps(
+                {
+                    "total_matches": len(matches),
+                    "returned": len(results),
+                    "sort_by": sort_by,
+                    "descending": descending,
+                    "results": results,
+                }
+            )
         except Exception as e:
             return f"Error performing stock screening: {str(e)}"
 
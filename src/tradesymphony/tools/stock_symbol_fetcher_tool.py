@@ -1,12 +1,8 @@
 import asyncio
 from typing import List, Dict, Any, Optional, Type
 from pydantic import BaseModel, Field, ConfigDict
-from crewai.tools import BaseTool
-from ..utils.api_fetch import (
-    get_sp500_symbols,
-    get_nasdaq100_symbols,
-    get_dow30_symbols,
-)
+from ..utils.symbol_universe import get_symbol_universe
+from .base import AsyncBaseTool
 
 
 class StockSymbolRequest(BaseModel):
@@ -23,6 +19,8 @@ class StockSymbolRequest(BaseModel):
             when source is set to 'custom'. Defaults to an empty list.
         limit (Optional[int]): Maximum number of symbols to return in the response.
             Defaults to 5.
+        as_of (Optional[str]): Date ('YYYY-MM-DD') for point-in-time index
+            constituents. Defaults to the current constituents.
     """
 
     source: str = Field(
@@ -36,19 +34,24 @@ class StockSymbolRequest(BaseModel):
     limit: Optional[int] = Field(
         default=5, description="Maximum number of symbols to return"
     )
+    as_of: Optional[str] = Field(
+        default=None,
+        description="Date (YYYY-MM-DD) to return index constituents as of, "
+        "for point-in-time universes",
+    )
 
     # Replace class Config with model_config
     model_config = ConfigDict(extra="ignore")
 
 
-class StockSymbolFetcherTool(BaseTool):
+class StockSymbolFetcherTool(AsyncBaseTool):
     """
     Tool for fetching stock symbols from various sources.
 
     This tool provides functionality to retrieve stock ticker symbols from different
     sources including S&P 500, NASDAQ-100, Dow Jones Industrial Average, or a custom list.
-    It can fetch symbols asynchronously using web scraping from Wikipedia or return
-    predefined lists.
+    Index constituents are served from a local copy that is re-checked against
+    Wikipedia once a day, so most calls make no network requests.
 
     Attributes:
         name (str): Display name of the tool
@@ -91,6 +94,7 @@ class StockSymbolFetcherTool(BaseTool):
         source: Optional[str] = "sp500",
         custom_symbols: Optional[List[str]] = [],
         limit: Optional[int] = None,
+        as_of: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Asynchronously fetch stock symbols from the specified source.
@@ -104,6 +108,8 @@ class StockSymbolFetcherTool(BaseTool):
             custom_symbols (List[str], optional): Custom list of stock symbols when source is 'custom'.
                 Defaults to [].
             limit (int, optional): Maximum number of symbols to return. Defaults to None (no limit).
+            as_of (str, optional): Date ('YYYY-MM-DD') for point-in-time constituents.
+                Defaults to None (current constituents).
 
         Returns:
             Dict[str, Any]: Dictionary containing:
@@ -113,7 +119,8 @@ class StockSymbolFetcherTool(BaseTool):
                 - limited: Boolean flag if results were limited (when applicable)
                 - details: Additional statistics (when source is 'all')
         """
-        import aiohttp
+        # Ensure custom_symbols is an empty list if it's None
+        custom_symbols = custom_symbols if custom_symbols is not None else []
 
         # Normalize source input to handle user-friendly names
         if source.lower() in ["s&p 500", "s&p500", "sp 500"]:
@@ -124,38 +131,41 @@ class StockSymbolFetcherTool(BaseTool):
             source = "dow30"
         results = {"symbols": [], "source": source}
 
-        async with aiohttp.ClientSession() as session:
-            if source == "custom" and custom_symbols:
-                results["symbols"] = custom_symbols
+        universe = get_symbol_universe()
 
-            elif source == "all":
-                sp500 = await get_sp500_symbols(session)
-                nasdaq100 = await get_nasdaq100_symbols(session)
-                dow30 = await get_dow30_symbols(session)
+        async def constituents(index: str) -> List[str]:
+            # Loads the index on first use; later calls are answered locally
+            await universe.get(index)
+            return universe.constituents(index, as_of)
 
-                # Combine all symbols (removing duplicates)
-                all_symbols = list(set(sp500 + nasdaq100 + dow30))
-                results["symbols"] = all_symbols
-                results["details"] = {
-                    "sp500_count": len(sp500),
-                    "nasdaq100_count": len(nasdaq100),
-                    "dow30_count": len(dow30),
-                    "total_unique": len(all_symbols),
-                }
+        if source == "custom" and custom_symbols:
+            results["symbols"] = custom_symbols
 
-            elif source == "sp500":
-                results["symbols"] = await get_sp500_symbols(session)
+        elif source == "all":
+            sp500, nasdaq100, dow30 = await asyncio.gather(
+                constituents("sp500"), constituents("nasdaq100"), constituents("dow30")
+            )
 
-            elif source == "nasdaq100":
-                results["symbols"] = await get_nasdaq100_symbols(session)
+            # Combine all symbols (removing duplicates)
+            all_symbols = list(dict.fromkeys(sp500 + nasdaq100 + dow30))
+            results["symbols"] = all_symbols
+            results["details"] = {
+                "sp500_count": len(sp500),
+                "nasdaq100_count": len(nasdaq100),
+                "dow30_count": len(dow30),
+                "total_unique": len(all_symbols),
+            }
 
-            elif source == "dow30":
-                results["symbols"] = await get_dow30_symbols(session)
+        elif source in ("sp500", "nasdaq100", "dow30"):
+            results["symbols"] = await constituents(source)
 
-            else:
-                # Default to a small list of major stocks
-                results["symbols"] = await self.get_default_symbols()
-                results["source"] = "default"
+        else:
+            # Default to a small list of major stocks
+            results["symbols"] = await self.get_default_symbols()
+            results["source"] = "default"
+
+        if as_of is not None and results["source"] != "custom":
+            results["as_of"] = as_of
 
         # Apply limit if specified
         if limit and len(results["symbols"]) > limit:
@@ -165,42 +175,6 @@ class StockSymbolFetcherTool(BaseTool):
         results["count"] = len(results["symbols"])
         return results
 
-    # @traceable(run_type="tool")
-    def _run(
-        self,
-        source: Optional[str] = "sp500",
-        custom_symbols: Optional[List[str]] = [],
-        limit: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """
-        Synchronous wrapper for _arun method.
-
-        Provides a synchronous interface to the asynchronous implementation by running
-        the async method in an event loop.
-
-        Args:
-            source (str, optional): Source of stock symbols ('sp500', 'nasdaq100', 'dow30', 'all', 'custom').
-                Defaults to "sp500".
-            custom_symbols (List[str], optional): Custom list of stock symbols when source is 'custom'.
-                Defaults to [].
-            limit (int, optional): Maximum number of symbols to return. Defaults to None (no limit).
-
-        Returns:
-            Dict[str, Any]: Dictionary containing stock symbols and metadata as returned by _arun.
-
-        Note:
-            This method handles None for custom_symbols by converting it to an empty list.
-        """
-        # Ensure custom_symbols is an empty list if it's None
-        custom_symbols = custom_symbols if custom_symbols is not None else []
-
-        # Use a new event loop instead of asyncio.run to avoid nested event loop issues
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(self._arun(source, custom_symbols, limit))
-        finally:
-            loop.close()
-
 
 if __name__ == "__main__":
     StockSymbolFetcherTool().run(source="S&P 500", limit=15)
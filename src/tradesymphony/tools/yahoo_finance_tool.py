@@ -1,9 +1,7 @@
-import asyncio
-from crewai.tools import BaseTool
 from typing import Type, Optional, List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor
 from pydantic import BaseModel, Field
-from ..utils import get_logger, get_yfinance_data
+from ..utils import get_logger, get_yfinance_data, is_rate_limited
+from .base import AsyncBaseTool
 
 logger = get_logger()
 
@@ -28,7 +26,7 @@ class YFinanceInput(BaseModel):
     )
 
 
-class YFinanceTool(BaseTool):
+class YFinanceTool(AsyncBaseTool):
     """
     Tool for retrieving financial data from Yahoo Finance API.
 
@@ -52,7 +50,9 @@ class YFinanceTool(BaseTool):
     args_schema: Type[BaseModel] = YFinanceInput
 
     # @traceable
-    def _run(self, ticker: str, metrics: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def _arun(
+        self, ticker: str, metrics: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
         Execute the Yahoo Finance API request and process the response.
 
@@ -84,13 +84,26 @@ class YFinanceTool(BaseTool):
 
                 In case of an error:
                 - error: Error message
+                - rate_limited: True when Yahoo Finance rejected the request
+                  with HTTP 429, so the agent can retry later
 
         Raises:
             No exceptions are raised directly as they're caught and returned as error responses.
         """
         try:
-            with ThreadPoolExecutor() as executor:
-                hist, info = asyncio.run(get_yfinance_data(ticker, executor))
+            # Runs in the shared default executor; concurrent calls for the
+            # same ticker share one download
+            try:
+                hist, info = await get_yfinance_data(ticker)
+            except Exception as e:
+                if not is_rate_limited(e):
+                    raise
+                logger.warning(f"Rate limited fetching yfinance data for {ticker}")
+                return {
+                    "error": f"Yahoo Finance is rate limiting requests; "
+                    f"retry {ticker} later",
+                    "rate_limited": True,
+                }
 
             if hist.empty or not info:
                 return {"error": f"Could not retrieve data for {ticker}"}
@@ -144,6 +157,3 @@ class YFinanceTool(BaseTool):
         except Exception as e:
             logger.error(f"Error fetching yfinance data for {ticker}: {e}")
             return {"error": f"Error fetching data for {ticker}: {e}"}
-
-    async def _arun(self, *args, **kwargs):
-        return await asyncio.to_thread(self._run, *args, **kwargs)
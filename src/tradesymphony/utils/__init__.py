@@ -12,7 +12,35 @@ from .api_fetch import (
     get_dow30_symbols,  # Returns a list of Dow Jones 30 stock symbols
     get_yfinance_data_sync,  # Synchronously retrieves data from Yahoo Finance
     get_yfinance_data,  # Asynchronously retrieves data from Yahoo Finance
+    get_ticker_info,  # Ticker.info with concurrent identical requests shared
+    get_ticker_history,  # Ticker.history with concurrent identical requests shared
+    SingleFlight,  # Collapses concurrent identical calls into one execution
+    TokenBucket,  # Token-bucket rate limiter for coroutines
+    stream_yfinance_data,  # Rate-limited concurrent fetches yielded as they finish
+    is_rate_limited,  # Detects Yahoo Finance HTTP 429 errors
     get_alpha_vantage_data,  # Retrieves financial data from Alpha Vantage API
+    parse_alpha_vantage_payload,  # Converts an Alpha Vantage payload to a DataFrame
+    AlphaVantageError,  # Raised for Alpha Vantage error and throttling responses
+)
+from .alpha_vantage_parser import (
+    TimeSeriesColumns,  # Alpha Vantage bars as typed NumPy columns
+    parse_time_series,  # Converts Alpha Vantage bars straight into NumPy columns
+    parse_time_series_payload,  # Parses the time series of a payload, if any
+)
+from .alpha_vantage_client import (
+    AlphaVantageClient,  # Cached, quota-aware Alpha Vantage requests
+    AlphaVantageQuotaExceeded,  # Raised when the daily request allowance is used
+    get_alpha_vantage_client,  # Returns the process-wide Alpha Vantage client
+)
+from .http_clients import (
+    HttpClientRegistry,  # Shared aiohttp/httpx clients with pooled connections
+    get_http_clients,  # Returns the process-wide HTTP client registry
+)
+from .event_bus import (
+    Event,  # One message published on an event bus topic
+    EventBus,  # In-process pub/sub between worker threads and the event loop
+    Subscription,  # Retained and live events of one topic for a coroutine
+    get_event_bus,  # Returns the process-wide event bus
 )
 from .telemetry_tracking import (
     initialize_event_loop,  # Initializes an event loop for asynchronous operations
@@ -21,6 +49,46 @@ from .telemetry_tracking import (
     verify_langsmith_setup,  # Verifies that LangSmith is properly configured
 )
 from .logger import get_logger  # Returns a configured logger instance
+from .price_store import (
+    PriceHistoryStore,  # On-disk OHLCV cache shared by the market data tools
+    get_price_store,  # Returns the process-wide price history store
+    download_history,  # Cached drop-in replacement for yf.download
+)
+from .fundamentals_cache import (
+    FundamentalsCache,  # Two-tier TTL cache for Ticker.info payloads
+    get_fundamentals_cache,  # Returns the process-wide fundamentals cache
+)
+from .fundamentals_snapshot import (
+    FundamentalsSnapshot,  # Columnar fundamentals table with sorted metric indexes
+    get_fundamentals_snapshot,  # Returns the process-wide fundamentals snapshot
+)
+from .screen_expression import (
+    ScreenExpression,  # Boolean screening expression compiled to NumPy masks
+    ScreenExpressionError,  # Raised for invalid screening expressions
+    compile_screen,  # Parses each distinct screening expression once
+)
+from .symbol_universe import (
+    SymbolUniverseStore,  # Local index constituents with change history
+    get_symbol_universe,  # Returns the process-wide symbol universe store
+)
+from .download_coalescer import (
+    DownloadCoalescer,  # Batches concurrent ticker downloads into one request
+    get_download_coalescer,  # Returns the process-wide download coalescer
+)
+from .portfolio_optimizer import (
+    MeanVarianceOptimizer,  # Exact min-variance/max-Sharpe/target-return solver
+    weight_bounds,  # Converts tool constraints into per-asset weight bounds
+    sample_portfolios,  # Chunked Dirichlet Monte Carlo portfolio sampler
+)
+from .market_paths import (
+    simulate_gbm_paths,  # Correlated GBM price paths for many tickers at once
+    bootstrap_paths,  # Block-bootstrapped price paths from historical returns
+    summarize_paths,  # Per-ticker percentiles and probabilities of simulated paths
+)
+from .order_book_simulator import (
+    AgentBasedMarket,  # Vectorised agent-based market with a call-auction book
+    AgentPopulation,  # Struct-of-arrays agent state
+)
 
 __all__ = [
     "fetch_html",
@@ -29,10 +97,52 @@ __all__ = [
     "get_dow30_symbols",
     "get_yfinance_data_sync",
     "get_yfinance_data",
+    "get_ticker_info",
+    "get_ticker_history",
+    "SingleFlight",
+    "TokenBucket",
+    "stream_yfinance_data",
+    "is_rate_limited",
     "get_alpha_vantage_data",
+    "parse_alpha_vantage_payload",
+    "AlphaVantageError",
+    "TimeSeriesColumns",
+    "parse_time_series",
+    "parse_time_series_payload",
+    "AlphaVantageClient",
+    "AlphaVantageQuotaExceeded",
+    "get_alpha_vantage_client",
+    "HttpClientRegistry",
+    "get_http_clients",
+    "Event",
+    "EventBus",
+    "Subscription",
+    "get_event_bus",
     "initialize_event_loop",
     "langsmith_task_callback",
     "langsmith_step_callback",
     "verify_langsmith_setup",
     "get_logger",
+    "PriceHistoryStore",
+    "get_price_store",
+    "download_history",
+    "FundamentalsCache",
+    "get_fundamentals_cache",
+    "FundamentalsSnapshot",
+    "get_fundamentals_snapshot",
+    "ScreenExpression",
+    "ScreenExpressionError",
+    "compile_screen",
+    "SymbolUniverseStore",
+    "get_symbol_universe",
+    "DownloadCoalescer",
+    "get_download_coalescer",
+    "MeanVarianceOptimizer",
+    "weight_bounds",
+    "sample_portfolios",
+    "simulate_gbm_paths",
+    "bootstrap_paths",
+    "summarize_paths",
+    "AgentBasedMarket",
+    "AgentPopulation",
 ]
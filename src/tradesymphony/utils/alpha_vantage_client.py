@@ -0,0 +1,705 @@
+import asyncio
+import concurrent.futures
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .api_fetch import (
+    ALPHA_VANTAGE_INTERVAL_FUNCTIONS,
+    AlphaVantageError,
+    alpha_vantage_params,
+    fetch_alpha_vantage_payload,
+)
+from .cache_paths import get_cache_dir
+from .http_clients import get_http_clients
+from .logger import get_logger
+
+logger = get_logger()
+
+QUOTE_TTL = 5 * 60
+INTRADAY_TTL = 15 * 60
+DAILY_TTL = 12 * 60 * 60
+PROFILE_TTL = 24 * 60 * 60
+DEFAULT_TTL = 60 * 60
+
+# Quotes go stale within minutes; statements and company profiles change at
+# most once a quarter. Functions not listed fall back to DEFAULT_TTL.
+DEFAULT_FUNCTION_TTLS: Dict[str, float] = {
+    "GLOBAL_QUOTE": QUOTE_TTL,
+    "TIME_SERIES_INTRADAY": INTRADAY_TTL,
+    "TIME_SERIES_DAILY": DAILY_TTL,
+    "TIME_SERIES_DAILY_ADJUSTED": DAILY_TTL,
+    "TIME_SERIES_WEEKLY": DAILY_TTL,
+    "TIME_SERIES_MONTHLY": DAILY_TTL,
+    "OVERVIEW": PROFILE_TTL,
+    "EARNINGS": PROFILE_TTL,
+    "INCOME_STATEMENT": PROFILE_TTL,
+    "BALANCE_SHEET": PROFILE_TTL,
+    "CASH_FLOW": PROFILE_TTL,
+}
+
+# Requests a caller is waiting on are served before background refreshes
+FOREGROUND = 0
+BACKGROUND = 10
+
+BULK_QUOTES_MAX_SYMBOLS = 100
+
+
+class AlphaVantageQuotaExceeded(AlphaVantageError):
+    """Raised when the daily request allowance of the API key is used up."""
+
+
+def request_key(function: str, symbol: str, interval: Optional[str] = None) -> str:
+    """
+    Return the cache key of a request.
+
+    The interval is only part of the key for functions that accept one, so
+    ``OVERVIEW`` for a symbol is cached once whatever interval was passed.
+
+    Args:
+        function (str): Alpha Vantage API function
+        symbol (str): Stock ticker symbol
+        interval (str, optional): Bar interval
+
+    Returns:
+        str: Key such as ``TIME_SERIES_INTRADAY:AAPL:5min``
+    """
+    function = function.upper()
+    if function not in ALPHA_VANTAGE_INTERVAL_FUNCTIONS:
+        interval = None
+    return f"{function}:{symbol.upper()}:{interval or ''}"
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _bulk_to_global_quote(row: dict) -> dict:
+    """Reshape one REALTIME_BULK_QUOTES row like a GLOBAL_QUOTE payload."""
+    return {
+        "Global Quote": {
+            "01. symbol": row.get("symbol"),
+            "02. open": row.get("open"),
+            "03. high": row.get("high"),
+            "04. low": row.get("low"),
+            "05. price": row.get("close"),
+            "06. volume": row.get("volume"),
+            "07. latest trading day": str(row.get("timestamp", ""))[:10],
+            "08. previous close": row.get("previous_close"),
+            "09. change": row.get("change"),
+            "10. change percent": row.get("change_percent"),
+        }
+    }
+
+
+class AlphaVantageResponseCache:
+    """
+    Persistent cache of Alpha Vantage payloads and of the daily request count.
+
+    Payloads are stored as JSON in SQLite keyed by function, symbol and
+    interval, so they survive restarts and are shared by every process using
+    the same cache directory. The number of requests made per UTC day is kept
+    in the same database, so a restart does not reset the daily allowance.
+
+    Attributes:
+        db_path (Path): Location of the SQLite database
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialise the cache and create the SQLite tables if needed.
+
+        Args:
+            db_path (Path, optional): SQLite file. Defaults to
+                ``<CACHE_PATH>/alpha_vantage/responses.db``.
+        """
+        self.db_path = (
+            Path(db_path)
+            if db_path
+            else get_cache_dir("alpha_vantage") / "responses.db"
+        )
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS quota (
+                    day TEXT PRIMARY KEY,
+                    used INTEGER NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def get(self, key: str) -> Optional[Tuple[dict, float]]:
+        """
+        Return a cached payload and its fetch time.
+
+        Args:
+            key (str): Key built by `request_key`
+
+        Returns:
+            Tuple[dict, float] or None: Payload and epoch seconds it was fetched
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def put(self, key: str, payload: dict, fetched_at: float) -> None:
+        """
+        Store a payload.
+
+        Args:
+            key (str): Key built by `request_key`
+            payload (dict): JSON payload returned by Alpha Vantage
+            fetched_at (float): Epoch seconds when it was fetched
+        """
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, payload, fetched_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, json.dumps(payload), fetched_at),
+                )
+        except Exception as e:
+            logger.warning(f"Could not persist Alpha Vantage response {key}: {e}")
+
+    def requests_on(self, day: str) -> int:
+        """Return how many requests were made on a UTC day ('YYYY-MM-DD')."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT used FROM quota WHERE day = ?", (day,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def record_request(self, day: str) -> int:
+        """
+        Count one request against a UTC day.
+
+        Args:
+            day (str): Day as 'YYYY-MM-DD'
+
+        Returns:
+            int: Requests made on that day, including this one
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO quota (day, used) VALUES (?, 1) "
+                "ON CONFLICT(day) DO UPDATE SET used = used + 1",
+                (day,),
+            )
+            return conn.execute(
+                "SELECT used FROM quota WHERE day = ?", (day,)
+            ).fetchone()[0]
+
+
+class QuotaScheduler:
+    """
+    Sliding-window limiter for the per-minute and per-day request allowance.
+
+    The free tier allows 5 requests per minute and 25 per day. The minute
+    window is tracked in memory; the day count lives in the response cache so
+    it is shared between processes and survives restarts.
+
+    Attributes:
+        requests_per_minute (int): Requests allowed in any 60 second window
+        requests_per_day (int): Requests allowed per UTC day
+    """
+
+    def __init__(
+        self,
+        cache: AlphaVantageResponseCache,
+        requests_per_minute: Optional[int] = None,
+        requests_per_day: Optional[int] = None,
+    ):
+        """
+        Initialise the scheduler.
+
+        Args:
+            cache (AlphaVantageResponseCache): Store for the daily request count
+            requests_per_minute (int, optional): Defaults to
+                ``ALPHA_VANTAGE_REQUESTS_PER_MINUTE`` or 5.
+            requests_per_day (int, optional): Defaults to
+                ``ALPHA_VANTAGE_REQUESTS_PER_DAY`` or 25.
+        """
+        self.cache = cache
+        self.requests_per_minute = requests_per_minute or int(
+            os.getenv("ALPHA_VANTAGE_REQUESTS_PER_MINUTE", "5")
+        )
+        self.requests_per_day = requests_per_day or int(
+            os.getenv("ALPHA_VANTAGE_REQUESTS_PER_DAY", "25")
+        )
+        self._lock = threading.Lock()
+        self._recent: deque = deque()
+        self._blocked_until = 0.0
+
+    def remaining_today(self) -> int:
+        """Return how many requests are left in today's allowance."""
+        return max(0, self.requests_per_day - self.cache.requests_on(_today()))
+
+    def acquire(self) -> float:
+        """
+        Take a request slot if one is free.
+
+        Returns:
+            float: 0 if a slot was taken, otherwise seconds until one frees up
+
+        Raises:
+            AlphaVantageQuotaExceeded: If today's allowance is used up
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            while self._recent and now - self._recent[0] >= 60:
+                self._recent.popleft()
+            if len(self._recent) >= self.requests_per_minute:
+                return 60 - (now - self._recent[0])
+            if self.remaining_today() <= 0:
+                raise AlphaVantageQuotaExceeded(
+                    f"Alpha Vantage daily limit of {self.requests_per_day} "
+                    "requests reached"
+                )
+            self._recent.append(now)
+        self.cache.record_request(_today())
+        return 0.0
+
+    def back_off(self, seconds: float = 60) -> None:
+        """Pause all requests, e.g. after Alpha Vantage reported throttling."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+@dataclass
+class AlphaVantageResponse:
+    """
+    Payload served by `AlphaVantageClient.get`.
+
+    Attributes:
+        payload (dict): JSON payload returned by Alpha Vantage
+        fetched_at (float): Epoch seconds when it was fetched
+        stale (bool): True if it is past its TTL and a refresh was queued
+    """
+
+    payload: dict
+    fetched_at: float
+    stale: bool = False
+
+
+@dataclass
+class _Request:
+    function: str
+    symbol: str
+    interval: Optional[str]
+    priority: int
+    seq: int
+    future: Future = field(default_factory=Future)
+
+
+class AlphaVantageClient:
+    """
+    Cached, quota-aware access to the Alpha Vantage API.
+
+    Every response is kept in a persistent cache. ``get`` answers from the
+    cache whenever it has an entry: fresh entries are returned as they are,
+    stale ones are returned immediately while a refresh is queued in the
+    background. Only a cache miss makes the caller wait.
+
+    Requests that do reach the network go through a single worker thread
+    that respects the per-minute and per-day limits of the API key. Queued
+    requests are served by priority, so a caller waiting on a miss is not
+    stuck behind background refreshes, and a request already queued is shared
+    by later callers instead of being sent twice. With bulk quotes enabled,
+    queued ``GLOBAL_QUOTE`` requests are combined into one
+    ``REALTIME_BULK_QUOTES`` call of up to 100 symbols; that endpoint is only
+    available on premium keys, so the client falls back to single quotes if
+    it is refused.
+
+    Attributes:
+        cache (AlphaVantageResponseCache): Persistent response cache
+        quota (QuotaScheduler): Request rate limiter
+        bulk_quotes (bool): Whether GLOBAL_QUOTE requests are batched
+        wait_seconds (float): How long `get` waits on a cache miss
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[AlphaVantageResponseCache] = None,
+        quota: Optional[QuotaScheduler] = None,
+        function_ttls: Optional[Dict[str, float]] = None,
+        bulk_quotes: Optional[bool] = None,
+        wait_seconds: Optional[float] = None,
+    ):
+        """
+        Initialise the client; the worker thread starts on the first request.
+
+        Args:
+            api_key (str, optional): Defaults to ``ALPHA_VANTAGE_KEY``, read when
+                a request is sent.
+            cache (AlphaVantageResponseCache, optional): Defaults to the cache
+                under ``<CACHE_PATH>/alpha_vantage``.
+            quota (QuotaScheduler, optional): Defaults to the free tier limits
+                or the ``ALPHA_VANTAGE_REQUESTS_PER_*`` variables.
+            function_ttls (Dict[str, float], optional): TTL in seconds per
+                function. Defaults to DEFAULT_FUNCTION_TTLS.
+            bulk_quotes (bool, optional): Batch quotes with REALTIME_BULK_QUOTES.
+                Defaults to ``ALPHA_VANTAGE_BULK_QUOTES`` or False.
+            wait_seconds (float, optional): Defaults to
+                ``ALPHA_VANTAGE_WAIT_SECONDS`` or 90.
+        """
+        self._api_key = api_key
+        self.cache = cache or AlphaVantageResponseCache()
+        self.quota = quota or QuotaScheduler(self.cache)
+        self.function_ttls = (
+            function_ttls if function_ttls is not None else DEFAULT_FUNCTION_TTLS
+        )
+        self.bulk_quotes = (
+            bulk_quotes
+            if bulk_quotes is not None
+            else os.getenv("ALPHA_VANTAGE_BULK_QUOTES", "false").lower()
+            in ("1", "true", "yes")
+        )
+        self.wait_seconds = wait_seconds or float(
+            os.getenv("ALPHA_VANTAGE_WAIT_SECONDS", "90")
+        )
+        self._cond = threading.Condition()
+        self._pending: Dict[str, _Request] = {}
+        self._seq = itertools.count()
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key or os.getenv("ALPHA_VANTAGE_KEY")
+
+    def ttl_for(self, function: str) -> float:
+        """Return the TTL in seconds of responses for one function."""
+        return self.function_ttls.get(function.upper(), DEFAULT_TTL)
+
+    def get(
+        self,
+        function: str,
+        symbol: str,
+        interval: Optional[str] = "5min",
+        max_age: Optional[float] = None,
+    ) -> AlphaVantageResponse:
+        """
+        Return the payload of a request, from the cache whenever possible.
+
+        Args:
+            function (str): Alpha Vantage API function
+            symbol (str): Stock ticker symbol
+            interval (str, optional): Bar interval. Defaults to "5min".
+            max_age (float, optional): Age in seconds after which the cached
+                payload is refreshed. Defaults to the function's TTL.
+
+        Returns:
+            AlphaVantageResponse: Cached or freshly fetched payload
+
+        Raises:
+            AlphaVantageError: If nothing is cached and the request fails
+            TimeoutError: If nothing is cached and the request is still queued
+                after `wait_seconds`; it stays queued and fills the cache
+        """
+        function = function.upper()
+        response = self._cached(function, symbol, interval, max_age)
+        if response is not None:
+            return response
+
+        future = self.submit(function, symbol, interval, FOREGROUND)
+        try:
+            payload, fetched_at = future.result(timeout=self.wait_seconds)
+        except concurrent.futures.TimeoutError:
+            raise self._still_queued(function, symbol) from None
+        return AlphaVantageResponse(payload, fetched_at)
+
+    async def aget(
+        self,
+        function: str,
+        symbol: str,
+        interval: Optional[str] = "5min",
+        max_age: Optional[float] = None,
+    ) -> AlphaVantageResponse:
+        """
+        Asynchronous variant of ``get`` that awaits a cache miss without
+        blocking the event loop.
+
+        Args:
+            function (str): Alpha Vantage API function
+            symbol (str): Stock ticker symbol
+            interval (str, optional): Bar interval. Defaults to "5min".
+            max_age (float, optional): Age in seconds after which the cached
+                payload is refreshed. Defaults to the function's TTL.
+
+        Returns:
+            AlphaVantageResponse: Cached or freshly fetched payload
+
+        Raises:
+            AlphaVantageError: If nothing is cached and the request fails
+            TimeoutError: If nothing is cached and the request is still queued
+                after `wait_seconds`
+        """
+        function = function.upper()
+        response = self._cached(function, symbol, interval, max_age)
+        if response is not None:
+            return response
+
+        future = self.submit(function, symbol, interval, FOREGROUND)
+        try:
+            payload, fetched_at = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), self.wait_seconds
+            )
+        except asyncio.TimeoutError:
+            raise self._still_queued(function, symbol) from None
+        return AlphaVantageResponse(payload, fetched_at)
+
+    def _cached(
+        self,
+        function: str,
+        symbol: str,
+        interval: Optional[str],
+        max_age: Optional[float],
+    ) -> Optional[AlphaVantageResponse]:
+        """
+        Serve a cached payload, queueing a background refresh if it is stale.
+
+        Without an API key the stale payload is still served; it just cannot
+        be refreshed.
+        """
+        entry = self.cache.get(request_key(function, symbol, interval))
+        if entry is None:
+            return None
+        payload, fetched_at = entry
+        max_age = max_age if max_age is not None else self.ttl_for(function)
+        stale = time.time() - fetched_at > max_age
+        if stale:
+            if self.api_key:
+                self.submit(function, symbol, interval, BACKGROUND)
+            else:
+                logger.debug(
+                    f"Serving stale {function} for {symbol}: ALPHA_VANTAGE_KEY is not set"
+                )
+        return AlphaVantageResponse(payload, fetched_at, stale)
+
+    @staticmethod
+    def _still_queued(function: str, symbol: str) -> TimeoutError:
+        return TimeoutError(
+            f"{function} for {symbol} is still queued behind the Alpha Vantage "
+            "rate limit; retry shortly"
+        )
+
+    def prefetch(
+        self,
+        function: str,
+        symbols: Iterable[str],
+        interval: Optional[str] = "5min",
+    ) -> List[Future]:
+        """
+        Queue background refreshes for symbols whose cached payload is stale.
+
+        Args:
+            function (str): Alpha Vantage API function
+            symbols (Iterable[str]): Stock ticker symbols
+            interval (str, optional): Bar interval. Defaults to "5min".
+
+        Returns:
+            List[Future]: One future per queued request
+        """
+        function = function.upper()
+        futures = []
+        for symbol in symbols:
+            entry = self.cache.get(request_key(function, symbol, interval))
+            if entry is None or time.time() - entry[1] > self.ttl_for(function):
+                futures.append(self.submit(function, symbol, interval, BACKGROUND))
+        return futures
+
+    def submit(
+        self,
+        function: str,
+        symbol: str,
+        interval: Optional[str] = "5min",
+        priority: int = FOREGROUND,
+    ) -> Future:
+        """
+        Queue a request, sharing it with an identical request already queued.
+
+        Args:
+            function (str): Alpha Vantage API function
+            symbol (str): Stock ticker symbol
+            interval (str, optional): Bar interval. Defaults to "5min".
+            priority (int): Lower values are served first. Defaults to FOREGROUND.
+
+        Returns:
+            Future: Resolves to ``(payload, fetched_at)``
+
+        Raises:
+            AlphaVantageError: If no API key is configured
+        """
+        if not self.api_key:
+            raise AlphaVantageError("ALPHA_VANTAGE_KEY is not set")
+        function = function.upper()
+        key = request_key(function, symbol, interval)
+        with self._cond:
+            request = self._pending.get(key)
+            if request is None:
+                request = _Request(
+                    function, symbol.upper(), interval, priority, next(self._seq)
+                )
+                self._pending[key] = request
+            else:
+                request.priority = min(request.priority, priority)
+            self._ensure_worker()
+            self._cond.notify()
+        return request.future
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._work, name="alpha-vantage", daemon=True
+            )
+            self._worker.start()
+
+    def _next_batch(self) -> List[Tuple[str, _Request]]:
+        """Pop the most urgent request, plus other quotes if they can be batched."""
+        order = sorted(
+            self._pending.items(), key=lambda item: (item[1].priority, item[1].seq)
+        )
+        key, first = order[0]
+        if self.bulk_quotes and first.function == "GLOBAL_QUOTE":
+            batch = [item for item in order if item[1].function == "GLOBAL_QUOTE"]
+            batch = batch[:BULK_QUOTES_MAX_SYMBOLS]
+        else:
+            batch = [(key, first)]
+        for key, _ in batch:
+            del self._pending[key]
+        return batch
+
+    def _requeue(self, batch: List[Tuple[str, _Request]]) -> None:
+        with self._cond:
+            for key, request in batch:
+                queued = self._pending.setdefault(key, request)
+                if queued is not request:
+                    # A caller queued the same request meanwhile; share the result
+                    queued.future.add_done_callback(
+                        lambda done, request=request: _chain(done, request.future)
+                    )
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            try:
+                delay = self.quota.acquire()
+            except AlphaVantageQuotaExceeded as e:
+                with self._cond:
+                    failed, self._pending = list(self._pending.values()), {}
+                logger.warning(f"{e}; failing {len(failed)} queued requests")
+                for request in failed:
+                    request.future.set_exception(e)
+                continue
+            if delay > 0:
+                time.sleep(delay)
+                continue
+
+            with self._cond:
+                batch = self._next_batch()
+            try:
+                self._execute(batch)
+            except Exception as e:
+                logger.error(f"Alpha Vantage worker error: {e}")
+                for _, request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+    def _execute(self, batch: List[Tuple[str, _Request]]) -> None:
+        first = batch[0][1]
+        bulk = self.bulk_quotes and first.function == "GLOBAL_QUOTE"
+        if bulk:
+            params = {
+                "function": "REALTIME_BULK_QUOTES",
+                "symbol": ",".join(request.symbol for _, request in batch),
+                "apikey": self.api_key,
+            }
+        else:
+            params = alpha_vantage_params(
+                first.function, first.symbol, self.api_key, first.interval
+            )
+
+        try:
+            data = get_http_clients().run(
+                lambda session: fetch_alpha_vantage_payload(session, params)
+            )
+        except AlphaVantageError as e:
+            if e.rate_limited:
+                logger.warning(f"Alpha Vantage throttled the request: {e}")
+                self.quota.back_off()
+                self._requeue(batch)
+                return
+            if bulk:
+                logger.warning(
+                    f"REALTIME_BULK_QUOTES unavailable, using GLOBAL_QUOTE: {e}"
+                )
+                self.bulk_quotes = False
+                self._requeue(batch)
+                return
+            raise
+
+        fetched_at = time.time()
+        if not bulk:
+            self.cache.put(batch[0][0], data, fetched_at)
+            first.future.set_result((data, fetched_at))
+            return
+
+        rows = {str(row.get("symbol", "")).upper(): row for row in data.get("data", [])}
+        for key, request in batch:
+            row = rows.get(request.symbol)
+            if row is None:
+                request.future.set_exception(
+                    AlphaVantageError(f"No bulk quote returned for {request.symbol}")
+                )
+                continue
+            payload = _bulk_to_global_quote(row)
+            self.cache.put(key, payload, fetched_at)
+            request.future.set_result((payload, fetched_at))
+
+
+def _chain(source: Future, target: Future) -> None:
+    if source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+
+@lru_cache(maxsize=1)
+def get_alpha_vantage_client() -> AlphaVantageClient:
+    """
+    Return the process-wide Alpha Vantage client.
+
+    Returns:
+        AlphaVantageClient: Shared client used by the Alpha Vantage tool
+    """
+    return AlphaVantageClient()
@@ -0,0 +1,149 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+_FIELD_PREFIX = re.compile(r"^\d+[a-z]?\.\s*")
+
+
+def column_name(field: str) -> str:
+    """
+    Return the column name for an Alpha Vantage bar field.
+
+    Args:
+        field (str): Field as sent by Alpha Vantage (e.g. "5. adjusted close")
+
+    Returns:
+        str: Title-cased name without the ordinal (e.g. "Adjusted Close")
+    """
+    return _FIELD_PREFIX.sub("", field).title()
+
+
+def find_time_series_key(data: dict) -> Optional[str]:
+    """Return the key holding the bars of a time series payload, if any."""
+    return next((key for key in data if "Time Series" in key), None)
+
+
+def _parse_column(values: List[str], name: str) -> np.ndarray:
+    if name == "Volume":
+        try:
+            return np.array(values, dtype=np.int64)
+        except ValueError:
+            pass
+    return np.array(values, dtype=np.float64)
+
+
+@dataclass(frozen=True)
+class TimeSeriesColumns:
+    """
+    Alpha Vantage bars as typed NumPy columns, oldest bar first.
+
+    Attributes:
+        timestamps (np.ndarray): Bar times as ``datetime64[s]``
+        columns (Dict[str, np.ndarray]): Float64 price columns and an int64
+            "Volume" column keyed by name ("Open", "High", ...)
+    """
+
+    timestamps: np.ndarray
+    columns: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def intraday(self) -> bool:
+        """True if any bar falls after midnight, i.e. the bars are intraday."""
+        return bool(np.any(self.timestamps != self.timestamps.astype("datetime64[D]")))
+
+    def timestamp_strings(self) -> List[str]:
+        """Return ISO timestamps, date-only for daily and slower bars."""
+        unit = "m" if self.intraday else "D"
+        return np.datetime_as_string(self.timestamps, unit=unit).tolist()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the bars as a DataFrame indexed by a DatetimeIndex."""
+        return pd.DataFrame(self.columns, index=pd.DatetimeIndex(self.timestamps))
+
+    def to_compact(self) -> Dict[str, List[Any]]:
+        """
+        Return the bars as one list per column, for JSON output.
+
+        Returns:
+            Dict[str, List]: "timestamp" with ISO strings and one list of
+                numbers per column, all in bar order
+        """
+        compact: Dict[str, List[Any]] = {"timestamp": self.timestamp_strings()}
+        for name, values in self.columns.items():
+            compact[name] = values.tolist()
+        return compact
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the bars as ``{timestamp: {column: value}}``, for JSON output.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: One record per bar keyed by ISO timestamp
+        """
+        names = list(self.columns)
+        rows = zip(*(values.tolist() for values in self.columns.values()))
+        return {
+            timestamp: dict(zip(names, row))
+            for timestamp, row in zip(self.timestamp_strings(), rows)
+        }
+
+
+def parse_time_series(series: Dict[str, Dict[str, str]]) -> TimeSeriesColumns:
+    """
+    Convert the bars of an Alpha Vantage time series into NumPy columns.
+
+    Each column is converted from its strings in a single NumPy call and the
+    timestamps in another, so no per-bar Python objects or intermediate
+    DataFrame are created. Alpha Vantage sends the newest bar first; the
+    columns are returned oldest first.
+
+    Args:
+        series (Dict[str, Dict[str, str]]): Bars keyed by timestamp, as found
+            under the "Time Series (...)" key of a payload
+
+    Returns:
+        TimeSeriesColumns: Typed columns of the series
+    """
+    if not series:
+        return TimeSeriesColumns(np.array([], dtype="datetime64[s]"), {})
+
+    timestamps = np.array(list(series), dtype="datetime64[s]")
+    bars = list(series.values())
+    columns = {}
+    for field in bars[0]:
+        name = column_name(field)
+        columns[name] = _parse_column([bar[field] for bar in bars], name)
+
+    steps = timestamps[1:] - timestamps[:-1]
+    if np.all(steps >= np.timedelta64(0)):
+        order = slice(None)
+    elif np.all(steps <= np.timedelta64(0)):
+        order = slice(None, None, -1)
+    else:
+        order = np.argsort(timestamps, kind="stable")
+    return TimeSeriesColumns(
+        timestamps[order], {name: values[order] for name, values in columns.items()}
+    )
+
+
+def parse_time_series_payload(data: dict) -> Optional[TimeSeriesColumns]:
+    """
+    Parse the time series of an Alpha Vantage payload, if it holds one.
+
+    Args:
+        data (dict): JSON payload returned by Alpha Vantage
+
+    Returns:
+        TimeSeriesColumns or None: Parsed bars, None for payloads without a
+            time series (e.g. OVERVIEW or GLOBAL_QUOTE)
+    """
+    key = find_time_series_key(data)
+    if key is None:
+        return None
+    return parse_time_series(data[key])
@@ -1,11 +1,35 @@
 import yfinance as yf
 import pandas as pd
 import asyncio
+import os
+import random
+import re
+import threading
+import time
 from functools import partial
 from .logger import get_logger
-from typing import Optional, List, Tuple
+from .fundamentals_cache import get_fundamentals_cache
+from .alpha_vantage_parser import parse_time_series_payload
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    List,
+    Tuple,
+)
 import aiohttp
 import concurrent
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:  # yfinance < 0.2.55
+    YFRateLimitError = None
 
 
 logger = get_logger()
@@ -36,6 +60,82 @@ async def fetch_html(url: str, session: aiohttp.ClientSession) -> str | None:
         return None
 
 
+SP500_WIKI_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
+NASDAQ100_WIKI_URL = "https://en.wikipedia.org/wiki/Nasdaq-100"
+DOW30_WIKI_URL = "https://en.wikipedia.org/wiki/Dow_Jones_Industrial_Average"
+
+
+def parse_sp500_symbols(html: str) -> List[str]:
+    """
+    Extract S&P 500 ticker symbols from the Wikipedia constituents page.
+
+    Args:
+        html (str): HTML of the "List of S&P 500 companies" page
+
+    Returns:
+        list[str]: Ticker symbols from the first table's "Symbol" column
+    """
+    from io import StringIO
+
+    tables = pd.read_html(StringIO(html))
+    return tables[0]["Symbol"].tolist()
+
+
+def parse_nasdaq100_symbols(html: str) -> List[str]:
+    """
+    Extract NASDAQ-100 ticker symbols from the Wikipedia index page.
+
+    Searches all tables for a column with a name like "ticker", "symbol",
+    "trade" or "code".
+
+    Args:
+        html (str): HTML of the "Nasdaq-100" page
+
+    Returns:
+        list[str]: Ticker symbols, or an empty list if no table matches
+    """
+    # Use StringIO to fix the pandas warning
+    from io import StringIO
+
+    tables = pd.read_html(StringIO(html))
+    # Look through all tables for one with ticker symbols
+    for table in tables:
+        columns = table.columns.tolist()
+        # Check for various possible column names that might contain ticker symbols
+        ticker_cols = [
+            col
+            for col in columns
+            if any(
+                name in str(col).lower()
+                for name in ["ticker", "symbol", "trade", "code"]
+            )
+        ]
+        if ticker_cols:
+            return table[ticker_cols[0]].tolist()
+    return []
+
+
+def parse_dow30_symbols(html: str) -> List[str]:
+    """
+    Extract Dow Jones Industrial Average ticker symbols from Wikipedia.
+
+    Args:
+        html (str): HTML of the "Dow Jones Industrial Average" page
+
+    Returns:
+        list[str]: Ticker symbols from the table with a "Symbol" column,
+            or an empty list if there is none
+    """
+    from io import StringIO
+
+    tables = pd.read_html(StringIO(html))
+    # Find the table with company symbols
+    for table in tables:
+        if "Symbol" in table.columns:
+            return table["Symbol"].tolist()
+    return []
+
+
 async def get_sp500_symbols(session: aiohttp.ClientSession) -> List[str]:
     """
     Get S&P 500 company ticker symbols asynchronously.
@@ -53,14 +153,10 @@ async def get_sp500_symbols(session: aiohttp.ClientSession) -> List[str]:
     Note:
         Uses pandas to parse HTML tables from the Wikipedia page
     """
-    url = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
     try:
-        html = await fetch_html(url, session)
+        html = await fetch_html(SP500_WIKI_URL, session)
         if html:
-            from io import StringIO
-
-            tables = pd.read_html(StringIO(html))
-            return tables[0]["Symbol"].tolist()
+            return parse_sp500_symbols(html)
         return []
     except Exception as e:
         print(f"Error fetching S&P 500 symbols: {e}")
@@ -86,29 +182,10 @@ async def get_nasdaq100_symbols(session: aiohttp.ClientSession) -> List[str]:
         Uses pandas to parse HTML tables and searches for columns with
         names like "ticker", "symbol", "trade", or "code"
     """
-    url = "https://en.wikipedia.org/wiki/Nasdaq-100"
     try:
-        html = await fetch_html(url, session)
+        html = await fetch_html(NASDAQ100_WIKI_URL, session)
         if html:
-            # Use StringIO to fix the pandas warning
-            from io import StringIO
-
-            tables = pd.read_html(StringIO(html))
-            # Look through all tables for one with ticker symbols
-            for i, table in enumerate(tables):
-                columns = table.columns.tolist()
-                # Check for various possible column names that might contain ticker symbols
-                ticker_cols = [
-                    col
-                    for col in columns
-                    if any(
-                        name in str(col).lower()
-                        for name in ["ticker", "symbol", "trade", "code"]
-                    )
-                ]
-                if ticker_cols:
-                    return table[ticker_cols[0]].tolist()
-            return []
+            return parse_nasdaq100_symbols(html)
         return []
     except Exception as e:
         print(f"Error fetching NASDAQ-100 symbols: {e}")
@@ -132,24 +209,217 @@ async def get_dow30_symbols(session: aiohttp.ClientSession) -> List[str]:
     Note:
         Searches through tables to find the one with a "Symbol" column
     """
-    url = "https://en.wikipedia.org/wiki/Dow_Jones_Industrial_Average"
     try:
-        html = await fetch_html(url, session)
+        html = await fetch_html(DOW30_WIKI_URL, session)
         if html:
-            from io import StringIO
-
-            tables = pd.read_html(StringIO(html))
-            # Find the table with company symbols
-            for table in tables:
-                if "Symbol" in table.columns:
-                    return table["Symbol"].tolist()
-            return []
+            return parse_dow30_symbols(html)
         return []
     except Exception as e:
         print(f"Error fetching Dow 30 symbols: {e}")
         return []
 
 
+class SingleFlight:
+    """
+    Collapse concurrent identical calls into a single execution.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive with the same key while it is still running wait on the leader's
+    future and receive the same result or exception. Once the call finishes
+    the key is forgotten, so later calls run again.
+
+    Works from plain threads (``do``) and from coroutines (``do_async``),
+    which share the same set of in-flight calls.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run `fn` for `key`, or wait for the identical call already in flight.
+
+        Args:
+            key (Hashable): Identity of the request (e.g. ("info", "AAPL"))
+            fn (Callable): Blocking function to execute
+            *args: Positional arguments for `fn`
+            **kwargs: Keyword arguments for `fn`
+
+        Returns:
+            Any: Result of the single shared execution
+
+        Raises:
+            Exception: Whatever `fn` raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def do_async(
+        self,
+        key: Hashable,
+        fn: Callable[..., Any],
+        *args,
+        executor: Optional[concurrent.futures.Executor] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Asynchronous variant of ``do`` for blocking functions.
+
+        Followers await the leader's future without occupying a worker thread;
+        the leader runs `fn` in `executor` (the loop's default when None).
+
+        Args:
+            key (Hashable): Identity of the request
+            fn (Callable): Blocking function to execute
+            *args: Positional arguments for `fn`
+            executor (concurrent.futures.Executor, optional): Executor for the leader
+            **kwargs: Keyword arguments for `fn`
+
+        Returns:
+            Any: Result of the single shared execution
+        """
+        with self._lock:
+            future = self._calls.get(key)
+        if future is not None:
+            return await asyncio.wrap_future(future)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(self.do, key, fn, *args, **kwargs)
+        )
+
+
+# HTTP 429 as worded by requests, curl_cffi and urllib; a bare "429" could
+# just as well be part of a symbol, a date or a URL
+RATE_LIMIT_MESSAGE = re.compile(
+    r"\b429\b.*\bToo Many\b|\bToo Many Requests\b|\bHTTP(?: Error)? 429\b",
+    re.IGNORECASE,
+)
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """
+    Check whether an exception means Yahoo Finance rejected the request with
+    HTTP 429 (Too Many Requests).
+
+    Matches yfinance's YFRateLimitError, HTTP errors whose status (or their
+    response's) is 429, and otherwise the wording of a 429 response in the
+    message.
+
+    Args:
+        error (BaseException): Exception raised by a yfinance call
+
+    Returns:
+        bool: True if the request should be retried after backing off
+    """
+    if YFRateLimitError is not None and isinstance(error, YFRateLimitError):
+        return True
+    response = getattr(error, "response", None)
+    for owner in (error, response):
+        if owner is None:
+            continue
+        if 429 in (getattr(owner, "status", None), getattr(owner, "status_code", None)):
+            return True
+    return RATE_LIMIT_MESSAGE.search(str(error)) is not None
+
+
+# Shared by every Yahoo Finance helper so identical requests from different
+# tools and agents are only sent once
+yfinance_flight = SingleFlight()
+
+
+def _fetch_ticker_info(symbol: str) -> dict:
+    return yf.Ticker(symbol).info or {}
+
+
+def _fetch_ticker_history(symbol: str, **kwargs) -> pd.DataFrame:
+    return yf.Ticker(symbol).history(**kwargs)
+
+
+def _fetch_shared_ticker_info(symbol: str) -> dict:
+    try:
+        return yfinance_flight.do(("info", symbol.upper()), _fetch_ticker_info, symbol)
+    except Exception as e:
+        if is_rate_limited(e):
+            raise
+        logger.error(f"Error fetching yfinance info for {symbol}: {e}")
+        return {}
+
+
+def get_ticker_info(symbol: str, fields: Optional[List[str]] = None) -> dict:
+    """
+    Get ``yf.Ticker(symbol).info`` through the fundamentals cache.
+
+    Cached payloads are served while the requested fields are within their
+    TTL; otherwise the payload is refreshed, with concurrent identical
+    requests sharing a single HTTP call.
+
+    Args:
+        symbol (str): Stock ticker symbol (e.g., 'AAPL')
+        fields (List[str], optional): Info fields the caller will read. Only
+            their TTLs decide whether the cached payload can be used.
+            Defaults to every field in the payload.
+
+    Returns:
+        dict: Company information and financial metrics, or an empty dict
+            if the request fails and nothing is cached
+
+    Raises:
+        Exception: Yahoo Finance rate-limit errors (see ``is_rate_limited``)
+            when no cached payload can be served, so callers can back off
+    """
+    return get_fundamentals_cache().get(
+        symbol, fetcher=_fetch_shared_ticker_info, fields=fields
+    )
+
+
+def get_ticker_history(symbol: str, **kwargs) -> pd.DataFrame:
+    """
+    Get ``yf.Ticker(symbol).history(**kwargs)`` with concurrent identical
+    requests shared.
+
+    Args:
+        symbol (str): Stock ticker symbol (e.g., 'AAPL')
+        **kwargs: Arguments forwarded to ``Ticker.history`` (period, interval, ...)
+
+    Returns:
+        pandas.DataFrame: Historical price data (a private copy per caller),
+            or an empty DataFrame if the request fails
+
+    Raises:
+        Exception: Yahoo Finance rate-limit errors (see ``is_rate_limited``)
+    """
+    key = ("history", symbol.upper(), tuple(sorted(kwargs.items())))
+    try:
+        hist = yfinance_flight.do(key, _fetch_ticker_history, symbol, **kwargs)
+        return hist.copy()
+    except Exception as e:
+        if is_rate_limited(e):
+            raise
+        logger.error(f"Error fetching yfinance history for {symbol}: {e}")
+        return pd.DataFrame()
+
+
 def get_yfinance_data_sync(symbol: str) -> Tuple[pd.DataFrame, dict]:
     """
     Synchronous function to get financial data for a stock using yfinance.
@@ -163,45 +433,305 @@ def get_yfinance_data_sync(symbol: str) -> Tuple[pd.DataFrame, dict]:
 
     Returns:
         tuple: A tuple containing:
-            - pandas.DataFrame: Historical price data for the stock
-            - dict: Company information and financial metrics
+            - pandas.DataFrame: Historical price data for the stock, empty if
+              it could not be fetched
+            - dict: Company information and financial metrics, empty if it
+              could not be fetched and nothing is cached
 
-        If an error occurs, returns an empty DataFrame and empty dict.
+    Raises:
+        Exception: Yahoo Finance rate-limit errors (see ``is_rate_limited``),
+            so callers can back off or report the limit; other errors are
+            logged and give empty values
 
     Note:
-        Errors are caught, logged, and empty values are returned
+        Concurrent requests for the same symbol share a single set of HTTP
+        calls.
     """
-    try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period="1d", interval="5m")
-        info = ticker.info
-        return hist, info
-    except Exception as e:
-        logger.error(f"Error fetching yfinance data for {symbol}: {e}")
-        return pd.DataFrame(), {}
+    hist = get_ticker_history(symbol, period="1d", interval="5m")
+    info = get_ticker_info(symbol)
+    return hist, info
 
 
 async def get_yfinance_data(
-    symbol: str, executor: concurrent.futures.ThreadPoolExecutor
+    symbol: str, executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
 ) -> Tuple[pd.DataFrame, dict]:
     """
     Get stock data from Yahoo Finance asynchronously.
 
     Wraps the synchronous yfinance API call in an asynchronous function by
     running it in a ThreadPoolExecutor to avoid blocking the event loop.
+    Concurrent calls for the same symbol await one shared request.
 
     Args:
         symbol (str): Stock ticker symbol to fetch data for (e.g., 'AAPL', 'MSFT')
-        executor (concurrent.futures.ThreadPoolExecutor): Executor to run the
-            synchronous yfinance call in
+        executor (concurrent.futures.ThreadPoolExecutor, optional): Executor to
+            run the synchronous yfinance call in. Defaults to the loop's default
+            executor.
 
     Returns:
         tuple: A tuple containing:
             - pandas.DataFrame: Historical price data for the stock
             - dict: Company information and financial metrics
+
+    Raises:
+        Exception: Yahoo Finance rate-limit errors, as ``get_yfinance_data_sync``
+    """
+    return await yfinance_flight.do_async(
+        ("yfinance_data", symbol.upper()),
+        get_yfinance_data_sync,
+        symbol,
+        executor=executor,
+    )
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for coroutines.
+
+    Tokens accrue at `rate` per second up to `capacity`; each request takes
+    one token and waits when the bucket is empty. This allows short bursts
+    while holding the long-run request rate at `rate`.
+
+    Attributes:
+        rate (float): Tokens added per second
+        capacity (float): Maximum number of stored tokens (burst size)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialise a full bucket.
+
+        Args:
+            rate (float): Sustained requests per second
+            capacity (float, optional): Burst size. Defaults to `rate`.
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def stream_yfinance_data(
+    symbols: Iterable[str],
+    fetch: Optional[
+        Callable[[str, concurrent.futures.Executor], Awaitable[Any]]
+    ] = None,
+    max_concurrency: Optional[int] = None,
+    requests_per_second: Optional[float] = None,
+    max_retries: int = 3,
+    backoff: float = 1.0,
+    executor: Optional[concurrent.futures.ThreadPoolExecutor] = None,
+) -> AsyncIterator[Tuple[str, Any]]:
     """
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(executor, partial(get_yfinance_data_sync, symbol))
+    Fetch Yahoo Finance data for many symbols concurrently, yielding results
+    as they arrive.
+
+    At most `max_concurrency` requests are in flight and a shared token bucket
+    holds the request rate at `requests_per_second`. Rate-limited requests
+    (HTTP 429) are retried with exponential backoff and full jitter, so
+    concurrent retries do not hit the server in lock-step. Symbols that still
+    fail are logged and skipped.
+
+    Args:
+        symbols (Iterable[str]): Ticker symbols to fetch
+        fetch (callable, optional): Coroutine function ``fetch(symbol, executor)``.
+            Defaults to ``get_yfinance_data``.
+        max_concurrency (int, optional): Requests in flight. Defaults to
+            ``YFINANCE_MAX_CONCURRENCY`` or 8.
+        requests_per_second (float, optional): Sustained request rate. Defaults
+            to ``YFINANCE_REQUESTS_PER_SECOND`` or 5.
+        max_retries (int): Retries per symbol after a rate-limit error
+        backoff (float): Base delay in seconds for the first retry
+        executor (ThreadPoolExecutor, optional): Executor for the blocking
+            yfinance calls. Defaults to a pool sized to `max_concurrency`.
+
+    Yields:
+        Tuple[str, Any]: Symbol and the result of `fetch`, in completion order
+    """
+    fetch = fetch or get_yfinance_data
+    max_concurrency = max_concurrency or int(os.getenv("YFINANCE_MAX_CONCURRENCY", "8"))
+    bucket = TokenBucket(
+        requests_per_second or float(os.getenv("YFINANCE_REQUESTS_PER_SECOND", "5"))
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="yfinance-fetch"
+        )
+
+    async def _fetch_one(symbol: str) -> Optional[Tuple[str, Any]]:
+        async with semaphore:
+            for attempt in range(max_retries + 1):
+                await bucket.acquire()
+                try:
+                    return symbol, await fetch(symbol, executor)
+                except Exception as e:
+                    if not is_rate_limited(e) or attempt == max_retries:
+                        logger.error(f"Error fetching yfinance data for {symbol}: {e}")
+                        return None
+                    delay = random.uniform(0, backoff * 2**attempt)
+                    logger.warning(
+                        f"Rate limited fetching {symbol}, retrying in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
+
+    tasks = [
+        asyncio.ensure_future(_fetch_one(symbol)) for symbol in dict.fromkeys(symbols)
+    ]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            result = await next_result
+            if result is not None:
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
+
+# Functions whose responses depend on the `interval` parameter
+ALPHA_VANTAGE_INTERVAL_FUNCTIONS = {
+    "TIME_SERIES_INTRADAY",
+    "SMA",
+    "EMA",
+    "WMA",
+    "DEMA",
+    "TEMA",
+    "RSI",
+    "MACD",
+    "STOCH",
+    "ADX",
+    "CCI",
+    "AROON",
+    "BBANDS",
+    "AD",
+    "OBV",
+    "ATR",
+}
+
+
+class AlphaVantageError(RuntimeError):
+    """Raised when Alpha Vantage answers with an error or throttling message."""
+
+    def __init__(self, message: str, rate_limited: bool = False):
+        super().__init__(message)
+        self.rate_limited = rate_limited
+
+
+def alpha_vantage_params(
+    function: str,
+    symbol: str,
+    api_key: Optional[str],
+    interval: Optional[str] = "5min",
+) -> Dict[str, str]:
+    """
+    Build the query parameters for one Alpha Vantage request.
+
+    Args:
+        function (str): Alpha Vantage API function (e.g. "TIME_SERIES_DAILY")
+        symbol (str): Stock ticker symbol
+        api_key (str, optional): Alpha Vantage API key
+        interval (str, optional): Bar interval for intraday series and technical
+            indicators. Defaults to "5min".
+
+    Returns:
+        Dict[str, str]: Parameters to pass to ``session.get(..., params=...)``
+    """
+    params = {"function": function, "symbol": symbol, "apikey": api_key or ""}
+    if function in ALPHA_VANTAGE_INTERVAL_FUNCTIONS and interval:
+        params["interval"] = interval
+    if function == "TIME_SERIES_INTRADAY":
+        params["outputsize"] = "compact"
+    return params
+
+
+async def fetch_alpha_vantage_payload(
+    session: aiohttp.ClientSession, params: Dict[str, str]
+) -> dict:
+    """
+    Request one Alpha Vantage endpoint and return its JSON payload.
+
+    Alpha Vantage reports errors and throttling with HTTP 200 and a message in
+    the body, so those are turned into exceptions here.
+
+    Args:
+        session (aiohttp.ClientSession): Active aiohttp session
+        params (Dict[str, str]): Query parameters, including the API key
+
+    Returns:
+        dict: Decoded JSON payload
+
+    Raises:
+        AlphaVantageError: If the payload is an error or rate-limit message
+        aiohttp.ClientError: If the request itself fails
+    """
+    async with session.get(ALPHA_VANTAGE_URL, params=params) as response:
+        response.raise_for_status()
+        data = await response.json(content_type=None)
+
+    if not isinstance(data, dict):
+        raise AlphaVantageError("Unexpected Alpha Vantage response")
+    if "Error Message" in data:
+        raise AlphaVantageError(data["Error Message"])
+    # Throttled and premium-only requests come back as a lone note
+    for key in ("Note", "Information"):
+        if key in data and len(data) == 1:
+            message = str(data[key])
+            raise AlphaVantageError(
+                message,
+                rate_limited="rate limit" in message.lower()
+                or "requests per" in message.lower(),
+            )
+    return data
+
+
+def parse_alpha_vantage_payload(
+    data: dict,
+    function: Optional[str] = "TIME_SERIES_INTRADAY",
+    interval: Optional[str] = "5min",
+) -> pd.DataFrame | dict:
+    """
+    Convert an Alpha Vantage payload into the shape callers expect.
+
+    Time series bars are parsed straight into typed NumPy columns (see
+    ``parse_time_series``) and wrapped in a DataFrame, oldest bar first.
+
+    Args:
+        data (dict): JSON payload returned by Alpha Vantage
+        function (str, optional): Function the payload was requested with
+        interval (str, optional): Interval of intraday payloads
+
+    Returns:
+        pandas.DataFrame or dict:
+            For time series data: A DataFrame with columns for OHLCV data
+            For other functions (e.g., OVERVIEW): The payload unchanged
+    """
+    series = parse_time_series_payload(data)
+    if series is None:
+        return data
+    return series.to_frame()
 
 
 async def get_alpha_vantage_data(
@@ -216,7 +746,9 @@ async def get_alpha_vantage_data(
 
     Fetches various types of financial data based on the specified function type.
     Supports time series data (intraday, daily), company overviews, and other
-    Alpha Vantage API functions.
+    Alpha Vantage API functions. Each call spends one request of the API key's
+    quota; tools go through the cached, quota-aware client returned by
+    ``get_alpha_vantage_client`` instead.
 
     Args:
         symbol (str): Stock ticker symbol to fetch data for (e.g., 'AAPL', 'MSFT')
@@ -232,68 +764,14 @@ async def get_alpha_vantage_data(
             For time series data: A DataFrame with columns for OHLCV data
             For non-time series data (e.g., OVERVIEW): Original JSON response as dict
             If an error occurs: Empty DataFrame
-
-    Note:
-        For time series data, the function converts the JSON response to a DataFrame
-        and attempts to rename columns to standard OHLCV format
     """
-
-    base_url = "https://www.alphavantage.co/query"
-    params = {"function": function, "symbol": symbol, "apikey": api_key}
-
-    # Add interval parameter for intraday data
-    if function == "TIME_SERIES_INTRADAY":
-        params["interval"] = interval
-        params["outputsize"] = "compact"
-
-    # Build URL with parameters
-    url_params = "&".join([f"{k}={v}" for k, v in params.items()])
-    url = f"{base_url}?{url_params}"
-
+    params = alpha_vantage_params(function, symbol, api_key, interval)
     try:
-        async with session.get(url) as response:
-            data = await response.json()
-
-        # Handle error responses
-        if "Error Message" in data:
-            logger.error(f"Alpha Vantage API error: {data['Error Message']}")
-            return pd.DataFrame()
-
-        # Handle different function responses
-        if function == "TIME_SERIES_INTRADAY":
-            time_series_key = f"Time Series ({interval})"
-        elif function == "TIME_SERIES_DAILY":
-            time_series_key = "Time Series (Daily)"
-        elif function == "OVERVIEW":
-            # For company overview, just return the data as is
-            return data
-        else:
-            # For other functions, return whatever data we get
-            return data
-
-        # If we have time series data, convert to DataFrame
-        if time_series_key in data:
-            # Convert to pandas DataFrame
-            time_series = data[time_series_key]
-            df = pd.DataFrame.from_dict(time_series, orient="index")
-
-            # Rename columns based on common patterns
-            if len(df.columns) >= 5:  # OHLCV data
-                df.columns = ["Open", "High", "Low", "Close", "Volume"]
-                df = df.astype(
-                    {
-                        "Open": float,
-                        "High": float,
-                        "Low": float,
-                        "Close": float,
-                        "Volume": float,
-                    }
-                )
-
-            df.index = pd.DatetimeIndex(df.index)
-            return df
-
-        return data
+        data = await fetch_alpha_vantage_payload(session, params)
+        return parse_alpha_vantage_payload(data, function, interval)
+    except AlphaVantageError as e:
+        logger.error(f"Alpha Vantage API error: {e}")
+        return pd.DataFrame()
     except Exception as e:
         logger.error(f"Error fetching Alpha Vantage data for {symbol}: {e}")
         return pd.DataFrame()
@@ -0,0 +1,96 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+def get_cache_dir(name: str) -> Path:
+    """
+    Return (and create) a named directory under the local cache root.
+
+    All on-disk caches share one root so a deployment only has to mount a
+    single volume. The root defaults to ``./cache`` and can be moved with the
+    ``CACHE_PATH`` environment variable, mirroring ``MEMORY_PATH`` for crew
+    memory.
+
+    Args:
+        name (str): Sub-directory for a specific cache (e.g. "market_data")
+
+    Returns:
+        Path: Existing directory path for the cache
+    """
+    path = Path(os.getenv("CACHE_PATH", "./cache")) / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def atomic_write(path: Path, write: Callable[[Path], None]) -> None:
+    """
+    Replace a cache file atomically.
+
+    `write` fills a temporary file with a unique name next to `path`, which
+    then replaces `path` in one step. Concurrent writers, in this or other
+    processes, therefore never interleave and readers never see a partial
+    file; the last complete write wins.
+
+    Args:
+        path (Path): File to replace
+        write (Callable[[Path], None]): Writes the new content to the path
+            it is given
+
+    Raises:
+        Exception: Whatever `write` raised; the temporary file is removed
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def file_lock(path: Path, blocking: bool = True) -> Iterator[bool]:
+    """
+    Hold an exclusive lock shared by every process using the same cache.
+
+    Thread locks only coordinate one process; crews run in several worker
+    processes next to the API, so cache files they all write are guarded
+    with an advisory ``flock`` on `path` as well. Where ``fcntl`` is not
+    available the lock is always granted.
+
+    Args:
+        path (Path): Lock file, created if missing
+        blocking (bool): Wait for the lock; otherwise give up at once
+
+    Yields:
+        bool: True if the lock is held, False if it is taken and `blocking`
+            is off
+    """
+    if fcntl is None:
+        yield True
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
@@ -0,0 +1,174 @@
+import os
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from .logger import get_logger
+from .price_store import OHLCV_COLUMNS, normalize_ohlcv
+
+logger = get_logger()
+
+
+@dataclass
+class _PendingRequest:
+    ticker: str
+    start: Optional[pd.Timestamp]
+    end: Optional[pd.Timestamp]
+    future: Future = field(default_factory=Future)
+
+
+class DownloadCoalescer:
+    """
+    Merge concurrent single-ticker price downloads into one multi-ticker call.
+
+    The crew's async tasks run in parallel threads and each of them asks for
+    one ticker at a time. Requests that arrive within `window_seconds` of the
+    first one are collected per interval and sent to Yahoo Finance as a single
+    ``yf.download(tickers=[...], group_by="ticker")`` call covering the union
+    of the requested date ranges. The combined frame is then split back into
+    one normalised OHLCV frame per caller.
+
+    Attributes:
+        window_seconds (float): How long to wait for more requests before flushing
+        max_batch (int): Flush immediately once this many tickers are queued
+    """
+
+    def __init__(self, window_seconds: Optional[float] = None, max_batch: int = 100):
+        """
+        Initialise the coalescer.
+
+        Args:
+            window_seconds (float, optional): Collection window. Defaults to
+                ``MARKET_DATA_BATCH_WINDOW`` or 0.1 seconds.
+            max_batch (int): Maximum number of requests per download. Defaults to 100.
+        """
+        self.window_seconds = (
+            window_seconds
+            if window_seconds is not None
+            else float(os.getenv("MARKET_DATA_BATCH_WINDOW", "0.1"))
+        )
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[_PendingRequest]] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+
+    def fetch(
+        self,
+        ticker: str,
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+        interval: str,
+    ) -> pd.DataFrame:
+        """
+        Queue a download and block until its batch has been fetched.
+
+        Has the same signature as ``fetch_from_yahoo`` so it can be used as the
+        fetcher of a ``PriceHistoryStore``.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            start (pd.Timestamp, optional): First bar to fetch; None fetches full history
+            end (pd.Timestamp, optional): Last bar to fetch (inclusive); None means latest
+            interval (str): Bar interval (e.g. '1d', '1h', '5m')
+
+        Returns:
+            pd.DataFrame: Normalised OHLCV frame, empty on failure
+        """
+        # Yahoo Finance returns upper-case column names in batched downloads
+        request = _PendingRequest(ticker.upper(), start, end)
+        flush_now = False
+        with self._lock:
+            batch = self._pending.setdefault(interval, [])
+            batch.append(request)
+            if len(batch) == 1:
+                timer = threading.Timer(self.window_seconds, self._flush, (interval,))
+                timer.args = (interval, timer)
+                timer.daemon = True
+                self._timers[interval] = timer
+                timer.start()
+            elif len(batch) >= self.max_batch:
+                flush_now = True
+
+        if flush_now:
+            self._flush(interval)
+        return request.future.result()
+
+    def _flush(self, interval: str, timer: Optional[threading.Timer] = None) -> None:
+        with self._lock:
+            if timer is not None and self._timers.get(interval) is not timer:
+                # The batch of this timer was already flushed because it was full
+                return
+            pending_timer = self._timers.pop(interval, None)
+            if pending_timer is not None and pending_timer is not timer:
+                pending_timer.cancel()
+            batch = self._pending.pop(interval, [])
+        if not batch:
+            return
+
+        try:
+            frames = self._download(batch, interval)
+        except Exception as e:
+            logger.error(f"Error downloading batched price history: {e}")
+            frames = {}
+
+        for request in batch:
+            frame = frames.get(request.ticker)
+            if frame is None or frame.empty:
+                request.future.set_result(pd.DataFrame(columns=OHLCV_COLUMNS))
+            else:
+                request.future.set_result(frame.loc[request.start : request.end].copy())
+
+    def _download(
+        self, batch: List[_PendingRequest], interval: str
+    ) -> Dict[str, pd.DataFrame]:
+        tickers = list(dict.fromkeys(request.ticker for request in batch))
+        starts = [request.start for request in batch]
+        ends = [request.end for request in batch]
+
+        kwargs = {
+            "interval": interval,
+            "auto_adjust": False,
+            "progress": False,
+            "group_by": "ticker",
+        }
+        if any(start is None for start in starts):
+            kwargs["period"] = "max"
+        else:
+            kwargs["start"] = min(starts).strftime("%Y-%m-%d")
+            if all(end is not None for end in ends):
+                # yfinance treats `end` as exclusive
+                kwargs["end"] = (max(ends) + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+
+        logger.info(
+            f"Downloading {interval} bars for {len(tickers)} tickers in one call"
+        )
+        raw = yf.download(tickers=tickers, **kwargs)
+        if raw is None or raw.empty:
+            return {}
+
+        if not isinstance(raw.columns, pd.MultiIndex):
+            # Older yfinance versions return flat columns for a single ticker
+            return {tickers[0]: normalize_ohlcv(raw)} if len(tickers) == 1 else {}
+
+        available = set(raw.columns.get_level_values(0))
+        return {
+            ticker: normalize_ohlcv(raw[ticker])
+            for ticker in tickers
+            if ticker in available
+        }
+
+
+@lru_cache(maxsize=1)
+def get_download_coalescer() -> DownloadCoalescer:
+    """
+    Return the process-wide download coalescer.
+
+    Returns:
+        DownloadCoalescer: Shared coalescer used by the price history store
+    """
+    return DownloadCoalescer()
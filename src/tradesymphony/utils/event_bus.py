@@ -0,0 +1,288 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Event:
+    """
+    One message published on a topic.
+
+    Attributes:
+        topic (str): Topic the event belongs to (e.g. a job id)
+        seq (int): Position of the event in its topic, starting at 1
+        type (str): Kind of event (e.g. "status", "task_completed")
+        data (Dict[str, Any]): JSON-serialisable payload
+        time (float): Epoch seconds when the event was published
+    """
+
+    topic: str
+    seq: int
+    type: str
+    data: Dict[str, Any]
+    time: float
+
+    def to_sse(self) -> str:
+        """Return the event as a server-sent events message."""
+        data = json.dumps({**self.data, "time": self.time}, default=str)
+        return f"id: {self.seq}\nevent: {self.type}\ndata: {data}\n\n"
+
+
+@dataclass
+class _Channel:
+    history: Deque[Event]
+    seq: int = 0
+    closed_at: Optional[float] = None
+    subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = field(
+        default_factory=list
+    )
+    forwards: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+
+
+class Subscription:
+    """
+    Stream of the events of one topic for a single asyncio consumer.
+
+    Starts with the retained events published after the requested sequence
+    number, then follows new events live. Use it as a context manager (or
+    call `close`) so the bus stops delivering to it.
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        topic: str,
+        backlog: List[Event],
+        pending: asyncio.Queue,
+        finished: bool,
+    ):
+        self.bus = bus
+        self.topic = topic
+        self._backlog = deque(backlog)
+        self._pending = pending
+        self._finished = finished
+        self.empty = not backlog and not finished
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """
+        Return the next event of the topic.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a live event
+
+        Returns:
+            Event or None: The next event, None once the topic is closed and
+                every event has been delivered
+
+        Raises:
+            asyncio.TimeoutError: If no event arrived within `timeout`
+        """
+        if self._backlog:
+            return self._backlog.popleft()
+        if self._finished:
+            return None
+        event = await asyncio.wait_for(self._pending.get(), timeout)
+        if event is None:
+            self._finished = True
+        return event
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Event:
+        event = await self.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self.bus._unsubscribe(self.topic, self._pending)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class EventBus:
+    """
+    In-process publish/subscribe bus between worker threads and the event loop.
+
+    Publishers are plain (usually worker) threads; subscribers are coroutines
+    on any event loop, woken through ``call_soon_threadsafe``. Each topic keeps
+    its last `history` events so late subscribers, or clients reconnecting
+    with the last id they saw, can catch up. Closing a topic ends every
+    subscription once it has drained; closed topics are forgotten after
+    `retention` seconds.
+
+    Attributes:
+        history (int): Events retained per topic
+        retention (float): Seconds a closed topic stays available
+    """
+
+    def __init__(
+        self, history: Optional[int] = None, retention: Optional[float] = None
+    ):
+        """
+        Initialise an empty bus.
+
+        Args:
+            history (int, optional): Defaults to ``EVENT_BUS_HISTORY`` or 500.
+            retention (float, optional): Defaults to ``EVENT_BUS_RETENTION``
+                or 3600.
+        """
+        self.history = history or int(os.getenv("EVENT_BUS_HISTORY", "500"))
+        self.retention = (
+            retention
+            if retention is not None
+            else float(os.getenv("EVENT_BUS_RETENTION", "3600"))
+        )
+        self._lock = threading.Lock()
+        self._channels: Dict[str, _Channel] = {}
+
+    def _channel(self, topic: str) -> _Channel:
+        channel = self._channels.get(topic)
+        if channel is None:
+            channel = _Channel(history=deque(maxlen=self.history))
+            self._channels[topic] = channel
+        return channel
+
+    @staticmethod
+    def _deliver(subscribers, message: Optional[Event]) -> None:
+        for loop, pending in subscribers:
+            try:
+                loop.call_soon_threadsafe(pending.put_nowait, message)
+            except RuntimeError:
+                # The subscriber's loop has been closed
+                pass
+
+    def _append(
+        self, topic: str, type: str, data: Optional[Dict[str, Any]]
+    ) -> Tuple[Event, list, List[str]]:
+        # Called with the lock held
+        channel = self._channel(topic)
+        channel.seq += 1
+        event = Event(topic, channel.seq, type, data or {}, time.time())
+        channel.history.append(event)
+        targets = [
+            target for target, skip in channel.forwards.items() if type not in skip
+        ]
+        return event, list(channel.subscribers), targets
+
+    def publish(
+        self, topic: str, type: str, data: Optional[Dict[str, Any]] = None
+    ) -> Event:
+        """
+        Publish an event; safe to call from any thread.
+
+        Args:
+            topic (str): Topic to publish on
+            type (str): Kind of event
+            data (Dict[str, Any], optional): JSON-serialisable payload
+
+        Returns:
+            Event: The published event
+        """
+        with self._lock:
+            event, subscribers, targets = self._append(topic, type, data)
+        self._deliver(subscribers, event)
+        for target in targets:
+            self.publish(target, type, data)
+        return event
+
+    def forward(self, source: str, target: str, skip: Iterable[str] = ()) -> None:
+        """
+        Republish the events of one topic on another until the source closes.
+
+        Events already retained on `source` are republished at once, so the
+        target sees the whole stream in order.
+
+        Args:
+            source (str): Topic to copy events from
+            target (str): Topic to publish the copies on
+            skip (Iterable[str]): Event types not to copy
+        """
+        skip = frozenset(skip)
+        deliveries = []
+        with self._lock:
+            channel = self._channel(source)
+            for event in list(channel.history):
+                if event.type not in skip:
+                    copy, subscribers, _ = self._append(target, event.type, event.data)
+                    deliveries.append((subscribers, copy))
+            if channel.closed_at is None:
+                channel.forwards[target] = skip
+        for subscribers, copy in deliveries:
+            self._deliver(subscribers, copy)
+
+    def close(self, topic: str) -> None:
+        """Mark a topic as finished; its subscriptions end after draining."""
+        now = time.time()
+        with self._lock:
+            channel = self._channel(topic)
+            channel.closed_at = now
+            channel.forwards.clear()
+            subscribers, channel.subscribers = channel.subscribers, []
+            expired = [
+                name
+                for name, other in self._channels.items()
+                if other.closed_at is not None
+                and now - other.closed_at > self.retention
+            ]
+            for name in expired:
+                del self._channels[name]
+        self._deliver(subscribers, None)
+
+    def subscribe(self, topic: str, after: int = 0) -> Subscription:
+        """
+        Subscribe the running event loop to a topic.
+
+        Args:
+            topic (str): Topic to follow
+            after (int): Only deliver events with a higher sequence number,
+                e.g. the ``Last-Event-ID`` of a reconnecting client
+
+        Returns:
+            Subscription: Retained events followed by live ones
+        """
+        loop = asyncio.get_running_loop()
+        pending: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            channel = self._channel(topic)
+            backlog = [event for event in channel.history if event.seq > after]
+            finished = channel.closed_at is not None
+            if not finished:
+                channel.subscribers.append((loop, pending))
+        return Subscription(self, topic, backlog, pending, finished)
+
+    def _unsubscribe(self, topic: str, pending: asyncio.Queue) -> None:
+        with self._lock:
+            channel = self._channels.get(topic)
+            if channel is None:
+                return
+            channel.subscribers = [
+                entry for entry in channel.subscribers if entry[1] is not pending
+            ]
+            # Drop channels only subscribing created, e.g. for jobs of an
+            # earlier process, so every such request does not leak one
+            if not (channel.subscribers or channel.history or channel.forwards):
+                del self._channels[topic]
+
+
+@lru_cache(maxsize=1)
+def get_event_bus() -> EventBus:
+    """
+    Return the process-wide event bus.
+
+    Returns:
+        EventBus: Shared bus used for analysis progress events
+    """
+    return EventBus()
@@ -0,0 +1,253 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from .cache_paths import get_cache_dir
+from .logger import get_logger
+
+logger = get_logger()
+
+PRICE_TTL = 15 * 60
+PROFILE_TTL = 24 * 60 * 60
+DEFAULT_TTL = 4 * 60 * 60
+
+# Fields that move with the quote go stale quickly; company profile fields
+# barely change. Anything not listed falls back to DEFAULT_TTL.
+DEFAULT_FIELD_TTLS: Dict[str, float] = {
+    **{
+        field: PRICE_TTL
+        for field in (
+            "currentPrice",
+            "regularMarketPrice",
+            "regularMarketOpen",
+            "regularMarketDayHigh",
+            "regularMarketDayLow",
+            "regularMarketVolume",
+            "regularMarketPreviousClose",
+            "previousClose",
+            "open",
+            "dayHigh",
+            "dayLow",
+            "bid",
+            "ask",
+            "volume",
+            "marketCap",
+            "enterpriseValue",
+            "trailingPE",
+            "forwardPE",
+            "priceToBook",
+            "priceToSalesTrailing12Months",
+            "dividendYield",
+            "52WeekChange",
+        )
+    },
+    **{
+        field: PROFILE_TTL
+        for field in (
+            "longName",
+            "shortName",
+            "longBusinessSummary",
+            "sector",
+            "industry",
+            "country",
+            "website",
+            "fullTimeEmployees",
+            "exchange",
+            "quoteType",
+            "esgScores",
+        )
+    },
+}
+
+
+class FundamentalsCache:
+    """
+    Two-tier cache for ``yf.Ticker(...).info`` payloads with per-field TTLs.
+
+    Yahoo returns the whole info payload in one call, so each symbol is stored
+    with a single fetch time. Whether an entry can be served depends on which
+    fields the caller needs: a request for sector and industry stays fresh for
+    a day, while one that reads the current price expires after 15 minutes.
+
+    Entries live in an in-memory LRU tier backed by a SQLite tier that
+    survives restarts. If a refresh fails, the stale entry is returned rather
+    than nothing.
+
+    Attributes:
+        db_path (Path): Location of the SQLite database
+        max_entries (int): Capacity of the in-memory LRU tier
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_entries: int = 512,
+        field_ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+    ):
+        """
+        Initialise the cache and create the SQLite table if needed.
+
+        Args:
+            db_path (Path, optional): SQLite file. Defaults to
+                ``<CACHE_PATH>/fundamentals/fundamentals.db``.
+            max_entries (int): Number of symbols kept in memory. Defaults to 512.
+            field_ttls (Dict[str, float], optional): TTL in seconds per info field.
+                Defaults to DEFAULT_FIELD_TTLS.
+            default_ttl (float): TTL for fields without an explicit entry.
+        """
+        self.db_path = (
+            Path(db_path)
+            if db_path
+            else get_cache_dir("fundamentals") / "fundamentals.db"
+        )
+        self.max_entries = max_entries
+        self.field_ttls = field_ttls if field_ttls is not None else DEFAULT_FIELD_TTLS
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS fundamentals (
+                    symbol TEXT PRIMARY KEY,
+                    info TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def ttl_for(self, field: str) -> float:
+        """Return the TTL in seconds that applies to one info field."""
+        return self.field_ttls.get(field, self.default_ttl)
+
+    def is_fresh(
+        self, info: dict, fetched_at: float, fields: Optional[Iterable[str]] = None
+    ) -> bool:
+        """
+        Check whether a cached payload is fresh for the requested fields.
+
+        Args:
+            info (dict): Cached info payload
+            fetched_at (float): Epoch seconds when the payload was fetched
+            fields (Iterable[str], optional): Fields the caller needs. Defaults to
+                every field in the payload.
+
+        Returns:
+            bool: True if every requested field is within its TTL
+        """
+        age = time.time() - fetched_at
+        fields = list(fields) if fields is not None else list(info)
+        if not fields:
+            return age <= self.default_ttl
+        return age <= min(self.ttl_for(field) for field in fields)
+
+    def _lookup(self, symbol: str) -> Optional[Tuple[dict, float]]:
+        with self._lock:
+            entry = self._memory.get(symbol)
+            if entry is not None:
+                self._memory.move_to_end(symbol)
+                return entry
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT info, fetched_at FROM fundamentals WHERE symbol = ?",
+                (symbol,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        entry = (json.loads(row[0]), row[1])
+        self._remember(symbol, entry)
+        return entry
+
+    def _remember(self, symbol: str, entry: Tuple[dict, float]) -> None:
+        with self._lock:
+            self._memory[symbol] = entry
+            self._memory.move_to_end(symbol)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def put(self, symbol: str, info: dict) -> None:
+        """
+        Store a freshly fetched payload in both tiers.
+
+        Args:
+            symbol (str): Stock ticker symbol
+            info (dict): Info payload returned by Yahoo Finance
+        """
+        symbol = symbol.upper()
+        entry = (info, time.time())
+        self._remember(symbol, entry)
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO fundamentals (symbol, info, fetched_at) "
+                    "VALUES (?, ?, ?)",
+                    (symbol, json.dumps(info, default=str), entry[1]),
+                )
+        except Exception as e:
+            logger.warning(f"Could not persist fundamentals for {symbol}: {e}")
+
+    def get(
+        self,
+        symbol: str,
+        fetcher: Callable[[str], dict],
+        fields: Optional[Iterable[str]] = None,
+    ) -> dict:
+        """
+        Return the info payload for a symbol, fetching only when stale.
+
+        Args:
+            symbol (str): Stock ticker symbol
+            fetcher (Callable[[str], dict]): Function that downloads the payload
+            fields (Iterable[str], optional): Fields the caller will read; only
+                their TTLs decide freshness. Defaults to every cached field.
+
+        Returns:
+            dict: Copy of the info payload, possibly stale if the refresh failed,
+                or an empty dict if nothing is available
+
+        Raises:
+            Exception: Whatever `fetcher` raised, if no cached entry exists
+        """
+        key = symbol.upper()
+        fields = list(fields) if fields is not None else None
+        entry = self._lookup(key)
+        if entry is not None and self.is_fresh(entry[0], entry[1], fields):
+            return dict(entry[0])
+
+        try:
+            info = fetcher(symbol)
+        except Exception:
+            if entry is None:
+                raise
+            info = {}
+        if info:
+            self.put(key, info)
+            return dict(info)
+
+        if entry is not None:
+            logger.warning(f"Serving stale fundamentals for {symbol}")
+            return dict(entry[0])
+        return {}
+
+
+@lru_cache(maxsize=1)
+def get_fundamentals_cache() -> FundamentalsCache:
+    """
+    Return the process-wide fundamentals cache.
+
+    Returns:
+        FundamentalsCache: Shared cache used for all ``Ticker.info`` lookups
+    """
+    return FundamentalsCache()
@@ -0,0 +1,560 @@
+import asyncio
+import os
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .api_fetch import get_nasdaq100_symbols, get_ticker_info, stream_yfinance_data
+from .cache_paths import atomic_write, file_lock, get_cache_dir
+from .http_clients import get_http_clients
+from .fundamentals_cache import DEFAULT_TTL
+from .logger import get_logger
+from .screen_expression import ScreenExpressionError, compile_screen
+
+logger = get_logger()
+
+SP500_CONSTITUENTS_URL = "https://raw.githubusercontent.com/datasets/s-and-p-500-companies/master/data/constituents.csv"
+
+# Numeric Ticker.info fields stored as float columns with a sorted index each
+SNAPSHOT_METRICS = [
+    "marketCap",
+    "enterpriseValue",
+    "currentPrice",
+    "volume",
+    "averageVolume",
+    "trailingPE",
+    "forwardPE",
+    "priceToBook",
+    "priceToSalesTrailing12Months",
+    "dividendYield",
+    "payoutRatio",
+    "beta",
+    "fiftyTwoWeekHigh",
+    "fiftyTwoWeekLow",
+    "returnOnEquity",
+    "returnOnAssets",
+    "profitMargins",
+    "operatingMargins",
+    "revenueGrowth",
+    "earningsGrowth",
+    "debtToEquity",
+    "currentRatio",
+    "totalRevenue",
+    "freeCashflow",
+]
+
+# Text fields matched by equality
+SNAPSHOT_LABELS = ["longName", "sector", "industry", "country", "exchange"]
+
+# Screener criteria names mapped to the info fields they filter on
+METRIC_ALIASES = {
+    "market_cap": "marketCap",
+    "enterprise_value": "enterpriseValue",
+    "price": "currentPrice",
+    "average_volume": "averageVolume",
+    "pe_ratio": "trailingPE",
+    "forward_pe": "forwardPE",
+    "price_to_book": "priceToBook",
+    "price_to_sales": "priceToSalesTrailing12Months",
+    "dividend_yield": "dividendYield",
+    "payout_ratio": "payoutRatio",
+    "return_on_equity": "returnOnEquity",
+    "return_on_assets": "returnOnAssets",
+    "profit_margin": "profitMargins",
+    "operating_margin": "operatingMargins",
+    "revenue_growth": "revenueGrowth",
+    "earnings_growth": "earningsGrowth",
+    "debt_to_equity": "debtToEquity",
+    "current_ratio": "currentRatio",
+    "revenue": "totalRevenue",
+    "free_cash_flow": "freeCashflow",
+    "name": "longName",
+}
+
+
+def get_sp500_universe() -> List[str]:
+    """
+    Return the current S&P 500 constituents in Yahoo Finance notation.
+
+    Returns:
+        List[str]: Ticker symbols, with share classes written as 'BRK-B'
+    """
+    constituents = pd.read_csv(SP500_CONSTITUENTS_URL)
+    return [_yahoo_symbol(symbol) for symbol in constituents["Symbol"].dropna()]
+
+
+def get_screener_universe() -> List[str]:
+    """
+    Return the S&P 500 and NASDAQ-100 constituents without duplicates.
+
+    A failed NASDAQ-100 lookup is logged and the S&P 500 list returned alone.
+
+    Returns:
+        List[str]: Ticker symbols in Yahoo Finance notation
+    """
+    symbols = get_sp500_universe()
+    try:
+        symbols += [
+            _yahoo_symbol(symbol)
+            for symbol in get_http_clients().run(get_nasdaq100_symbols)
+        ]
+    except Exception as e:
+        logger.warning(f"Could not load NASDAQ-100 constituents: {e}")
+    return list(dict.fromkeys(symbols))
+
+
+def _yahoo_symbol(symbol: Any) -> str:
+    """Write a constituent symbol the way Yahoo Finance expects (BRK.B -> BRK-B)."""
+    return str(symbol).strip().upper().replace(".", "-")
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+@dataclass(frozen=True)
+class _SnapshotTable:
+    """Immutable columns plus per-metric sort orders for one snapshot version."""
+
+    symbols: np.ndarray
+    metrics: Dict[str, np.ndarray]
+    labels: Dict[str, np.ndarray]
+    orders: Dict[str, np.ndarray]
+    sorted_values: Dict[str, np.ndarray]
+    updated_at: float
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, updated_at: float) -> "_SnapshotTable":
+        symbols = frame["symbol"].to_numpy(dtype=object)
+        metrics, orders, sorted_values = {}, {}, {}
+        for metric in SNAPSHOT_METRICS:
+            values = (
+                pd.to_numeric(frame[metric], errors="coerce").to_numpy(dtype=float)
+                if metric in frame
+                else np.full(len(frame), np.nan)
+            )
+            # Missing values are left out of the index so they never match
+            present = np.flatnonzero(~np.isnan(values))
+            order = present[np.argsort(values[present], kind="stable")]
+            metrics[metric] = values
+            orders[metric] = order
+            sorted_values[metric] = values[order]
+        labels = {
+            label: (
+                frame[label].fillna("").astype(str).to_numpy(dtype=object)
+                if label in frame
+                else np.full(len(frame), "", dtype=object)
+            )
+            for label in SNAPSHOT_LABELS
+        }
+        return cls(symbols, metrics, labels, orders, sorted_values, updated_at)
+
+    @classmethod
+    def empty(cls) -> "_SnapshotTable":
+        return cls.from_frame(pd.DataFrame({"symbol": []}), 0.0)
+
+    def column(self, field: str) -> np.ndarray:
+        return self.metrics[field] if field in self.metrics else self.labels[field]
+
+    def range_mask(
+        self, metric: str, lower: Optional[float], upper: Optional[float]
+    ) -> np.ndarray:
+        sorted_values = self.sorted_values[metric]
+        start = 0 if lower is None else np.searchsorted(sorted_values, lower, "left")
+        stop = (
+            len(sorted_values)
+            if upper is None
+            else np.searchsorted(sorted_values, upper, "right")
+        )
+        mask = np.zeros(len(self.symbols), dtype=bool)
+        mask[self.orders[metric][start:stop]] = True
+        return mask
+
+    def label_mask(self, label: str, values: Any) -> np.ndarray:
+        if isinstance(values, str):
+            values = [values]
+        wanted = {str(value).strip().lower() for value in values}
+        column = self.labels[label]
+        return np.fromiter(
+            (value.lower() in wanted for value in column), dtype=bool, count=len(column)
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({"symbol": self.symbols, **self.metrics, **self.labels})
+
+
+class FundamentalsSnapshot:
+    """
+    Columnar table of fundamentals for a whole stock universe.
+
+    Each metric is held as a NumPy column together with the row order that
+    sorts it, so a range predicate such as ``trailingPE_max`` is answered
+    with two binary searches instead of a scan over info dictionaries.
+    Screens therefore run entirely in memory without network calls.
+
+    The table is persisted as Parquet and rebuilt from ``Ticker.info``
+    payloads (served through the fundamentals cache) when it is older than
+    `refresh_seconds`. Rebuilds run on a background thread and swap the new
+    table in atomically, so queries keep reading the previous version until
+    the refresh has finished; before the first build that version is empty.
+    Background rebuilds hold a lock file next to the snapshot, so of the API
+    and crew worker processes sharing a cache only one crawls the universe
+    at a time; the others pick up the snapshot it persists in `ensure_fresh`.
+
+    Attributes:
+        path (Path): Location of the Parquet snapshot
+        refresh_seconds (float): Age after which the snapshot is rebuilt
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        refresh_seconds: Optional[float] = None,
+        fetcher: Optional[Callable[[str], dict]] = None,
+        universe: Optional[Callable[[], Iterable[str]]] = None,
+    ):
+        """
+        Initialise the snapshot and load the persisted table if present.
+
+        Args:
+            path (Path, optional): Parquet file. Defaults to
+                ``<CACHE_PATH>/fundamentals/snapshot.parquet``.
+            refresh_seconds (float, optional): Maximum snapshot age. Defaults to
+                ``FUNDAMENTALS_SNAPSHOT_REFRESH_SECONDS`` or four hours.
+            fetcher (callable, optional): Returns the info payload for a symbol.
+                Defaults to ``get_ticker_info``.
+            universe (callable, optional): Returns the symbols to include.
+                Defaults to the S&P 500 and NASDAQ-100 constituents.
+        """
+        self.path = (
+            Path(path) if path else get_cache_dir("fundamentals") / "snapshot.parquet"
+        )
+        self.refresh_seconds = (
+            refresh_seconds
+            if refresh_seconds is not None
+            else float(os.getenv("FUNDAMENTALS_SNAPSHOT_REFRESH_SECONDS", DEFAULT_TTL))
+        )
+        self._fetcher = fetcher
+        self._universe = universe or get_screener_universe
+        self._refresh_lock = threading.Lock()
+        self._background: Optional[threading.Thread] = None
+        self._background_lock = threading.Lock()
+        self._table = self._load()
+
+    def _load(self) -> _SnapshotTable:
+        try:
+            frame = pd.read_parquet(self.path)
+            return _SnapshotTable.from_frame(frame, self.path.stat().st_mtime)
+        except FileNotFoundError:
+            return _SnapshotTable.empty()
+        except Exception as e:
+            logger.warning(f"Discarding unreadable fundamentals snapshot: {e}")
+            return _SnapshotTable.empty()
+
+    def _reload_if_newer(self) -> None:
+        try:
+            modified = self.path.stat().st_mtime
+        except OSError:
+            return
+        if modified > self._table.updated_at:
+            self._table = self._load()
+
+    def _save(self, frame: pd.DataFrame) -> None:
+        try:
+            atomic_write(self.path, lambda tmp: frame.to_parquet(tmp, index=False))
+        except Exception as e:
+            logger.warning(f"Could not persist fundamentals snapshot: {e}")
+
+    def _fetch(self, symbol: str) -> dict:
+        if self._fetcher is not None:
+            return self._fetcher(symbol)
+        return get_ticker_info(symbol, fields=SNAPSHOT_METRICS + SNAPSHOT_LABELS)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols currently in the snapshot."""
+        return list(self._table.symbols)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was built (infinite when empty)."""
+        table = self._table
+        if not len(table.symbols):
+            return float("inf")
+        return time.time() - table.updated_at
+
+    def is_stale(self) -> bool:
+        """Return True if the snapshot is empty or older than `refresh_seconds`."""
+        return self.age > self.refresh_seconds
+
+    async def _fetch_all(self, symbols: List[str]) -> Dict[str, dict]:
+        """Fetch info payloads concurrently through ``stream_yfinance_data``."""
+
+        async def fetch(symbol, executor):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self._fetch, symbol)
+
+        fetched = {}
+        async for symbol, info in stream_yfinance_data(symbols, fetch=fetch):
+            fetched[symbol] = info
+            if len(fetched) % 100 == 0:
+                logger.info(f"Fundamentals snapshot: fetched {len(fetched)} symbols")
+        return fetched
+
+    def refresh(self, symbols: Optional[Iterable[str]] = None) -> int:
+        """
+        Rebuild the snapshot from fresh info payloads.
+
+        Payloads are fetched concurrently with bounded concurrency and rate
+        limiting. Symbols whose payload cannot be fetched keep their previous
+        row, so a partial outage leaves stale values rather than gaps.
+
+        Args:
+            symbols (Iterable[str], optional): Universe to load. Defaults to the
+                configured universe.
+
+        Returns:
+            int: Number of symbols in the new snapshot
+        """
+        with self._refresh_lock:
+            symbols = list(symbols) if symbols is not None else self._universe()
+            previous = self._table.to_frame().set_index("symbol")
+            fetched = asyncio.run(self._fetch_all(symbols))
+            rows = []
+            for symbol in dict.fromkeys(symbols):
+                info = fetched.get(symbol)
+                if info:
+                    row = {
+                        metric: _to_float(info.get(metric))
+                        for metric in SNAPSHOT_METRICS
+                    }
+                    row.update({label: info.get(label) for label in SNAPSHOT_LABELS})
+                    rows.append({"symbol": symbol, **row})
+                elif symbol in previous.index:
+                    rows.append({"symbol": symbol, **previous.loc[symbol].to_dict()})
+
+            if not rows:
+                logger.warning("Fundamentals snapshot refresh returned no data")
+                return len(self._table.symbols)
+
+            frame = pd.DataFrame(rows)
+            self._save(frame)
+            self._table = _SnapshotTable.from_frame(frame, time.time())
+            logger.info(f"Fundamentals snapshot rebuilt with {len(rows)} symbols")
+            return len(rows)
+
+    def refresh_in_background(self) -> bool:
+        """
+        Start a refresh on a daemon thread unless one is already running.
+
+        The thread skips the rebuild while another process holds the
+        snapshot's lock file.
+
+        Returns:
+            bool: True if a new refresh was started
+        """
+        with self._background_lock:
+            if self._refresh_lock.locked() or (
+                self._background is not None and self._background.is_alive()
+            ):
+                return False
+
+            def _refresh():
+                try:
+                    with file_lock(
+                        self.path.with_suffix(".lock"), blocking=False
+                    ) as owner:
+                        if not owner:
+                            logger.info(
+                                "Fundamentals snapshot is being rebuilt by "
+                                "another process"
+                            )
+                            return
+                        # Another process may have just finished a rebuild
+                        self._reload_if_newer()
+                        if self.is_stale():
+                            self.refresh()
+                except Exception as e:
+                    logger.error(f"Background fundamentals refresh failed: {e}")
+
+            self._background = threading.Thread(
+                target=_refresh, name="fundamentals-snapshot", daemon=True
+            )
+            self._background.start()
+            return True
+
+    @property
+    def ready(self) -> bool:
+        """True once the snapshot holds data to screen."""
+        return len(self._table.symbols) > 0
+
+    def ensure_fresh(self) -> bool:
+        """
+        Keep the snapshot current without blocking the caller.
+
+        An empty or stale snapshot is rebuilt in the background while
+        queries keep reading the current table. Building the whole universe
+        takes minutes, so until the first build has finished there is
+        nothing to screen.
+
+        Returns:
+            bool: True if the snapshot holds data to screen
+        """
+        self._reload_if_newer()
+        if self.is_stale():
+            self.refresh_in_background()
+        return self.ready
+
+    @staticmethod
+    def resolve_field(name: str) -> Optional[str]:
+        """
+        Map a criteria name (e.g. 'pe_ratio' or 'trailingPE') to a snapshot field.
+
+        Args:
+            name (str): Field name or one of METRIC_ALIASES
+
+        Returns:
+            str or None: Snapshot field, or None if the name is not known
+        """
+        field = METRIC_ALIASES.get(name, name)
+        if field in SNAPSHOT_METRICS or field in SNAPSHOT_LABELS:
+            return field
+        return None
+
+    def range_mask(
+        self,
+        metric: str,
+        lower: Optional[float] = None,
+        upper: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Select rows whose metric lies in ``[lower, upper]`` using its sorted index.
+
+        Args:
+            metric (str): Field in SNAPSHOT_METRICS
+            lower (float, optional): Inclusive lower bound
+            upper (float, optional): Inclusive upper bound
+
+        Returns:
+            np.ndarray: Boolean mask over the snapshot rows; rows without a
+                value for the metric are never selected
+        """
+        return self._table.range_mask(metric, lower, upper)
+
+    def label_mask(self, label: str, values: Any) -> np.ndarray:
+        """
+        Select rows whose text field equals one of `values` (case-insensitive).
+
+        Args:
+            label (str): Field in SNAPSHOT_LABELS
+            values (str or Iterable[str]): Accepted value(s)
+
+        Returns:
+            np.ndarray: Boolean mask over the snapshot rows
+        """
+        return self._table.label_mask(label, values)
+
+    def query(
+        self,
+        criteria: Optional[Dict[str, Any]] = None,
+        expression: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Screen the snapshot.
+
+        Keys in `criteria` ending in ``_min`` / ``_max`` are inclusive bounds
+        on a numeric metric; any other key must name a text field (e.g.
+        sector) and is matched by equality. `expression` is a boolean
+        screening expression (see ``ScreenExpression``) such as
+        ``marketCap > 1e10 and (trailingPE < 20 or dividendYield > 0.03)``.
+        Metrics may be given as info fields (``trailingPE``) or aliases
+        (``pe_ratio``). When both are given, rows must satisfy both.
+
+        Rows are ordered by `sort_by` through the metric's sorted index, with
+        rows missing the metric last.
+
+        Args:
+            criteria (Dict[str, Any], optional): Screening criteria
+            expression (str, optional): Screening expression
+            sort_by (str, optional): Metric to order the matches by. Defaults
+                to universe order.
+            descending (bool): Put the largest `sort_by` values first. Defaults to True.
+
+        Returns:
+            pd.DataFrame: Matching rows with a 'symbol' column plus every
+                snapshot field
+
+        Raises:
+            ValueError: If a criterion or expression references an unknown
+                field or is malformed, or `sort_by` is not a metric
+        """
+        table = self._table
+        bounds: Dict[str, List[Optional[float]]] = {}
+        mask = np.ones(len(table.symbols), dtype=bool)
+        for key, value in (criteria or {}).items():
+            if value is None:
+                continue
+            name, _, suffix = key.rpartition("_")
+            if suffix in ("min", "max") and name:
+                field = self.resolve_field(name)
+                if field in SNAPSHOT_METRICS:
+                    bound = bounds.setdefault(field, [None, None])
+                    bound[0 if suffix == "min" else 1] = float(value)
+                    continue
+            field = self.resolve_field(key)
+            if field not in SNAPSHOT_LABELS:
+                raise ValueError(f"Unknown screening criterion: {key}")
+            mask &= table.label_mask(field, value)
+
+        for field, (lower, upper) in bounds.items():
+            mask &= table.range_mask(field, lower, upper)
+
+        if expression:
+            screen = compile_screen(expression)
+            columns = {}
+            for name in screen.fields:
+                field = self.resolve_field(name)
+                if field is None:
+                    raise ScreenExpressionError(
+                        f"Unknown field '{name}' in screening expression"
+                    )
+                columns[name] = table.column(field)
+            mask &= screen.evaluate(columns)
+
+        rows = np.flatnonzero(mask)
+        if sort_by is not None:
+            field = self.resolve_field(sort_by)
+            if field not in SNAPSHOT_METRICS:
+                raise ValueError(f"Unknown sort field: {sort_by}")
+            order = table.orders[field][::-1] if descending else table.orders[field]
+            missing = rows[np.isnan(table.metrics[field][rows])]
+            rows = np.concatenate([order[mask[order]], missing])
+        return pd.DataFrame(
+            {
+                "symbol": table.symbols[rows],
+                **{metric: values[rows] for metric, values in table.metrics.items()},
+                **{label: values[rows] for label, values in table.labels.items()},
+            }
+        )
+
+
+@lru_cache(maxsize=1)
+def get_fundamentals_snapshot() -> FundamentalsSnapshot:
+    """
+    Return the process-wide fundamentals snapshot.
+
+    Returns:
+        FundamentalsSnapshot: Shared snapshot used by the stock screener
+    """
+    return FundamentalsSnapshot()
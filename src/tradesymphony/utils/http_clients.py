@@ -0,0 +1,321 @@
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar
+
+import aiohttp
+import httpx
+
+from .logger import get_logger
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HttpClientRegistry:
+    """
+    Process-wide HTTP clients with pooled keep-alive connections.
+
+    Tools run on short-lived event loops and worker threads, and an
+    ``aiohttp.ClientSession`` only works on the loop that created it. The
+    registry therefore owns one long-lived I/O loop on a daemon thread with a
+    single aiohttp session; ``run`` and ``call`` execute a coroutine that
+    receives the session on that loop, so every caller reuses the same
+    connection pool regardless of which loop or thread it runs on. Async tool
+    implementations run on the same loop (see ``run_coroutine``), so they
+    share its connections and its default thread pool.
+
+    Blocking callers share one thread-safe ``httpx.Client``, and async code on
+    a long-lived loop (the FastAPI server) gets an ``httpx.AsyncClient`` bound
+    to that loop. The httpx clients negotiate HTTP/2 when the ``h2`` package
+    is installed.
+
+    Attributes:
+        max_connections (int): Connection limit per client
+        max_connections_per_host (int): aiohttp connection limit per host
+        keepalive_seconds (float): How long idle connections are kept open
+        timeout_seconds (float): Default total request timeout
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_seconds: Optional[float] = None,
+        timeout_seconds: Optional[float] = None,
+    ):
+        """
+        Initialise the registry; clients are created on first use.
+
+        Args:
+            max_connections (int, optional): Defaults to ``HTTP_MAX_CONNECTIONS``
+                or 100.
+            max_connections_per_host (int, optional): Defaults to
+                ``HTTP_MAX_CONNECTIONS_PER_HOST`` or 10.
+            keepalive_seconds (float, optional): Defaults to
+                ``HTTP_KEEPALIVE_SECONDS`` or 60.
+            timeout_seconds (float, optional): Defaults to ``HTTP_TIMEOUT_SECONDS``
+                or 30.
+        """
+        self.max_connections = max_connections or int(
+            os.getenv("HTTP_MAX_CONNECTIONS", "100")
+        )
+        self.max_connections_per_host = max_connections_per_host or int(
+            os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "10")
+        )
+        self.keepalive_seconds = keepalive_seconds or float(
+            os.getenv("HTTP_KEEPALIVE_SECONDS", "60")
+        )
+        self.timeout_seconds = timeout_seconds or float(
+            os.getenv("HTTP_TIMEOUT_SECONDS", "30")
+        )
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._sync_client: Optional[httpx.Client] = None
+        # httpx async clients keyed by the event loop they belong to
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    def _httpx_options(self) -> dict:
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "timeout": self.timeout_seconds,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=self.keepalive_seconds,
+            ),
+        }
+
+    def start(self) -> None:
+        """Start the I/O loop thread if it is not running yet."""
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _serve():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._thread = threading.Thread(
+                target=_serve, name="http-clients", daemon=True
+            )
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session; only valid on the I/O loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_seconds,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+            )
+        return self._session
+
+    async def _with_session(
+        self, fn: Callable[[aiohttp.ClientSession], Awaitable[T]]
+    ) -> T:
+        return await fn(self._get_session())
+
+    def submit_coroutine(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """
+        Schedule a coroutine on the I/O loop.
+
+        Args:
+            coro (Coroutine): Coroutine to run
+
+        Returns:
+            concurrent.futures.Future: Resolves to the coroutine's result
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run_coroutine(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the I/O loop and wait for its result.
+
+        Lets blocking code drive async implementations without creating an
+        event loop of its own.
+
+        Args:
+            coro (Coroutine): Coroutine to run
+
+        Returns:
+            T: Result of the coroutine
+
+        Raises:
+            RuntimeError: If called from the I/O loop itself, where waiting
+                would deadlock; await the coroutine there instead
+        """
+        self.start()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            coro.close()
+            raise RuntimeError(
+                "run_coroutine cannot wait on the I/O loop it would run on; "
+                "await the coroutine instead"
+            )
+        return self.submit_coroutine(coro).result()
+
+    def submit(
+        self, fn: Callable[[aiohttp.ClientSession], Awaitable[T]]
+    ) -> "Future[T]":
+        """
+        Schedule ``fn(session)`` on the I/O loop.
+
+        Args:
+            fn (Callable): Coroutine function taking the shared aiohttp session
+
+        Returns:
+            concurrent.futures.Future: Resolves to the coroutine's result
+        """
+        return self.submit_coroutine(self._with_session(fn))
+
+    def run(self, fn: Callable[[aiohttp.ClientSession], Awaitable[T]]) -> T:
+        """
+        Run ``fn(session)`` with the shared aiohttp session and wait for it.
+
+        For blocking code such as tool ``_run`` methods. Must not be called
+        from the I/O loop itself.
+
+        Args:
+            fn (Callable): Coroutine function taking the shared aiohttp session
+
+        Returns:
+            T: Result of the coroutine
+        """
+        return self.run_coroutine(self._with_session(fn))
+
+    async def call(self, fn: Callable[[aiohttp.ClientSession], Awaitable[T]]) -> T:
+        """
+        Await ``fn(session)`` with the shared aiohttp session from any event loop.
+
+        Args:
+            fn (Callable): Coroutine function taking the shared aiohttp session
+
+        Returns:
+            T: Result of the coroutine
+        """
+        return await asyncio.wrap_future(self.submit(fn))
+
+    def sync_client(self) -> httpx.Client:
+        """
+        Return the shared blocking httpx client.
+
+        Returns:
+            httpx.Client: Thread-safe client with pooled connections
+        """
+        with self._lock:
+            if self._sync_client is None or self._sync_client.is_closed:
+                self._sync_client = httpx.Client(**self._httpx_options())
+            return self._sync_client
+
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Return the httpx async client bound to the running event loop.
+
+        Intended for long-lived loops such as the API server's; each loop gets
+        its own client, which ``close`` and ``aclose`` close on that loop.
+
+        Returns:
+            httpx.AsyncClient: Client with pooled connections
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(**self._httpx_options())
+                self._async_clients[loop] = client
+            return client
+
+    async def aclose(self) -> None:
+        """
+        Close every client: the async clients of every loop, the shared
+        aiohttp session and its I/O loop, and the blocking client.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+        await asyncio.to_thread(self.close)
+
+    def _close_async_client(
+        self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+    ) -> None:
+        """Close an httpx async client on the event loop it belongs to."""
+        if client.is_closed or loop.is_closed() or not loop.is_running():
+            # Its connections cannot be used, or closed, without the loop
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+        except Exception as e:
+            logger.warning(f"Error closing httpx async client: {e}")
+
+    def close(self) -> None:
+        """
+        Close the async clients on their loops and the shared aiohttp
+        session, stop the I/O loop and close the blocking client.
+
+        Must not be called from a loop that has an async client; use
+        ``aclose`` there.
+        """
+        with self._lock:
+            loop, thread, session = self._loop, self._thread, self._session
+            sync_client = self._sync_client
+            self._loop = self._thread = self._session = self._sync_client = None
+            async_clients = list(self._async_clients.items())
+            self._async_clients.clear()
+
+        # Before the I/O loop stops, since async tools use a client on it too
+        for client_loop, client in async_clients:
+            self._close_async_client(client_loop, client)
+        if loop is not None:
+            if session is not None and not session.closed:
+                try:
+                    asyncio.run_coroutine_threadsafe(session.close(), loop).result(
+                        timeout=5
+                    )
+                except Exception as e:
+                    logger.warning(f"Error closing shared aiohttp session: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+        if sync_client is not None:
+            sync_client.close()
+
+
+@lru_cache(maxsize=1)
+def get_http_clients() -> HttpClientRegistry:
+    """
+    Return the process-wide HTTP client registry.
+
+    Returns:
+        HttpClientRegistry: Shared registry used by tools and the API
+    """
+    return HttpClientRegistry()
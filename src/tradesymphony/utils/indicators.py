@@ -0,0 +1,171 @@
+import numpy as np
+from typing import Dict, Iterable
+
+SUPPORTED_INDICATORS = ("SMA", "RSI", "MACD", "BB", "ADX")
+
+
+def _as_matrix(values) -> np.ndarray:
+    """Return `values` as a float (dates x tickers) matrix."""
+    matrix = np.asarray(values, dtype=float)
+    return matrix.reshape(-1, 1) if matrix.ndim == 1 else matrix
+
+
+def _shift(matrix: np.ndarray, periods: int = 1) -> np.ndarray:
+    shifted = np.full_like(matrix, np.nan)
+    shifted[periods:] = matrix[:-periods]
+    return shifted
+
+
+def rolling_mean(matrix: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean down each column, matching ``pandas.Series.rolling(window).mean()``.
+
+    A value is produced only when all `window` observations are present, so
+    columns with leading NaNs (e.g. recent listings) start later.
+
+    Args:
+        matrix (np.ndarray): Values shaped (dates x tickers)
+        window (int): Window length in rows
+
+    Returns:
+        np.ndarray: Rolling means with NaN where the window is incomplete
+    """
+    matrix = _as_matrix(matrix)
+    valid = ~np.isnan(matrix)
+    sums = np.cumsum(np.where(valid, matrix, 0.0), axis=0)
+    counts = np.cumsum(valid, axis=0)
+    sums[window:] = sums[window:] - sums[:-window]
+    counts[window:] = counts[window:] - counts[:-window]
+
+    result = np.full_like(matrix, np.nan)
+    full = counts == window
+    result[full] = sums[full] / window
+    return result
+
+
+def rolling_std(matrix: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """
+    Rolling standard deviation down each column, matching pandas defaults.
+
+    Args:
+        matrix (np.ndarray): Values shaped (dates x tickers)
+        window (int): Window length in rows
+        ddof (int): Delta degrees of freedom. Defaults to 1 like pandas.
+
+    Returns:
+        np.ndarray: Rolling standard deviations with NaN where the window is incomplete
+    """
+    matrix = _as_matrix(matrix)
+    mean = rolling_mean(matrix, window)
+    mean_sq = rolling_mean(matrix**2, window)
+    variance = (mean_sq - mean**2) * window / (window - ddof)
+    return np.sqrt(np.clip(variance, 0.0, None))
+
+
+def ewm_mean(matrix: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponentially weighted mean, matching ``pandas.Series.ewm(span, adjust=False)``.
+
+    The recursion runs over dates once, with every ticker updated in the same
+    vector operation. Each column starts at its first non-NaN value.
+
+    Args:
+        matrix (np.ndarray): Values shaped (dates x tickers)
+        span (int): EMA span; alpha = 2 / (span + 1)
+
+    Returns:
+        np.ndarray: EMA values
+    """
+    matrix = _as_matrix(matrix)
+    alpha = 2.0 / (span + 1.0)
+    result = np.empty_like(matrix)
+    previous = np.full(matrix.shape[1], np.nan)
+    for t in range(len(matrix)):
+        row = matrix[t]
+        updated = alpha * row + (1.0 - alpha) * previous
+        previous = np.where(
+            np.isnan(previous), row, np.where(np.isnan(row), previous, updated)
+        )
+        result[t] = previous
+    return result
+
+
+def compute_indicators(
+    close,
+    high=None,
+    low=None,
+    indicators: Iterable[str] = SUPPORTED_INDICATORS,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute technical indicators for a whole universe at once.
+
+    Every indicator is evaluated on (dates x tickers) matrices with NumPy
+    array operations, so the cost grows with the number of dates rather than
+    with one pandas pipeline per ticker. Definitions match the ones
+    TechnicalAnalysisTool has always reported.
+
+    Args:
+        close (array-like): Closing prices shaped (dates x tickers)
+        high (array-like, optional): High prices; required for ADX
+        low (array-like, optional): Low prices; required for ADX
+        indicators (Iterable[str]): Any of SMA, RSI, MACD, BB, ADX
+
+    Returns:
+        Dict[str, np.ndarray]: Full indicator series keyed by name
+            (SMA_20, SMA_50, SMA_200, RSI, MACD, Signal_Line, MACD_Histogram,
+            BB_Upper, BB_Middle, BB_Lower, ADX, Plus_DI, Minus_DI), each shaped
+            like `close`
+    """
+    close = _as_matrix(close)
+    indicators = {name.upper() for name in indicators}
+    results: Dict[str, np.ndarray] = {}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if "SMA" in indicators:
+            for window in (20, 50, 200):
+                results[f"SMA_{window}"] = rolling_mean(close, window)
+
+        if "RSI" in indicators:
+            delta = close - _shift(close)
+            gain = np.nan_to_num(np.where(delta > 0, delta, 0.0))
+            loss = np.nan_to_num(np.where(delta < 0, -delta, 0.0))
+            rs = rolling_mean(gain, 14) / rolling_mean(loss, 14)
+            results["RSI"] = 100 - (100 / (1 + rs))
+
+        if "MACD" in indicators:
+            macd = ewm_mean(close, 12) - ewm_mean(close, 26)
+            signal = ewm_mean(macd, 9)
+            results["MACD"] = macd
+            results["Signal_Line"] = signal
+            results["MACD_Histogram"] = macd - signal
+
+        if "BB" in indicators:
+            middle = rolling_mean(close, 20)
+            std = rolling_std(close, 20)
+            results["BB_Middle"] = middle
+            results["BB_Upper"] = middle + 2 * std
+            results["BB_Lower"] = middle - 2 * std
+
+        if "ADX" in indicators and high is not None and low is not None:
+            high = _as_matrix(high)
+            low = _as_matrix(low)
+            previous_close = _shift(close)
+            true_range = np.fmax(
+                high - low,
+                np.fmax(np.abs(high - previous_close), np.abs(low - previous_close)),
+            )
+            atr = rolling_mean(true_range, 14)
+
+            up_move = high - _shift(high)
+            down_move = _shift(low) - low
+            plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+            minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+            plus_di = 100 * rolling_mean(plus_dm, 14) / atr
+            minus_di = 100 * rolling_mean(minus_dm, 14) / atr
+            dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+            results["ADX"] = rolling_mean(dx, 14)
+            results["Plus_DI"] = plus_di
+            results["Minus_DI"] = minus_di
+
+    return results
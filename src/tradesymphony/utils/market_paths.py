@@ -0,0 +1,159 @@
+from typing import Dict, Optional
+
+import numpy as np
+
+
+def covariance_factor(cov_matrix) -> np.ndarray:
+    """
+    Return a matrix L with ``L @ L.T == cov_matrix``.
+
+    Uses the Cholesky factor when the covariance is positive definite and
+    falls back to a symmetric eigen-decomposition (clipping negative
+    eigenvalues) for singular estimates, e.g. tickers with identical history.
+
+    Args:
+        cov_matrix (array-like): Covariance matrix shaped (tickers x tickers)
+
+    Returns:
+        np.ndarray: Lower-triangular or symmetric square-root factor
+    """
+    cov = np.atleast_2d(np.asarray(cov_matrix, dtype=float))
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh((cov + cov.T) / 2)
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+
+
+def _prices_from_log_returns(start_prices, log_returns: np.ndarray) -> np.ndarray:
+    """Compound (paths x steps x tickers) log returns into price paths."""
+    paths, steps, tickers = log_returns.shape
+    prices = np.empty((paths, steps + 1, tickers))
+    prices[:, 0, :] = start_prices
+    np.cumsum(log_returns, axis=1, out=prices[:, 1:, :])
+    np.exp(prices[:, 1:, :], out=prices[:, 1:, :])
+    prices[:, 1:, :] *= start_prices
+    return prices
+
+
+def simulate_gbm_paths(
+    start_prices,
+    cov_matrix,
+    num_paths: int,
+    steps: int,
+    drift=0.0,
+    volatility_factor: float = 1.0,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Simulate correlated geometric Brownian motion for every ticker at once.
+
+    Standard normal shocks for all paths, steps and tickers are drawn in one
+    call and correlated with the Cholesky factor of the per-step return
+    covariance. Drift is the expected simple return per step; the Ito
+    correction is applied so that it is also the mean of the simulated
+    returns.
+
+    Args:
+        start_prices (array-like): Last observed price per ticker
+        cov_matrix (array-like): Per-step log return covariance (tickers x tickers)
+        num_paths (int): Number of simulated paths
+        steps (int): Number of steps per path
+        drift (float or array-like): Expected return per step. Defaults to 0.
+        volatility_factor (float): Multiplier applied to all volatilities
+        rng (np.random.Generator, optional): Random stream. Defaults to a fresh,
+            unseeded generator.
+
+    Returns:
+        np.ndarray: Prices shaped (paths x steps + 1 x tickers), starting at
+            `start_prices`
+    """
+    rng = rng or np.random.default_rng()
+    start_prices = np.atleast_1d(np.asarray(start_prices, dtype=float))
+    cov = np.atleast_2d(np.asarray(cov_matrix, dtype=float)) * volatility_factor**2
+    factor = covariance_factor(cov)
+
+    shocks = rng.standard_normal((num_paths, steps, len(start_prices)))
+    log_returns = shocks @ factor.T
+    log_returns += np.log1p(drift) - 0.5 * np.diag(cov)
+    return _prices_from_log_returns(start_prices, log_returns)
+
+
+def bootstrap_paths(
+    start_prices,
+    log_returns,
+    num_paths: int,
+    steps: int,
+    block_size: int = 5,
+    drift=0.0,
+    volatility_factor: float = 1.0,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Simulate paths by resampling blocks of historical returns.
+
+    Whole rows of the (dates x tickers) history are drawn in contiguous
+    blocks, so cross-sectional correlation, fat tails and short-range
+    autocorrelation of the real data are kept. The historical mean is removed
+    and replaced by `drift`, and deviations are scaled by `volatility_factor`,
+    so scenarios are applied the same way as in ``simulate_gbm_paths``.
+
+    Args:
+        start_prices (array-like): Last observed price per ticker
+        log_returns (array-like): Historical log returns shaped (dates x tickers)
+            without missing values
+        num_paths (int): Number of simulated paths
+        steps (int): Number of steps per path
+        block_size (int): Length of each resampled block. Defaults to 5.
+        drift (float or array-like): Expected return per step. Defaults to 0.
+        volatility_factor (float): Multiplier applied to return deviations
+        rng (np.random.Generator, optional): Random stream. Defaults to a fresh,
+            unseeded generator.
+
+    Returns:
+        np.ndarray: Prices shaped (paths x steps + 1 x tickers)
+    """
+    rng = rng or np.random.default_rng()
+    start_prices = np.atleast_1d(np.asarray(start_prices, dtype=float))
+    history = np.asarray(log_returns, dtype=float).reshape(len(log_returns), -1)
+    block_size = max(1, min(block_size, len(history)))
+
+    num_blocks = -(-steps // block_size)
+    starts = rng.integers(0, len(history) - block_size + 1, (num_paths, num_blocks))
+    rows = (starts[:, :, None] + np.arange(block_size)).reshape(num_paths, -1)
+    rows = rows[:, :steps]
+
+    deviations = history - history.mean(axis=0)
+    sampled = deviations[rows] * volatility_factor
+    variance = deviations.var(axis=0) * volatility_factor**2
+    sampled += np.log1p(drift) - 0.5 * variance
+    return _prices_from_log_returns(start_prices, sampled)
+
+
+def summarize_paths(prices: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Reduce simulated price paths to per-ticker statistics.
+
+    Args:
+        prices (np.ndarray): Prices shaped (paths x steps + 1 x tickers)
+
+    Returns:
+        Dict[str, np.ndarray]: Arrays with one value per ticker: mean_final,
+            p5, p25, median, p75, p95, probability_increase,
+            probability_loss_10pct, expected_max_drawdown
+    """
+    start = prices[0, 0, :]
+    final = prices[:, -1, :]
+    p5, p25, median, p75, p95 = np.percentile(final, [5, 25, 50, 75, 95], axis=0)
+    drawdowns = 1.0 - prices / np.maximum.accumulate(prices, axis=1)
+    return {
+        "mean_final": final.mean(axis=0),
+        "p5": p5,
+        "p25": p25,
+        "median": median,
+        "p75": p75,
+        "p95": p95,
+        "probability_increase": (final > start).mean(axis=0),
+        "probability_loss_10pct": (final < 0.9 * start).mean(axis=0),
+        "expected_max_drawdown": drawdowns.max(axis=1).mean(axis=0),
+    }
@@ -0,0 +1,381 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import numpy as np
+
+VALUE, MOMENTUM, NOISE, INSTITUTIONAL = range(4)
+AGENT_TYPES = ("value", "momentum", "noise", "institutional")
+
+# Share of the population per strategy
+DEFAULT_AGENT_MIX: Dict[str, float] = {
+    "value": 0.30,
+    "momentum": 0.25,
+    "noise": 0.44,
+    "institutional": 0.01,
+}
+
+# Probability that an agent of each type submits an order in a given step
+_ACTIVITY = np.array([0.05, 0.08, 0.10, 0.0])
+# Typical order size per type, in shares
+_ORDER_SIZE = np.array([100.0, 100.0, 50.0, 0.0])
+# Prices live on a grid of log ticks; one tick is one basis point
+_TICK = 1e-4
+# Momentum lookbacks in steps; each momentum agent follows one of them
+_LOOKBACKS = np.array([5, 20, 60])
+
+
+@dataclass
+class AgentPopulation:
+    """
+    Struct-of-arrays state for every agent in the market.
+
+    Each attribute is one NumPy array with an entry per agent, so a simulation
+    step is a handful of vectorised operations over the whole population.
+    """
+
+    kind: np.ndarray
+    cash: np.ndarray
+    inventory: np.ndarray
+    value_bias: np.ndarray
+    lookback: np.ndarray
+    parent_remaining: np.ndarray
+    parent_side: np.ndarray
+    parent_slice: np.ndarray
+    parent_start_price: np.ndarray
+    max_position: float
+
+    @classmethod
+    def create(
+        cls,
+        num_agents: int,
+        rng: np.random.Generator,
+        agent_mix: Optional[Dict[str, float]] = None,
+        max_position: float = 5000.0,
+    ) -> "AgentPopulation":
+        """
+        Draw a population with the given strategy mix.
+
+        Args:
+            num_agents (int): Number of agents
+            rng (np.random.Generator): Random stream
+            agent_mix (Dict[str, float], optional): Share of each strategy.
+                Defaults to DEFAULT_AGENT_MIX.
+            max_position (float): Absolute inventory limit per agent, in shares
+
+        Returns:
+            AgentPopulation: Agents with zero cash and inventory
+        """
+        mix = agent_mix or DEFAULT_AGENT_MIX
+        shares = np.array([mix.get(name, 0.0) for name in AGENT_TYPES], dtype=float)
+        counts = np.floor(shares / shares.sum() * num_agents).astype(int)
+        counts[NOISE] += num_agents - counts.sum()
+        kind = rng.permutation(np.repeat(np.arange(4, dtype=np.int8), counts))
+        return cls(
+            kind=kind,
+            cash=np.zeros(num_agents),
+            inventory=np.zeros(num_agents),
+            # Private, persistent error in each agent's estimate of fair value
+            value_bias=rng.normal(0.0, 0.01, num_agents),
+            lookback=rng.integers(0, len(_LOOKBACKS), num_agents).astype(np.int8),
+            parent_remaining=np.zeros(num_agents),
+            parent_side=np.zeros(num_agents, dtype=np.int8),
+            parent_slice=np.zeros(num_agents),
+            parent_start_price=np.zeros(num_agents),
+            max_position=max_position,
+        )
+
+
+@dataclass
+class OrderBookSimulation:
+    """Time series and summary statistics of one agent-based simulation."""
+
+    prices: np.ndarray
+    fundamentals: np.ndarray
+    volumes: np.ndarray
+    spreads_bps: np.ndarray
+    order_imbalance: np.ndarray
+    buy_volume_by_type: np.ndarray
+    sell_volume_by_type: np.ndarray
+    institutional_impact_bps: np.ndarray
+    population: AgentPopulation = field(repr=False)
+
+    @property
+    def kyle_lambda_bps(self) -> float:
+        """Price impact in bps per 1,000 shares of net order flow (Kyle's lambda)."""
+        returns_bps = np.diff(np.log(self.prices)) / _TICK
+        flow = self.order_imbalance / 1000.0
+        variance = flow.var()
+        if variance == 0:
+            return 0.0
+        return float(np.cov(flow, returns_bps, bias=True)[0, 1] / variance)
+
+    def summary(self) -> Dict[str, object]:
+        """Return JSON-serialisable statistics for reporting."""
+        quoted = self.spreads_bps[~np.isnan(self.spreads_bps)]
+        behaviors = {}
+        for i, name in enumerate(AGENT_TYPES):
+            total = self.buy_volume_by_type[i] + self.sell_volume_by_type[i]
+            behaviors[name] = {
+                "buy_share": float(self.buy_volume_by_type[i] / total)
+                if total
+                else None,
+                "volume": float(total),
+            }
+        return {
+            "final_price": float(self.prices[-1]),
+            "price_change": float(self.prices[-1] / self.prices[0] - 1),
+            "average_spread_bps": float(np.nanmean(quoted)) if len(quoted) else None,
+            "average_volume_per_step": float(self.volumes.mean()),
+            "kyle_lambda_bps_per_1k_shares": self.kyle_lambda_bps,
+            "institutional_impact_bps": float(self.institutional_impact_bps.mean())
+            if len(self.institutional_impact_bps)
+            else None,
+            "completed_institutional_orders": int(len(self.institutional_impact_bps)),
+            "agent_behavior": behaviors,
+        }
+
+
+class AgentBasedMarket:
+    """
+    Agent-based market with a call-auction limit order book.
+
+    Four strategies trade one asset:
+        value: buy below (sell above) a private estimate of a fundamental value
+            that follows a random walk with the scenario's drift and volatility
+        momentum: follow the sign of the price relative to an EMA
+        noise: random side and limit offset; the main source of liquidity
+        institutional: execute large parent orders in slices over many steps
+
+    Each step, active agents submit limit orders that are binned on a grid of
+    1 bp log-price ticks and cleared in a uniform-price auction at the tick
+    that maximises matched volume. Fills at the clearing tick are pro-rata.
+    Spread is measured from the residual book, and price impact is estimated
+    from the simulated order flow.
+
+    Attributes:
+        population (AgentPopulation): Agent state arrays
+        price (float): Last clearing price
+        fundamental (float): Current fundamental value
+    """
+
+    def __init__(
+        self,
+        initial_price: float,
+        num_agents: int,
+        volatility: float = 0.01,
+        drift: float = 0.0,
+        liquidity_factor: float = 1.0,
+        sentiment_bias: float = 0.0,
+        agent_mix: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = 42,
+    ):
+        """
+        Initialise the market.
+
+        Args:
+            initial_price (float): Starting price and fundamental value
+            num_agents (int): Number of trading agents
+            volatility (float): Per-step volatility of the fundamental value
+            drift (float): Per-step drift of the fundamental value
+            liquidity_factor (float): Scales noise trader order sizes, the main
+                source of resting liquidity
+            sentiment_bias (float): Tilts noise and new institutional orders
+                toward buying (positive) or selling (negative), from -1 to 1
+            agent_mix (Dict[str, float], optional): Share of each strategy
+            seed (int, optional): Seed for the random stream. Defaults to 42.
+        """
+        self.rng = np.random.default_rng(seed)
+        self.population = AgentPopulation.create(num_agents, self.rng, agent_mix)
+        self.price = float(initial_price)
+        self.fundamental = float(initial_price)
+        self.volatility = volatility
+        self.drift = drift
+        self.liquidity_factor = liquidity_factor
+        self.buy_probability = float(np.clip(0.5 + 0.25 * sentiment_bias, 0.05, 0.95))
+        self._ema = np.full(len(_LOOKBACKS), np.log(initial_price))
+        self._alpha = 2.0 / (_LOOKBACKS + 1.0)
+        self._institutions = np.flatnonzero(self.population.kind == INSTITUTIONAL)
+
+    def _institutional_orders(self, active: np.ndarray) -> None:
+        """Start new parent orders for idle institutions and activate all working ones."""
+        pop = self.population
+        institutions = self._institutions
+        idle = institutions[pop.parent_remaining[institutions] <= 0]
+        starting = idle[self.rng.random(len(idle)) < 0.02]
+        if len(starting):
+            n = len(starting)
+            size = self.rng.uniform(5_000, 50_000, n)
+            buy = self.rng.random(n) < self.buy_probability
+            pop.parent_side[starting] = np.where(buy, 1, -1)
+            pop.parent_remaining[starting] = size
+            pop.parent_slice[starting] = size / self.rng.integers(20, 100, n)
+            pop.parent_start_price[starting] = self.price
+        active[institutions[pop.parent_remaining[institutions] > 0]] = True
+
+    def _orders(self, agents: np.ndarray):
+        """Side, quantity and limit log-price of each active agent's order."""
+        pop = self.population
+        kind = pop.kind[agents]
+        log_price = np.log(self.price)
+        n = len(agents)
+        side = np.zeros(n)
+        quantity = _ORDER_SIZE[kind] * self.rng.lognormal(0.0, 0.5, n)
+        offset = np.zeros(n)
+
+        value = kind == VALUE
+        mispricing = (
+            np.log(self.fundamental) + pop.value_bias[agents[value]] - log_price
+        )
+        side[value] = np.where(np.abs(mispricing) > 0.002, np.sign(mispricing), 0)
+        quantity[value] *= np.minimum(np.abs(mispricing) / 0.01, 20.0)
+        offset[value] = mispricing / 2
+
+        momentum = kind == MOMENTUM
+        signal = log_price - self._ema[pop.lookback[agents[momentum]]]
+        side[momentum] = np.where(np.abs(signal) > 0.001, np.sign(signal), 0)
+        quantity[momentum] *= np.minimum(np.abs(signal) / 0.01, 5.0)
+        offset[momentum] = side[momentum] * 0.002
+
+        noise = kind == NOISE
+        buy = self.rng.random(noise.sum()) < self.buy_probability
+        side[noise] = np.where(buy, 1.0, -1.0)
+        offset[noise] = self.rng.normal(-0.0005, 0.003, noise.sum()) * side[noise]
+
+        quantity[noise] *= self.liquidity_factor
+
+        institutional = kind == INSTITUTIONAL
+        inst_agents = agents[institutional]
+        side[institutional] = pop.parent_side[inst_agents]
+        quantity[institutional] = np.minimum(
+            pop.parent_slice[inst_agents], pop.parent_remaining[inst_agents]
+        )
+        offset[institutional] = side[institutional] * 0.005
+
+        # Respect position limits, except for institutions working parent orders
+        inventory = pop.inventory[agents]
+        headroom = np.where(
+            side > 0, pop.max_position - inventory, pop.max_position + inventory
+        )
+        capped = np.where(institutional, quantity, np.minimum(quantity, headroom))
+        quantity = np.where(side != 0, np.clip(capped, 0.0, None), 0.0)
+        return side, quantity, log_price + offset
+
+    def _clear(self, side, quantity, limit):
+        """Run one call auction; return the price, volume, spread and fills."""
+        ticks = np.rint(limit / _TICK).astype(np.int64)
+        buys = (side > 0) & (quantity > 0)
+        sells = (side < 0) & (quantity > 0)
+        fills = np.zeros(len(side))
+        if not buys.any() or not sells.any():
+            return self.price, 0.0, np.nan, fills
+
+        low = ticks[buys | sells].min()
+        size = ticks[buys | sells].max() - low + 1
+        bid_depth = np.bincount(ticks[buys] - low, quantity[buys], size)
+        ask_depth = np.bincount(ticks[sells] - low, quantity[sells], size)
+        demand = np.cumsum(bid_depth[::-1])[::-1]
+        supply = np.cumsum(ask_depth)
+        matched = np.minimum(demand, supply)
+        volume = matched.max()
+
+        if volume <= 0:
+            best_bid = np.flatnonzero(bid_depth)[-1]
+            best_ask = np.flatnonzero(ask_depth)[0]
+            return self.price, 0.0, float(best_ask - best_bid), fills
+
+        candidates = np.flatnonzero(matched == volume)
+        clearing = candidates[len(candidates) // 2]
+        price = float(np.exp((low + clearing) * _TICK))
+
+        # Price priority: bids fill from the highest tick down and asks from the
+        # lowest tick up until the auction volume is reached; pro-rata within a tick
+        bid_filled = np.clip(volume - (demand - bid_depth), 0.0, bid_depth)
+        ask_filled = np.clip(volume - (supply - ask_depth), 0.0, ask_depth)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bid_fraction = np.where(bid_depth > 0, bid_filled / bid_depth, 0.0)
+            ask_fraction = np.where(ask_depth > 0, ask_filled / ask_depth, 0.0)
+        relative = ticks - low
+        fills[buys] = quantity[buys] * bid_fraction[relative[buys]]
+        fills[sells] = quantity[sells] * ask_fraction[relative[sells]]
+
+        # Residual book: the best unfilled bid and ask after the auction
+        bids = np.flatnonzero(bid_depth - bid_filled > 1e-9)
+        asks = np.flatnonzero(ask_depth - ask_filled > 1e-9)
+        spread = float(asks[0] - bids[-1]) if len(bids) and len(asks) else np.nan
+        return price, float(volume), spread, fills
+
+    def run(self, steps: int) -> OrderBookSimulation:
+        """
+        Simulate `steps` auctions.
+
+        Args:
+            steps (int): Number of clearing rounds
+
+        Returns:
+            OrderBookSimulation: Price, volume, spread and flow series plus
+                per-strategy statistics
+        """
+        pop = self.population
+        prices = np.empty(steps + 1)
+        fundamentals = np.empty(steps + 1)
+        volumes = np.zeros(steps)
+        spreads = np.full(steps, np.nan)
+        imbalance = np.zeros(steps)
+        buy_volume = np.zeros(4)
+        sell_volume = np.zeros(4)
+        impacts = []
+        prices[0] = fundamentals[0] = self.price
+        activity = _ACTIVITY[pop.kind]
+        news = self.rng.normal(
+            self.drift - 0.5 * self.volatility**2, self.volatility, steps
+        )
+
+        for t in range(steps):
+            self.fundamental *= np.exp(news[t])
+
+            active = self.rng.random(len(pop.kind)) < activity
+            self._institutional_orders(active)
+            agents = np.flatnonzero(active)
+
+            side, quantity, limit = self._orders(agents)
+            price, volume, spread, fills = self._clear(side, quantity, limit)
+
+            signed = side * fills
+            pop.inventory[agents] += signed
+            pop.cash[agents] -= signed * price
+            kind = pop.kind[agents]
+            buy_volume += np.bincount(kind, np.where(signed > 0, fills, 0.0), 4)
+            sell_volume += np.bincount(kind, np.where(signed < 0, fills, 0.0), 4)
+
+            institutional = kind == INSTITUTIONAL
+            if institutional.any():
+                inst_agents = agents[institutional]
+                pop.parent_remaining[inst_agents] -= fills[institutional]
+                done = inst_agents[pop.parent_remaining[inst_agents] <= 1e-9]
+                if len(done):
+                    impacts.extend(
+                        pop.parent_side[done]
+                        * np.log(price / pop.parent_start_price[done])
+                        / _TICK
+                    )
+                    pop.parent_remaining[done] = 0.0
+
+            imbalance[t] = (side * quantity).sum()
+            volumes[t] = volume
+            spreads[t] = spread
+            self.price = price
+            self._ema += self._alpha * (np.log(price) - self._ema)
+            prices[t + 1] = price
+            fundamentals[t + 1] = self.fundamental
+
+        return OrderBookSimulation(
+            prices=prices,
+            fundamentals=fundamentals,
+            volumes=volumes,
+            spreads_bps=spreads,
+            order_imbalance=imbalance,
+            buy_volume_by_type=buy_volume,
+            sell_volume_by_type=sell_volume,
+            institutional_impact_bps=np.asarray(impacts, dtype=float),
+            population=pop,
+        )
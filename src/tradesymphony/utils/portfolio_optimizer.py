@@ -0,0 +1,569 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_RISK_FREE_RATE = 0.01
+
+# Below this magnitude a pivot or Schur complement is treated as singular
+_EPS = 1e-12
+# Tolerance used when discarding turning points that break the bounds
+_FEASIBILITY_TOL = 1e-9
+# Weight matrix elements generated per sampling chunk (~16 MB of float64)
+_SAMPLE_CHUNK_ELEMENTS = 2_000_000
+
+
+@dataclass
+class PortfolioPoint:
+    """One portfolio on or below the efficient frontier."""
+
+    weights: np.ndarray
+    expected_return: float
+    volatility: float
+    sharpe_ratio: float
+
+
+def weight_bounds(
+    tickers: Sequence[str], constraints: Optional[dict] = None, max_weight: float = 1.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Translate the tool's `constraints` dict and `max_weight` into weight bounds.
+
+    Recognised constraint keys:
+        min_weight (float): Lower bound for every asset
+        max_weight (float): Upper bound for every asset (the tighter of this and
+            the `max_weight` argument wins)
+        allow_short (bool): Allow negative weights. Without explicit limits the
+            weights are then unbounded.
+        bounds (dict): Per-ticker ``[lower, upper]`` pairs overriding the above
+
+    Args:
+        tickers (Sequence[str]): Asset symbols, in optimisation order
+        constraints (dict, optional): Constraint options as described above
+        max_weight (float): Maximum weight of any single asset. Defaults to 1.0.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Lower and upper bounds per asset
+    """
+    constraints = constraints or {}
+    n = len(tickers)
+    allow_short = bool(constraints.get("allow_short", False))
+    cap = min(max_weight, constraints.get("max_weight", max_weight))
+
+    if allow_short:
+        upper = cap if cap < 1.0 else np.inf
+        lower = constraints.get("min_weight", -upper)
+    else:
+        upper = cap
+        lower = max(constraints.get("min_weight", 0.0), 0.0)
+
+    lower_bounds = np.full(n, float(lower))
+    upper_bounds = np.full(n, float(upper))
+    for ticker, (lo, hi) in constraints.get("bounds", {}).items():
+        if ticker in tickers:
+            i = list(tickers).index(ticker)
+            lower_bounds[i], upper_bounds[i] = float(lo), float(hi)
+    return lower_bounds, upper_bounds
+
+
+class MeanVarianceOptimizer:
+    """
+    Deterministic mean-variance optimiser for fully invested portfolios.
+
+    Without weight limits the minimum-variance, tangency and target-return
+    portfolios have closed-form solutions and are computed directly. With box
+    constraints (long-only, `max_weight`, per-asset bounds) the problem is a
+    quadratic programme, solved exactly with Markowitz's Critical Line
+    Algorithm: an active-set method that walks the efficient frontier from
+    the maximum-return portfolio down to the minimum-variance one, producing
+    every turning point where an asset hits or leaves a bound. Between
+    turning points the frontier is a straight line in weight space, so every
+    query (minimum variance, maximum Sharpe, a target return) is answered
+    exactly from those few points.
+
+    Attributes:
+        mean_returns (np.ndarray): Expected annual return per asset
+        cov_matrix (np.ndarray): Annualised covariance matrix
+        lower (np.ndarray): Lower weight bound per asset
+        upper (np.ndarray): Upper weight bound per asset
+        risk_free_rate (float): Rate used for Sharpe ratios
+    """
+
+    def __init__(
+        self,
+        mean_returns,
+        cov_matrix,
+        lower: Optional[np.ndarray] = None,
+        upper: Optional[np.ndarray] = None,
+        risk_free_rate: float = DEFAULT_RISK_FREE_RATE,
+    ):
+        """
+        Initialise the optimiser and validate the bounds.
+
+        Args:
+            mean_returns (array-like): Expected annual return per asset
+            cov_matrix (array-like): Annualised covariance matrix
+            lower (np.ndarray, optional): Lower bounds. Defaults to 0 (long-only).
+            upper (np.ndarray, optional): Upper bounds. Defaults to 1.
+            risk_free_rate (float): Rate used for Sharpe ratios. Defaults to 1%.
+
+        Raises:
+            ValueError: If no fully invested portfolio satisfies the bounds
+        """
+        self.mean_returns = np.asarray(mean_returns, dtype=float)
+        self.cov_matrix = np.asarray(cov_matrix, dtype=float)
+        n = len(self.mean_returns)
+        self.lower = np.zeros(n) if lower is None else np.asarray(lower, dtype=float)
+        self.upper = np.ones(n) if upper is None else np.asarray(upper, dtype=float)
+        self.risk_free_rate = risk_free_rate
+        self._turning_points: Optional[List[np.ndarray]] = None
+
+        if np.any(self.lower > self.upper):
+            raise ValueError("Lower weight bounds exceed upper bounds")
+        if self.lower.sum() > 1.0 + _FEASIBILITY_TOL or self.upper.sum() < 1.0:
+            raise ValueError(
+                f"Weight bounds are infeasible: they allow between "
+                f"{self.lower.sum():.0%} and {self.upper.sum():.0%} invested"
+            )
+        if self.bounded and not (
+            np.all(np.isfinite(self.lower)) and np.all(np.isfinite(self.upper))
+        ):
+            # The critical line needs finite bounds; no efficient portfolio
+            # leverages a single asset beyond the size of the universe.
+            limit = float(max(n, 1))
+            self.lower = np.clip(self.lower, -limit, None)
+            self.upper = np.clip(self.upper, None, limit)
+
+    @property
+    def bounded(self) -> bool:
+        """True if any weight bound is finite, so the QP solver is needed."""
+        return bool(np.isfinite(self.lower).any() or np.isfinite(self.upper).any())
+
+    def evaluate(self, weights: np.ndarray) -> PortfolioPoint:
+        """Return the expected return, volatility and Sharpe ratio of `weights`."""
+        expected_return = float(self.mean_returns @ weights)
+        volatility = float(np.sqrt(max(weights @ self.cov_matrix @ weights, 0.0)))
+        sharpe = (
+            (expected_return - self.risk_free_rate) / volatility
+            if volatility > 0
+            else 0.0
+        )
+        return PortfolioPoint(weights, expected_return, volatility, sharpe)
+
+    # Closed-form solutions for the unbounded case
+
+    def _analytic_terms(self):
+        ones = np.ones(len(self.mean_returns))
+        inv_ones = np.linalg.solve(self.cov_matrix, ones)
+        inv_mu = np.linalg.solve(self.cov_matrix, self.mean_returns)
+        a = ones @ inv_ones
+        b = ones @ inv_mu
+        c = self.mean_returns @ inv_mu
+        return inv_ones, inv_mu, a, b, c
+
+    # Critical Line Algorithm for the bounded case
+
+    def _initial_weights(self) -> Tuple[np.ndarray, List[int]]:
+        """Maximum-return portfolio: fill assets at their upper bound by mean."""
+        weights = self.lower.copy()
+        order = np.argsort(-self.mean_returns, kind="stable")
+        for i in order:
+            weights[i] = self.upper[i]
+            excess = weights.sum() - 1.0
+            if excess >= 0:
+                weights[i] -= excess
+                return weights, [int(i)]
+        return weights, [int(order[-1])]
+
+    def _bounded_exposure(self, free: List[int], weights: np.ndarray):
+        """Return the bounded assets and ``cov[:, bounded] @ weights[bounded]``."""
+        bounded_weights = weights.copy()
+        bounded_weights[free] = 0.0
+        is_bounded = np.ones(len(weights), dtype=bool)
+        is_bounded[free] = False
+        return np.flatnonzero(is_bounded), self.cov_matrix @ bounded_weights
+
+    def _solve_free(self, free: List[int], weights: np.ndarray, lam: float):
+        """Weights of the free assets at risk aversion `lam` for a fixed active set."""
+        bounded, exposure = self._bounded_exposure(free, weights)
+        cov_inv = np.linalg.inv(self.cov_matrix[np.ix_(free, free)])
+        mean_free = self.mean_returns[free]
+        ones_term = cov_inv.sum(axis=1)
+        bounded_term = cov_inv @ exposure[free]
+        gamma = (
+            -lam * ones_term @ mean_free
+            + 1.0
+            - weights[bounded].sum()
+            + bounded_term.sum()
+        ) / ones_term.sum()
+        return -bounded_term + gamma * ones_term + lam * (cov_inv @ mean_free)
+
+    def _next_lambda(
+        self, free: List[int], weights: np.ndarray, lam_prev: float, last: int
+    ):
+        """
+        Find the next turning point at or below `lam_prev`.
+
+        Returns the larger of (a) the lambda at which a free asset reaches a
+        bound and (b) the lambda at which a bounded asset would become free,
+        together with the asset and the bound it moves to. Case (b) uses the
+        Schur complement of each candidate to avoid one inversion per asset.
+        The asset that changed state at `lam_prev` (`last`) may not change
+        again at that same lambda, so round-off cannot flip it straight back.
+        """
+        cov = self.cov_matrix
+        mean = self.mean_returns
+        bounded, z = self._bounded_exposure(free, weights)
+
+        cov_inv = np.linalg.inv(cov[np.ix_(free, free)])
+        c4 = cov_inv.sum(axis=1)
+        c1 = c4.sum()
+        c2 = cov_inv @ mean[free]
+        c3 = c4 @ mean[free]
+        z_free = z[free]
+        l1 = weights[bounded].sum()
+        l3 = cov_inv @ z_free
+        l2 = l3.sum()
+
+        best = (-np.inf, None, None)
+        tol = 1e-9 * max(abs(lam_prev), 1.0) if np.isfinite(lam_prev) else 0.0
+
+        # (a) a free asset moves to one of its bounds
+        if len(free) > 1:
+            c = -c1 * c2 + c3 * c4
+            target = np.where(c > 0, self.upper[free], self.lower[free])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                lam = ((1 - l1 + l2) * c4 - c1 * (target + l3)) / c
+            lam[(np.abs(c) < _EPS) | (lam > lam_prev + tol)] = -np.inf
+            lam[(np.asarray(free) == last) & (lam >= lam_prev - tol)] = -np.inf
+            j = int(np.argmax(lam))
+            if lam[j] > best[0]:
+                best = (float(lam[j]), free[j], float(target[j]))
+
+        # (b) a bounded asset is released into the free set
+        if len(bounded):
+            u = cov[np.ix_(free, bounded)]
+            v = cov_inv @ u
+            d = cov[bounded, bounded]
+            s = d - np.einsum("ij,ij->j", u, v)
+            ov = v.sum(axis=0)
+            mv = mean[free] @ v
+            w_b = weights[bounded]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                c1p = c1 + (ov - 1) ** 2 / s
+                c3p = c3 + (ov - 1) * (mv - mean[bounded]) / s
+                c2l = (mean[bounded] - mv) / s
+                c4l = (1 - ov) / s
+                c = -c1p * c2l + c3p * c4l
+                vz = v.T @ z_free - (d - s) * w_b
+                yi = z[bounded] - d * w_b
+                l3l = (yi - vz) / s
+                l2p = l2 - ov * w_b + (ov - 1) * (vz - yi) / s
+                lam = ((1 - (l1 - w_b) + l2p) * c4l - c1p * (w_b + l3l)) / c
+            lam[(np.abs(c) < _EPS) | (s < _EPS) | (lam > lam_prev + tol)] = -np.inf
+            lam[(bounded == last) & (lam >= lam_prev - tol)] = -np.inf
+            j = int(np.argmax(lam))
+            if lam[j] > best[0]:
+                best = (float(lam[j]), int(bounded[j]), None)
+
+        return best
+
+    def turning_points(self) -> List[np.ndarray]:
+        """
+        Weights at every turning point of the bounded efficient frontier.
+
+        Returns:
+            List[np.ndarray]: Corner portfolios ordered from the maximum-return
+                portfolio to the minimum-variance portfolio
+        """
+        if self._turning_points is not None:
+            return self._turning_points
+
+        weights, free = self._initial_weights()
+        points = [weights.copy()]
+        lam_prev, last = np.inf, free[0]
+        for _ in range(4 * len(weights) + 10):
+            lam, asset, bound = self._next_lambda(free, weights, lam_prev, last)
+            lam = min(lam, lam_prev)
+            if asset is None or lam <= 0:
+                lam = 0.0
+            elif bound is not None:
+                free.remove(asset)
+                weights[asset] = bound
+            else:
+                free.append(asset)
+            weights[free] = self._solve_free(free, weights, lam)
+            points.append(weights.copy())
+            lam_prev, last = lam, asset
+            if lam == 0.0:
+                break
+
+        self._turning_points = self._purge(points)
+        return self._turning_points
+
+    def _purge(self, points: List[np.ndarray]) -> List[np.ndarray]:
+        """Drop turning points broken by round-off or that do not lower the return."""
+        kept = []
+        for weights in points:
+            if (
+                abs(weights.sum() - 1.0) > _FEASIBILITY_TOL * 1e3
+                or np.any(weights < self.lower - _FEASIBILITY_TOL * 1e3)
+                or np.any(weights > self.upper + _FEASIBILITY_TOL * 1e3)
+            ):
+                continue
+            weights = np.clip(weights, self.lower, self.upper)
+            if kept and self.mean_returns @ weights > self.mean_returns @ kept[-1]:
+                continue
+            kept.append(weights)
+        return kept
+
+    # Public queries
+
+    def min_variance(self) -> PortfolioPoint:
+        """Return the global minimum-variance portfolio."""
+        if not self.bounded:
+            inv_ones, _, a, _, _ = self._analytic_terms()
+            return self.evaluate(inv_ones / a)
+        return self.evaluate(self.turning_points()[-1])
+
+    def max_return(self) -> PortfolioPoint:
+        """
+        Return the maximum-return portfolio.
+
+        Raises:
+            ValueError: If the weights are unbounded, so the return is too
+        """
+        if not self.bounded:
+            raise ValueError("Maximum return is unbounded without weight limits")
+        return self.evaluate(self.turning_points()[0])
+
+    def max_sharpe(self) -> PortfolioPoint:
+        """
+        Return the portfolio with the highest Sharpe ratio.
+
+        Along each frontier segment the Sharpe ratio is a ratio of a linear and
+        the square root of a quadratic function of the mixing weight, so its
+        maximum is found in closed form per segment.
+        """
+        if not self.bounded:
+            _, inv_mu, a, b, _ = self._analytic_terms()
+            inv_excess = inv_mu - self.risk_free_rate * np.linalg.solve(
+                self.cov_matrix, np.ones(len(self.mean_returns))
+            )
+            denominator = b - a * self.risk_free_rate
+            if denominator <= 0:
+                # Every efficient portfolio returns less than the risk-free rate
+                return self.min_variance()
+            return self.evaluate(inv_excess / denominator)
+
+        points = self.turning_points()
+        best = self.evaluate(points[0])
+        for start, end in zip(points, points[1:]):
+            # w(t) = end + t * (start - end), t in [0, 1]
+            delta = start - end
+            p = self.mean_returns @ end - self.risk_free_rate
+            q = self.mean_returns @ delta
+            qa = delta @ self.cov_matrix @ delta
+            qb = 2 * (end @ self.cov_matrix @ delta)
+            qc = end @ self.cov_matrix @ end
+            candidates = [0.0, 1.0]
+            denominator = q * qb / 2 - p * qa
+            if abs(denominator) > _EPS:
+                t = (p * qb / 2 - q * qc) / denominator
+                if 0.0 < t < 1.0:
+                    candidates.append(t)
+            for t in candidates:
+                point = self.evaluate(end + t * delta)
+                if point.sharpe_ratio > best.sharpe_ratio:
+                    best = point
+        return best
+
+    def target_return(self, target: float) -> PortfolioPoint:
+        """
+        Return the minimum-variance portfolio with at least `target` return.
+
+        Args:
+            target (float): Required expected annual return
+
+        Raises:
+            ValueError: If the target exceeds the highest attainable return
+        """
+        if not self.bounded:
+            inv_ones, inv_mu, a, b, c = self._analytic_terms()
+            minimum = self.min_variance()
+            if target <= minimum.expected_return:
+                return minimum
+            determinant = a * c - b * b
+            weights = (
+                (c - b * target) * inv_ones + (a * target - b) * inv_mu
+            ) / determinant
+            return self.evaluate(weights)
+
+        points = self.turning_points()
+        returns = [float(self.mean_returns @ w) for w in points]
+        if target > returns[0] + _FEASIBILITY_TOL:
+            raise ValueError(
+                f"Return target {target:.2%} exceeds the maximum attainable "
+                f"{returns[0]:.2%}"
+            )
+        if target <= returns[-1]:
+            return self.evaluate(points[-1])
+        for i in range(len(points) - 1):
+            if returns[i + 1] <= target <= returns[i]:
+                span = returns[i] - returns[i + 1]
+                t = (target - returns[i + 1]) / span if span > 0 else 1.0
+                return self.evaluate(points[i + 1] + t * (points[i] - points[i + 1]))
+        return self.evaluate(points[0])
+
+    def frontier(self) -> List[PortfolioPoint]:
+        """Return the corner portfolios of the bounded efficient frontier."""
+        if not self.bounded:
+            raise ValueError("The unbounded frontier has no corner portfolios")
+        return [self.evaluate(w) for w in self.turning_points()]
+
+
+@dataclass
+class SampledPortfolios:
+    """Summary of a Monte Carlo portfolio sample."""
+
+    num_portfolios: int
+    min_volatility: PortfolioPoint
+    max_sharpe: PortfolioPoint
+    max_return: PortfolioPoint
+    target: Optional[PortfolioPoint]
+    frontier_volatility: np.ndarray
+    frontier_return: np.ndarray
+
+
+def _pareto_front(volatility: np.ndarray, returns: np.ndarray):
+    """Indices of points not beaten on both volatility and return, by volatility."""
+    order = np.argsort(volatility, kind="stable")
+    best_before = np.maximum.accumulate(
+        np.concatenate(([-np.inf], returns[order][:-1]))
+    )
+    return order[returns[order] > best_before]
+
+
+def sample_portfolios(
+    mean_returns,
+    cov_matrix,
+    num_portfolios: int = 10000,
+    lower: Optional[np.ndarray] = None,
+    upper: Optional[np.ndarray] = None,
+    risk_free_rate: float = DEFAULT_RISK_FREE_RATE,
+    return_target: Optional[float] = None,
+    seed: Optional[int] = 42,
+    chunk_size: Optional[int] = None,
+    frontier_points: int = 200,
+) -> SampledPortfolios:
+    """
+    Sample random fully invested portfolios in vectorised chunks.
+
+    Each chunk draws an (N x k) Dirichlet weight matrix, shifts it onto the
+    lower bounds and moves any weight above an upper bound onto the assets
+    with headroom, all in array operations. Returns are ``W @ mu``, and
+    volatilities are a row-wise quadratic form computed with ``einsum``. Only
+    the running best portfolios and the sampled efficient frontier are kept
+    between chunks, so memory stays bounded for any `num_portfolios`.
+
+    Args:
+        mean_returns (array-like): Expected annual return per asset
+        cov_matrix (array-like): Annualised covariance matrix
+        num_portfolios (int): Number of portfolios to draw. Defaults to 10000.
+        lower (np.ndarray, optional): Finite lower bounds. Defaults to 0.
+        upper (np.ndarray, optional): Upper bounds. Defaults to 1.
+        risk_free_rate (float): Rate used for Sharpe ratios. Defaults to 1%.
+        return_target (float, optional): Also report the lowest-volatility
+            sample with at least this return
+        seed (int, optional): Seed for the random generator. Defaults to 42.
+        chunk_size (int, optional): Portfolios per chunk. Defaults to about
+            16 MB of weights.
+        frontier_points (int): Maximum number of frontier points returned.
+
+    Returns:
+        SampledPortfolios: Best samples and the sampled efficient frontier
+
+    Raises:
+        ValueError: If the bounds are infinite or admit no portfolio
+    """
+    mu = np.asarray(mean_returns, dtype=float)
+    cov = np.asarray(cov_matrix, dtype=float)
+    k = len(mu)
+    lower = np.zeros(k) if lower is None else np.asarray(lower, dtype=float)
+    upper = np.ones(k) if upper is None else np.asarray(upper, dtype=float)
+    if not np.all(np.isfinite(lower)):
+        raise ValueError("Random sampling needs finite lower weight bounds")
+    budget = 1.0 - lower.sum()
+    if budget < 0 or upper.sum() < 1.0 or np.any(lower > upper):
+        raise ValueError("Weight bounds admit no fully invested portfolio")
+
+    rng = np.random.default_rng(seed)
+    chunk_size = chunk_size or max(1, _SAMPLE_CHUNK_ELEMENTS // k)
+    best = {}
+    frontier_vol = np.empty(0)
+    frontier_ret = np.empty(0)
+
+    def keep(name, weights, value, score):
+        if name not in best or score > best[name][0]:
+            best[name] = (score, weights.copy(), value)
+
+    remaining = num_portfolios
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        remaining -= n
+
+        weights = lower + budget * rng.dirichlet(np.ones(k), size=n)
+        if np.isfinite(upper).any():
+            excess = np.clip(weights - upper, 0.0, None).sum(axis=1, keepdims=True)
+            weights = np.minimum(weights, upper)
+            headroom = upper - weights
+            room = headroom.sum(axis=1, keepdims=True)
+            np.divide(headroom, room, out=headroom, where=room > 0)
+            weights += excess * headroom
+
+        rets = weights @ mu
+        vols = np.sqrt(np.clip(np.einsum("ij,ij->i", weights @ cov, weights), 0, None))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpes = np.where(vols > 0, (rets - risk_free_rate) / vols, 0.0)
+
+        i = int(np.argmin(vols))
+        keep("min_volatility", weights[i], (rets[i], vols[i], sharpes[i]), -vols[i])
+        i = int(np.argmax(sharpes))
+        keep("max_sharpe", weights[i], (rets[i], vols[i], sharpes[i]), sharpes[i])
+        i = int(np.argmax(rets))
+        keep("max_return", weights[i], (rets[i], vols[i], sharpes[i]), rets[i])
+        if return_target is not None:
+            eligible = np.flatnonzero(rets >= return_target)
+            if len(eligible):
+                i = int(eligible[np.argmin(vols[eligible])])
+                keep("target", weights[i], (rets[i], vols[i], sharpes[i]), -vols[i])
+
+        front = _pareto_front(vols, rets)
+        frontier_vol = np.concatenate((frontier_vol, vols[front]))
+        frontier_ret = np.concatenate((frontier_ret, rets[front]))
+        front = _pareto_front(frontier_vol, frontier_ret)
+        frontier_vol = frontier_vol[front]
+        frontier_ret = frontier_ret[front]
+
+    if len(frontier_vol) > frontier_points:
+        keep_idx = np.unique(
+            np.linspace(0, len(frontier_vol) - 1, frontier_points).round().astype(int)
+        )
+        frontier_vol = frontier_vol[keep_idx]
+        frontier_ret = frontier_ret[keep_idx]
+
+    def point(name):
+        if name not in best:
+            return None
+        _, weights, (ret, vol, sharpe) = best[name]
+        return PortfolioPoint(weights, float(ret), float(vol), float(sharpe))
+
+    return SampledPortfolios(
+        num_portfolios=num_portfolios,
+        min_volatility=point("min_volatility"),
+        max_sharpe=point("max_sharpe"),
+        max_return=point("max_return"),
+        target=point("target"),
+        frontier_volatility=frontier_vol,
+        frontier_return=frontier_ret,
+    )
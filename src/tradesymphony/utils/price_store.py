@@ -0,0 +1,497 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+import yfinance as yf
+
+from .cache_paths import atomic_write, file_lock, get_cache_dir
+from .logger import get_logger
+
+logger = get_logger()
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+PRICE_COLUMNS = ["Open", "High", "Low", "Close"]
+
+DateLike = Union[str, pd.Timestamp, None]
+Fetcher = Callable[
+    [str, Optional[pd.Timestamp], Optional[pd.Timestamp], str], pd.DataFrame
+]
+
+
+def period_to_start(
+    period: str, now: Optional[pd.Timestamp] = None
+) -> Optional[pd.Timestamp]:
+    """
+    Convert a yfinance-style period string into an absolute start date.
+
+    Args:
+        period (str): Period such as '5d', '6mo', '1y', 'ytd' or 'max'
+        now (pd.Timestamp, optional): Reference time. Defaults to the current time.
+
+    Returns:
+        pd.Timestamp or None: Start of the period, or None for 'max' (full history)
+
+    Raises:
+        ValueError: If the period string is not recognised
+    """
+    now = (now or pd.Timestamp.now()).normalize()
+    period = period.strip().lower()
+    if period == "max":
+        return None
+    if period == "ytd":
+        return pd.Timestamp(year=now.year, month=1, day=1)
+
+    match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+    count, unit = int(match.group(1)), match.group(2)
+    if unit == "d":
+        # yfinance counts trading days for day periods
+        return now - pd.tseries.offsets.BDay(count)
+    if unit == "wk":
+        return now - pd.DateOffset(weeks=count)
+    if unit == "mo":
+        return now - pd.DateOffset(months=count)
+    return now - pd.DateOffset(years=count)
+
+
+def normalize_ohlcv(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Bring a single-ticker yfinance frame into the layout used by the store.
+
+    Flattens any (field, ticker) column MultiIndex, keeps the OHLCV columns,
+    drops timezone information from the index and sorts it.
+
+    Args:
+        frame (pd.DataFrame): Raw single-ticker frame from yfinance
+
+    Returns:
+        pd.DataFrame: Frame indexed by naive timestamps with OHLCV columns
+    """
+    if frame is None or frame.empty:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+    frame = frame.copy()
+    if isinstance(frame.columns, pd.MultiIndex):
+        level = next(
+            (
+                i
+                for i in range(frame.columns.nlevels)
+                if set(frame.columns.get_level_values(i)) & set(OHLCV_COLUMNS)
+            ),
+            0,
+        )
+        frame.columns = frame.columns.get_level_values(level)
+
+    frame = frame[[c for c in OHLCV_COLUMNS if c in frame.columns]]
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    frame.index = index
+    frame.index.name = "Date"
+    frame = frame.dropna(how="all")
+    return frame[~frame.index.duplicated(keep="last")].sort_index()
+
+
+def adjust_ohlc(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adjust Open, High, Low and Close for splits and dividends.
+
+    Matches ``yf.download(auto_adjust=True)``: every price of a bar is scaled
+    by its ``Adj Close / Close`` ratio. The "Adj Close" column is kept, equal
+    to the adjusted Close, so callers reading either column get returns free
+    of split and dividend gaps.
+
+    Args:
+        frame (pd.DataFrame): Raw bars in the layout of ``normalize_ohlcv``
+
+    Returns:
+        pd.DataFrame: Adjusted copy; bars without an Adj Close are unchanged
+    """
+    if frame.empty or not {"Close", "Adj Close"} <= set(frame.columns):
+        return frame
+    factor = (frame["Adj Close"] / frame["Close"]).replace(
+        [float("inf"), -float("inf")], float("nan")
+    )
+    factor = factor.fillna(1.0)
+    frame = frame.copy()
+    for column in PRICE_COLUMNS:
+        if column in frame.columns:
+            frame[column] = frame[column] * factor
+    return frame
+
+
+def rebase_history(cached: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rescale stored bars to the adjustments of freshly downloaded ones.
+
+    Yahoo restates the whole history after a split (Close and Adj Close) or
+    a dividend (Adj Close only). The first bar present in both frames shows
+    by how much, and every stored bar is rescaled so the merged history has
+    no artificial gap.
+
+    Args:
+        cached (pd.DataFrame): Raw bars from the store
+        fresh (pd.DataFrame): Raw bars just downloaded, overlapping `cached`
+
+    Returns:
+        pd.DataFrame: `cached`, rescaled if the adjustments changed
+    """
+    overlap = cached.index.intersection(fresh.index)
+    # The newest stored bar may have been partial, so it says nothing about
+    # restated history
+    if overlap.empty or overlap[0] == cached.index[-1]:
+        return cached
+    stamp = overlap[0]
+    ratios = {}
+    for column in ("Close", "Adj Close"):
+        if column in cached.columns and column in fresh.columns:
+            old, new = cached.at[stamp, column], fresh.at[stamp, column]
+            if pd.notna(old) and pd.notna(new) and old != 0:
+                ratios[column] = new / old
+    if all(abs(ratio - 1) < 1e-9 for ratio in ratios.values()):
+        return cached
+
+    cached = cached.copy()
+    close_ratio = ratios.get("Close", 1.0)
+    for column in PRICE_COLUMNS:
+        if column in cached.columns:
+            cached[column] = cached[column] * close_ratio
+    if "Adj Close" in cached.columns:
+        cached["Adj Close"] = cached["Adj Close"] * ratios.get("Adj Close", 1.0)
+    if "Volume" in cached.columns:
+        cached["Volume"] = cached["Volume"] / close_ratio
+    return cached
+
+
+def fetch_from_yahoo(
+    ticker: str,
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp],
+    interval: str,
+) -> pd.DataFrame:
+    """
+    Download bars for one ticker directly from Yahoo Finance.
+
+    Args:
+        ticker (str): Stock ticker symbol
+        start (pd.Timestamp, optional): First bar to fetch; None fetches full history
+        end (pd.Timestamp, optional): Last bar to fetch (inclusive); None means latest
+        interval (str): Bar interval (e.g. '1d', '1h', '5m')
+
+    Returns:
+        pd.DataFrame: Normalised OHLCV frame, empty on failure
+    """
+    kwargs = {"interval": interval, "auto_adjust": False, "progress": False}
+    if start is None:
+        kwargs["period"] = "max"
+    else:
+        kwargs["start"] = start.strftime("%Y-%m-%d")
+        if end is not None:
+            # yfinance treats `end` as exclusive
+            kwargs["end"] = (end + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    try:
+        return normalize_ohlcv(yf.download(ticker, **kwargs))
+    except Exception as e:
+        logger.error(f"Error downloading price history for {ticker}: {e}")
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+
+class PriceHistoryStore:
+    """
+    Shared on-disk store for OHLCV price history.
+
+    Bars are kept per (ticker, interval) in Parquet files, and a small JSON
+    manifest records which date range each file covers and when its tail was
+    last synced with Yahoo Finance. Requests for any date range inside the
+    covered window are answered from disk; only the missing head of the range
+    or the bars added since the last sync are downloaded.
+
+    Bars are stored unadjusted, with Yahoo's Adj Close, and stored history is
+    rescaled when a download shows that Yahoo restated it for a split or
+    dividend. Reads return split- and dividend-adjusted prices by default,
+    as ``yf.download`` does.
+
+    Attributes:
+        cache_dir (Path): Directory holding the Parquet files and manifest
+        refresh_seconds (float): How long a synced tail is considered current
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        refresh_seconds: Optional[float] = None,
+        fetcher: Optional[Fetcher] = None,
+    ):
+        """
+        Initialise the store.
+
+        Args:
+            cache_dir (Path, optional): Storage directory. Defaults to
+                ``<CACHE_PATH>/market_data``.
+            refresh_seconds (float, optional): Minimum age of the last sync before
+                new bars are requested. Defaults to ``MARKET_DATA_REFRESH_SECONDS``
+                or one hour.
+            fetcher (callable, optional): Function used to download missing bars.
+                Defaults to a direct Yahoo Finance download.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else get_cache_dir("market_data")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh_seconds = (
+            refresh_seconds
+            if refresh_seconds is not None
+            else float(os.getenv("MARKET_DATA_REFRESH_SECONDS", "3600"))
+        )
+        self._fetcher = fetcher or fetch_from_yahoo
+        self._manifest_path = self.cache_dir / "manifest.json"
+        self._manifest_lock = threading.Lock()
+        self._manifest = self._load_manifest()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = defaultdict(
+            threading.Lock
+        )
+        # Lets multi-ticker requests reach the fetcher concurrently so they
+        # can be coalesced into one download
+        self._executor = ThreadPoolExecutor(
+            max_workers=16, thread_name_prefix="price-store"
+        )
+
+    def _lock_for(self, ticker: str, interval: str) -> threading.Lock:
+        with self._manifest_lock:
+            return self._key_locks[(ticker.upper(), interval)]
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self._manifest_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Discarding unreadable price manifest: {e}")
+            return {}
+
+    def _save_manifest(self, key: str) -> None:
+        # Crew worker processes share the store, so merge this entry into the
+        # manifest on disk rather than overwriting their entries with ours
+        with file_lock(self._manifest_path.with_suffix(".lock")):
+            manifest = self._load_manifest()
+            manifest[key] = self._manifest[key]
+            atomic_write(
+                self._manifest_path,
+                lambda tmp: tmp.write_text(json.dumps(manifest)),
+            )
+        self._manifest = manifest
+
+    def _path_for(self, ticker: str, interval: str) -> Path:
+        safe_ticker = ticker.upper().replace("/", "_")
+        return self.cache_dir / interval / f"{safe_ticker}.parquet"
+
+    def _read(self, path: Path) -> pd.DataFrame:
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+    def _write(self, path: Path, frame: pd.DataFrame) -> None:
+        atomic_write(path, frame.to_parquet)
+
+    def get_history(
+        self,
+        ticker: str,
+        period: Optional[str] = None,
+        start: DateLike = None,
+        end: DateLike = None,
+        interval: str = "1d",
+        adjust: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Return OHLCV bars for one ticker, fetching only what is missing.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            period (str, optional): yfinance-style period; ignored when `start` is set.
+                Defaults to '1mo' when neither is given; use 'max' for full history.
+            start (str or pd.Timestamp, optional): First date of the range
+            end (str or pd.Timestamp, optional): Last date of the range (inclusive)
+            interval (str): Bar interval. Defaults to '1d'.
+            adjust (bool): Adjust prices for splits and dividends (see
+                ``adjust_ohlc``); False returns the bars as traded
+
+        Returns:
+            pd.DataFrame: Copy of the requested bars; empty if none are available
+        """
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+        if start is None:
+            # Same default window as yf.download
+            start = period_to_start(period or "1mo")
+
+        key = f"{ticker.upper()}|{interval}"
+        path = self._path_for(ticker, interval)
+
+        with self._lock_for(ticker, interval):
+            entry = self._manifest.get(key)
+            cached = self._read(path) if entry else pd.DataFrame(columns=OHLCV_COLUMNS)
+
+            gaps: List[Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]] = []
+            synced = False
+            if entry is None or cached.empty:
+                gaps.append((start, None))
+                synced = True
+            else:
+                covered_from = (
+                    pd.Timestamp(entry["start"]) if entry["start"] is not None else None
+                )
+                if covered_from is not None and (start is None or start < covered_from):
+                    gaps.append((start, covered_from))
+
+                last_bar = cached.index[-1]
+                is_stale = time.time() - entry["synced_at"] > self.refresh_seconds
+                if is_stale and (end is None or end > last_bar):
+                    # Re-fetch the last bar as well, it may have been partial,
+                    # and the one before it to detect restated history
+                    overlap_from = cached.index[-2] if len(cached) > 1 else last_bar
+                    gaps.append((overlap_from.normalize(), None))
+                    synced = True
+
+            if gaps:
+                fetched = [self._fetcher(ticker, s, e, interval) for s, e in gaps]
+                fetched = [f for f in fetched if not f.empty]
+                if fetched:
+                    if not cached.empty:
+                        cached = rebase_history(cached, fetched[-1])
+                    merged = pd.concat([f for f in [cached, *fetched] if not f.empty])
+                    cached = merged[~merged.index.duplicated(keep="last")].sort_index()
+                    self._write(path, cached)
+
+                if not cached.empty:
+                    with self._manifest_lock:
+                        if entry is None or start is None:
+                            covered = None if start is None else start.isoformat()
+                        elif entry["start"] is None:
+                            covered = None
+                        else:
+                            covered = min(
+                                pd.Timestamp(entry["start"]), start
+                            ).isoformat()
+                        self._manifest[key] = {
+                            "start": covered,
+                            "synced_at": time.time() if synced else entry["synced_at"],
+                        }
+                        self._save_manifest(key)
+
+        if cached.empty:
+            return cached
+        bars = cached.loc[start:end].copy()
+        return adjust_ohlc(bars) if adjust else bars
+
+    def download(
+        self,
+        tickers: Union[str, List[str]],
+        period: Optional[str] = None,
+        start: DateLike = None,
+        end: DateLike = None,
+        interval: str = "1d",
+        adjust: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Drop-in replacement for ``yf.download`` backed by the store.
+
+        A single ticker string yields a flat OHLCV frame. A list of tickers yields
+        a frame with (field, ticker) columns, so ``frame["Close"]`` is a
+        dates x tickers matrix in the order the tickers were requested.
+
+        Args:
+            tickers (str or List[str]): Ticker symbol or list of symbols
+            period (str, optional): yfinance-style period; ignored when `start` is set
+            start (str or pd.Timestamp, optional): First date of the range
+            end (str or pd.Timestamp, optional): Last date of the range (inclusive)
+            interval (str): Bar interval. Defaults to '1d'.
+            adjust (bool): Adjust prices for splits and dividends, like
+                ``yf.download``'s default ``auto_adjust=True``
+
+        Returns:
+            pd.DataFrame: Price history; empty if no ticker returned data
+        """
+        if isinstance(tickers, str):
+            return self.get_history(tickers, period, start, end, interval, adjust)
+
+        futures = {
+            ticker: self._executor.submit(
+                self.get_history, ticker, period, start, end, interval, adjust
+            )
+            for ticker in tickers
+        }
+        frames = {ticker: future.result() for ticker, future in futures.items()}
+        if all(frame.empty for frame in frames.values()):
+            return pd.DataFrame()
+
+        fields = [
+            c for c in OHLCV_COLUMNS if any(c in f.columns for f in frames.values())
+        ]
+        combined = pd.concat(
+            {
+                field: pd.DataFrame(
+                    {
+                        ticker: frame[field]
+                        if field in frame.columns
+                        else pd.Series(dtype=float)
+                        for ticker, frame in frames.items()
+                    }
+                )
+                for field in fields
+            },
+            axis=1,
+        )
+        combined.columns.names = ["Price", "Ticker"]
+        return combined.sort_index()
+
+
+@lru_cache(maxsize=1)
+def get_price_store() -> PriceHistoryStore:
+    """
+    Return the process-wide price history store.
+
+    Returns:
+        PriceHistoryStore: Shared store instance used by all market data tools,
+            with missing bars downloaded through the shared coalescer
+    """
+    from .download_coalescer import get_download_coalescer
+
+    return PriceHistoryStore(fetcher=get_download_coalescer().fetch)
+
+
+def download_history(
+    tickers: Union[str, List[str]],
+    period: Optional[str] = None,
+    start: DateLike = None,
+    end: DateLike = None,
+    interval: str = "1d",
+    adjust: bool = True,
+) -> pd.DataFrame:
+    """
+    Fetch price history through the shared store.
+
+    Thin convenience wrapper around ``get_price_store().download`` so tools can
+    swap ``yf.download(...)`` for ``download_history(...)`` one-for-one.
+
+    Args:
+        tickers (str or List[str]): Ticker symbol or list of symbols
+        period (str, optional): yfinance-style period (e.g. '6mo', '1y')
+        start (str or pd.Timestamp, optional): First date of the range
+        end (str or pd.Timestamp, optional): Last date of the range (inclusive)
+        interval (str): Bar interval. Defaults to '1d'.
+        adjust (bool): Adjust prices for splits and dividends. Defaults to
+            True, as ``yf.download`` does.
+
+    Returns:
+        pd.DataFrame: Price history in ``yf.download`` layout
+    """
+    return get_price_store().download(tickers, period, start, end, interval, adjust)
@@ -0,0 +1,329 @@
+import ast
+import io
+import tokenize
+from functools import lru_cache, reduce
+from typing import Any, Callable, List, Mapping, Set, Tuple
+
+import numpy as np
+
+Columns = Mapping[str, np.ndarray]
+Evaluator = Callable[[Columns], Any]
+# A condition yields (result, known): `known` is False where a missing value
+# leaves the outcome undetermined, and `result` is False there
+Condition = Callable[[Columns], Tuple[Any, Any]]
+
+_COMPARISONS = {
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+}
+
+_ARITHMETIC = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+}
+
+_KEYWORDS = {"AND": "and", "OR": "or", "NOT": "not", "IN": "in"}
+
+
+class ScreenExpressionError(ValueError):
+    """Raised when a screening expression cannot be parsed or evaluated."""
+
+
+def _normalize_keywords(source: str) -> str:
+    """Lower-case AND/OR/NOT/IN so SQL-style expressions parse as Python."""
+    try:
+        tokens = [
+            token._replace(string=_KEYWORDS.get(token.string, token.string))
+            if token.type == tokenize.NAME
+            else token
+            for token in tokenize.generate_tokens(io.StringIO(source).readline)
+        ]
+    except (tokenize.TokenError, SyntaxError) as e:
+        raise ScreenExpressionError(f"Invalid screening expression: {e}") from e
+    return tokenize.untokenize(tokens)
+
+
+def _is_text(value: Any) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.dtype == object
+    return isinstance(value, str)
+
+
+def _lower(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return np.array([str(item).strip().lower() for item in value], dtype=object)
+    return value.strip().lower()
+
+
+def _present(value: Any) -> Any:
+    """Mask of entries that have a value (non-NaN numbers, non-empty text)."""
+    if not isinstance(value, np.ndarray):
+        return True
+    if value.dtype == object:
+        return value != ""
+    return ~np.isnan(value)
+
+
+def _numeric(value: Any, source: str) -> Any:
+    if _is_text(value):
+        raise ScreenExpressionError(f"'{source}' is text, not a number")
+    return value
+
+
+def _and(a: Tuple[Any, Any], b: Tuple[Any, Any]) -> Tuple[Any, Any]:
+    """Three-valued AND: false wins over unknown, unknown over true."""
+    (result_a, known_a), (result_b, known_b) = a, b
+    false = (known_a & ~result_a) | (known_b & ~result_b)
+    return result_a & result_b, (known_a & known_b) | false
+
+
+def _or(a: Tuple[Any, Any], b: Tuple[Any, Any]) -> Tuple[Any, Any]:
+    """Three-valued OR: true wins over unknown, unknown over false."""
+    (result_a, known_a), (result_b, known_b) = a, b
+    result = result_a | result_b
+    return result, (known_a & known_b) | result
+
+
+def _column(columns: Columns, name: str) -> np.ndarray:
+    try:
+        return columns[name]
+    except KeyError:
+        raise ScreenExpressionError(
+            f"Unknown field '{name}' in screening expression"
+        ) from None
+
+
+class ScreenExpression:
+    """
+    Boolean screening expression compiled into vectorised NumPy operations.
+
+    Expressions use Python syntax restricted to field names, number and
+    string literals, arithmetic (``+ - * /``), comparisons (including chains
+    such as ``10 < trailingPE <= 25``), ``in`` / ``not in`` with a literal
+    list, and ``and`` / ``or`` / ``not`` (upper-case keywords are accepted
+    too)::
+
+        marketCap > 1e10 and (trailingPE < 20 or dividendYield > 0.03)
+        sector in ['Technology', 'Healthcare'] and not industry == 'Biotechnology'
+
+    The source is parsed once into a tree of closures; evaluating it against
+    a set of columns runs one array operation per node, so the whole table
+    is screened without a Python loop over rows. Text comparisons are
+    case-insensitive.
+
+    A comparison on a missing value is unknown rather than false, and
+    ``not`` keeps it unknown, so rows with a missing value never match a
+    condition on that field, negated or not::
+
+        >>> columns = {"trailingPE": np.array([15.0, 25.0, np.nan])}
+        >>> compile_screen("not trailingPE < 20").evaluate(columns)
+        array([False,  True, False])
+        >>> compile_screen("trailingPE >= 20").evaluate(columns)
+        array([False,  True, False])
+
+    Attributes:
+        source (str): Original expression
+        fields (Set[str]): Field names referenced by the expression
+    """
+
+    def __init__(self, source: str):
+        """
+        Parse and compile an expression.
+
+        Args:
+            source (str): Screening expression
+
+        Raises:
+            ScreenExpressionError: If the expression is not valid
+        """
+        self.source = source
+        self.fields: Set[str] = set()
+        try:
+            tree = ast.parse(_normalize_keywords(source.strip()), mode="eval")
+        except SyntaxError as e:
+            raise ScreenExpressionError(f"Invalid screening expression: {e.msg}") from e
+        self._evaluate = self._compile_condition(tree.body)
+
+    def evaluate(self, columns: Columns) -> np.ndarray:
+        """
+        Evaluate the expression over a table.
+
+        Args:
+            columns (Mapping[str, np.ndarray]): Equal-length columns keyed by
+                every name in `fields`; text columns must have object dtype
+
+        Returns:
+            np.ndarray: Boolean mask of the rows that satisfy the expression
+
+        Raises:
+            ScreenExpressionError: If a field is missing or used with the wrong type
+        """
+        result, _ = self._evaluate(columns)
+        return np.asarray(result, dtype=bool)
+
+    def _unsupported(self, node: ast.AST) -> ScreenExpressionError:
+        return ScreenExpressionError(
+            f"Unsupported syntax in screening expression: {ast.unparse(node)}"
+        )
+
+    def _compile_condition(self, node: ast.AST) -> Condition:
+        if isinstance(node, ast.BoolOp):
+            parts = [self._compile_condition(value) for value in node.values]
+            combine = _and if isinstance(node.op, ast.And) else _or
+            return lambda columns: reduce(combine, (part(columns) for part in parts))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self._compile_condition(node.operand)
+
+            def negate(columns: Columns) -> Tuple[Any, Any]:
+                result, known = operand(columns)
+                return ~result & known, known
+
+            return negate
+        if isinstance(node, ast.Compare):
+            return self._compile_comparison(node)
+        raise ScreenExpressionError(
+            f"Expected a comparison in screening expression: {ast.unparse(node)}"
+        )
+
+    def _compile_comparison(self, node: ast.Compare) -> Condition:
+        parts: List[Condition] = []
+        left, left_has_field = self._compile_value(node.left)
+        text = ast.unparse(node)
+        for op, comparator in zip(node.ops, node.comparators):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                if len(node.ops) > 1 or not left_has_field:
+                    raise self._unsupported(node)
+                parts.append(
+                    self._membership(
+                        left, self._literals(comparator), isinstance(op, ast.NotIn)
+                    )
+                )
+                continue
+
+            if type(op) not in _COMPARISONS:
+                raise self._unsupported(node)
+            right, right_has_field = self._compile_value(comparator)
+            if not (left_has_field or right_has_field):
+                raise ScreenExpressionError(
+                    f"Comparison does not reference any field: {text}"
+                )
+            parts.append(self._comparison(type(op), left, right, text))
+            left, left_has_field = right, right_has_field
+
+        if len(parts) == 1:
+            return parts[0]
+        return lambda columns: reduce(_and, (part(columns) for part in parts))
+
+    @staticmethod
+    def _comparison(
+        op: type, left: Evaluator, right: Evaluator, text: str
+    ) -> Condition:
+        compare = _COMPARISONS[op]
+
+        def evaluate(columns: Columns) -> Tuple[Any, Any]:
+            a, b = left(columns), right(columns)
+            if _is_text(a) or _is_text(b):
+                if op not in (ast.Eq, ast.NotEq) or not (_is_text(a) and _is_text(b)):
+                    raise ScreenExpressionError(
+                        f"Text can only be compared with == or != to text: {text}"
+                    )
+                a, b = _lower(a), _lower(b)
+            with np.errstate(invalid="ignore"):
+                result = np.asarray(compare(a, b), dtype=bool)
+            known = np.asarray(_present(a) & _present(b), dtype=bool)
+            return result & known, known
+
+        return evaluate
+
+    @staticmethod
+    def _membership(value: Evaluator, literals: list, negate: bool) -> Condition:
+        def evaluate(columns: Columns) -> Tuple[Any, Any]:
+            column = value(columns)
+            if _is_text(column):
+                column = _lower(column)
+                options = [
+                    _lower(item) if isinstance(item, str) else item for item in literals
+                ]
+            else:
+                options = [item for item in literals if not isinstance(item, str)]
+            result = np.isin(column, options)
+            known = np.asarray(_present(column), dtype=bool)
+            return (~result if negate else result) & known, known
+
+        return evaluate
+
+    def _literals(self, node: ast.AST) -> list:
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            try:
+                return [ast.literal_eval(element) for element in node.elts]
+            except ValueError:
+                pass
+        raise ScreenExpressionError(
+            f"Expected a list of values after 'in': {ast.unparse(node)}"
+        )
+
+    def _compile_value(self, node: ast.AST) -> Tuple[Evaluator, bool]:
+        """Compile an operand; the flag tells whether it references a field."""
+        if isinstance(node, ast.Name):
+            name = node.id
+            self.fields.add(name)
+            return (lambda columns: _column(columns, name)), True
+
+        if (
+            isinstance(node, ast.Constant)
+            and isinstance(node.value, (int, float, str))
+            and not isinstance(node.value, bool)
+        ):
+            constant = node.value
+            return (lambda columns: constant), False
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand, has_field = self._compile_value(node.operand)
+            sign = -1 if isinstance(node.op, ast.USub) else 1
+            text = ast.unparse(node.operand)
+            return (lambda columns: sign * _numeric(operand(columns), text)), has_field
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+            left, left_has_field = self._compile_value(node.left)
+            right, right_has_field = self._compile_value(node.right)
+            combine = _ARITHMETIC[type(node.op)]
+            left_text, right_text = ast.unparse(node.left), ast.unparse(node.right)
+
+            def evaluate(columns: Columns) -> Any:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    result = combine(
+                        _numeric(left(columns), left_text),
+                        _numeric(right(columns), right_text),
+                    )
+                # Division by zero has no meaningful ratio
+                if isinstance(result, np.ndarray):
+                    result[np.isinf(result)] = np.nan
+                return result
+
+            return evaluate, left_has_field or right_has_field
+
+        raise self._unsupported(node)
+
+
+@lru_cache(maxsize=256)
+def compile_screen(source: str) -> ScreenExpression:
+    """
+    Return the compiled form of a screening expression, parsing each distinct
+    expression only once.
+
+    Args:
+        source (str): Screening expression
+
+    Returns:
+        ScreenExpression: Compiled expression
+
+    Raises:
+        ScreenExpressionError: If the expression is not valid
+    """
+    return ScreenExpression(source)
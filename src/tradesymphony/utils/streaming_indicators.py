@@ -0,0 +1,896 @@
+import atexit
+import json
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .cache_paths import atomic_write, file_lock, get_cache_dir
+from .logger import get_logger
+
+logger = get_logger()
+
+NAN = float("nan")
+
+
+class RingBuffer:
+    """
+    Fixed-size window of floats with running sums.
+
+    Appending is O(1): the oldest value is overwritten in place and the sums
+    are adjusted instead of being recomputed over the window.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: List[float] = [0.0] * size
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.size
+
+    def append(self, value: float) -> None:
+        if self.full:
+            old = self.values[self.index]
+            self.total -= old
+            self.total_sq -= old * old
+        else:
+            self.count += 1
+        self.values[self.index] = value
+        self.total += value
+        self.total_sq += value * value
+        self.index = (self.index + 1) % self.size
+
+    def checkpoint(self) -> List[float]:
+        """Return what `rollback` needs to undo the next append."""
+        return [
+            self.index,
+            self.count,
+            self.total,
+            self.total_sq,
+            self.values[self.index],
+        ]
+
+    def rollback(self, checkpoint: List[float]) -> None:
+        """Undo the append made after `checkpoint` was taken."""
+        self.index, self.count, self.total, self.total_sq, old = checkpoint
+        self.values[self.index] = old
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "values": self.values,
+            "index": self.index,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RingBuffer":
+        buffer = cls(state["size"])
+        buffer.values = list(state["values"])
+        buffer.index = state["index"]
+        buffer.count = state["count"]
+        # Recompute the sums so restored state carries no accumulated drift
+        window = buffer.values if buffer.full else buffer.values[: buffer.count]
+        buffer.total = math.fsum(window)
+        buffer.total_sq = math.fsum(v * v for v in window)
+        return buffer
+
+
+class StreamingIndicator(ABC):
+    """
+    Base class for indicators that are updated one bar at a time.
+
+    Subclasses keep only the state they need (a ring buffer for windowed
+    averages, a few running values for recursive ones), so ``update`` is O(1)
+    and ``to_state`` produces a small JSON-serialisable dict. ``checkpoint``
+    captures the few scalars one update changes, so the last bar can be
+    undone in O(1) as well.
+    """
+
+    kind: str = ""
+
+    @abstractmethod
+    def update(
+        self, close: float, high: Optional[float] = None, low: Optional[float] = None
+    ):
+        """Apply one bar and return the new value."""
+
+    @property
+    @abstractmethod
+    def ready(self) -> bool:
+        """True once enough bars were applied for a meaningful value."""
+
+    @abstractmethod
+    def checkpoint(self) -> Any:
+        """Return the JSON-serialisable state `rollback` needs to undo the next update."""
+
+    @abstractmethod
+    def rollback(self, checkpoint: Any) -> None:
+        """Undo the update applied after `checkpoint` was taken."""
+
+    @abstractmethod
+    def to_state(self) -> Dict[str, Any]:
+        """Return the state as a JSON-serialisable dict."""
+
+    @classmethod
+    @abstractmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingIndicator":
+        """Rebuild the indicator from the dict produced by `to_state`."""
+
+
+class StreamingSMA(StreamingIndicator):
+    """Simple moving average over the last `window` closes."""
+
+    kind = "SMA"
+
+    def __init__(self, window: int = 20):
+        self.window = window
+        self.buffer = RingBuffer(window)
+
+    def update(self, close, high=None, low=None) -> float:
+        self.buffer.append(close)
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self.buffer.full
+
+    def checkpoint(self) -> List[float]:
+        return self.buffer.checkpoint()
+
+    def rollback(self, checkpoint: List[float]) -> None:
+        self.buffer.rollback(checkpoint)
+
+    @property
+    def value(self) -> float:
+        return self.buffer.total / self.window if self.ready else NAN
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "window": self.window,
+            "buffer": self.buffer.to_state(),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingSMA":
+        indicator = cls(state["window"])
+        indicator.buffer = RingBuffer.from_state(state["buffer"])
+        return indicator
+
+
+class StreamingEMA(StreamingIndicator):
+    """Exponential moving average seeded with the first close (pandas ``adjust=False``)."""
+
+    kind = "EMA"
+
+    def __init__(self, span: int = 20):
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+        self.value = NAN
+        self.count = 0
+
+    def update(self, close, high=None, low=None) -> float:
+        self.value = (
+            close
+            if self.count == 0
+            else self.alpha * close + (1 - self.alpha) * self.value
+        )
+        self.count += 1
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.span
+
+    def checkpoint(self) -> List[float]:
+        return [self.value, self.count]
+
+    def rollback(self, checkpoint: List[float]) -> None:
+        self.value, self.count = checkpoint
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "span": self.span,
+            "value": self.value,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingEMA":
+        indicator = cls(state["span"])
+        indicator.value = state["value"]
+        indicator.count = state["count"]
+        return indicator
+
+
+class StreamingMACD(StreamingIndicator):
+    """MACD line, signal line and histogram built from three streaming EMAs."""
+
+    kind = "MACD"
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = StreamingEMA(fast)
+        self.slow = StreamingEMA(slow)
+        self.signal = StreamingEMA(signal)
+        self.macd = NAN
+
+    def update(self, close, high=None, low=None) -> Dict[str, float]:
+        self.macd = self.fast.update(close) - self.slow.update(close)
+        self.signal.update(self.macd)
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self.slow.ready
+
+    def checkpoint(self) -> List[Any]:
+        return [
+            self.fast.checkpoint(),
+            self.slow.checkpoint(),
+            self.signal.checkpoint(),
+            self.macd,
+        ]
+
+    def rollback(self, checkpoint: List[Any]) -> None:
+        fast, slow, signal, self.macd = checkpoint
+        self.fast.rollback(fast)
+        self.slow.rollback(slow)
+        self.signal.rollback(signal)
+
+    @property
+    def value(self) -> Dict[str, float]:
+        return {
+            "MACD": self.macd,
+            "Signal_Line": self.signal.value,
+            "Histogram": self.macd - self.signal.value,
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "fast": self.fast.to_state(),
+            "slow": self.slow.to_state(),
+            "signal": self.signal.to_state(),
+            "macd": self.macd,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingMACD":
+        indicator = cls()
+        indicator.fast = StreamingEMA.from_state(state["fast"])
+        indicator.slow = StreamingEMA.from_state(state["slow"])
+        indicator.signal = StreamingEMA.from_state(state["signal"])
+        indicator.macd = state["macd"]
+        return indicator
+
+
+class StreamingRSI(StreamingIndicator):
+    """
+    Relative Strength Index with Wilder smoothing.
+
+    The first `period` price changes are averaged; afterwards the average gain
+    and loss are updated as ``avg = (avg * (period - 1) + x) / period``.
+    """
+
+    kind = "RSI"
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.previous_close = NAN
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0
+
+    def update(self, close, high=None, low=None) -> float:
+        if math.isnan(self.previous_close):
+            self.previous_close = close
+            return NAN
+
+        change = close - self.previous_close
+        self.previous_close = close
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        self.count += 1
+        if self.count <= self.period:
+            # Seed with a simple average of the first `period` changes
+            self.avg_gain += gain / self.period
+            self.avg_loss += loss / self.period
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.period
+
+    def checkpoint(self) -> List[float]:
+        return [self.previous_close, self.avg_gain, self.avg_loss, self.count]
+
+    def rollback(self, checkpoint: List[float]) -> None:
+        self.previous_close, self.avg_gain, self.avg_loss, self.count = checkpoint
+
+    @property
+    def value(self) -> float:
+        if not self.ready:
+            return NAN
+        if self.avg_loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + self.avg_gain / self.avg_loss)
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "period": self.period,
+            "previous_close": self.previous_close,
+            "avg_gain": self.avg_gain,
+            "avg_loss": self.avg_loss,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingRSI":
+        indicator = cls(state["period"])
+        indicator.previous_close = state["previous_close"]
+        indicator.avg_gain = state["avg_gain"]
+        indicator.avg_loss = state["avg_loss"]
+        indicator.count = state["count"]
+        return indicator
+
+
+class StreamingBollinger(StreamingIndicator):
+    """Bollinger Bands from a ring buffer's running sum and sum of squares."""
+
+    kind = "BB"
+
+    def __init__(self, window: int = 20, num_std: float = 2.0):
+        self.window = window
+        self.num_std = num_std
+        self.buffer = RingBuffer(window)
+
+    def update(self, close, high=None, low=None) -> Dict[str, float]:
+        self.buffer.append(close)
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self.buffer.full
+
+    def checkpoint(self) -> List[float]:
+        return self.buffer.checkpoint()
+
+    def rollback(self, checkpoint: List[float]) -> None:
+        self.buffer.rollback(checkpoint)
+
+    @property
+    def value(self) -> Dict[str, float]:
+        if not self.ready:
+            return {"Upper": NAN, "Middle": NAN, "Lower": NAN}
+        n = self.window
+        middle = self.buffer.total / n
+        # Sample standard deviation, matching pandas rolling().std()
+        variance = max(self.buffer.total_sq - n * middle * middle, 0.0) / (n - 1)
+        width = self.num_std * math.sqrt(variance)
+        return {"Upper": middle + width, "Middle": middle, "Lower": middle - width}
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "window": self.window,
+            "num_std": self.num_std,
+            "buffer": self.buffer.to_state(),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingBollinger":
+        indicator = cls(state["window"], state["num_std"])
+        indicator.buffer = RingBuffer.from_state(state["buffer"])
+        return indicator
+
+
+class StreamingADX(StreamingIndicator):
+    """
+    Average Directional Index with Wilder smoothing.
+
+    True range and directional movement are accumulated with Wilder's
+    ``S = S - S / period + x`` recursion; ADX is the Wilder average of DX.
+    """
+
+    kind = "ADX"
+    _SCALARS = ("tr", "plus_dm", "minus_dm", "adx", "dx_sum", "count", "dx_count")
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.previous = None  # (high, low, close) of the last bar
+        self.tr = 0.0
+        self.plus_dm = 0.0
+        self.minus_dm = 0.0
+        self.adx = NAN
+        self.dx_sum = 0.0
+        self.count = 0
+        self.dx_count = 0
+
+    def update(self, close, high=None, low=None) -> Dict[str, float]:
+        high = close if high is None else high
+        low = close if low is None else low
+        if self.previous is None:
+            self.previous = (high, low, close)
+            return self.value
+
+        prev_high, prev_low, prev_close = self.previous
+        self.previous = (high, low, close)
+        true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        up_move, down_move = high - prev_high, prev_low - low
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+
+        self.count += 1
+        if self.count <= self.period:
+            self.tr += true_range
+            self.plus_dm += plus_dm
+            self.minus_dm += minus_dm
+        else:
+            self.tr += true_range - self.tr / self.period
+            self.plus_dm += plus_dm - self.plus_dm / self.period
+            self.minus_dm += minus_dm - self.minus_dm / self.period
+
+        if self.count >= self.period and self.tr > 0:
+            plus_di, minus_di = self._directional_indices()
+            total = plus_di + minus_di
+            dx = 100 * abs(plus_di - minus_di) / total if total > 0 else 0.0
+            self.dx_count += 1
+            if self.dx_count < self.period:
+                self.dx_sum += dx
+            elif self.dx_count == self.period:
+                self.adx = (self.dx_sum + dx) / self.period
+            else:
+                self.adx = (self.adx * (self.period - 1) + dx) / self.period
+        return self.value
+
+    def _directional_indices(self):
+        if self.tr <= 0:
+            return NAN, NAN
+        return 100 * self.plus_dm / self.tr, 100 * self.minus_dm / self.tr
+
+    @property
+    def ready(self) -> bool:
+        return not math.isnan(self.adx)
+
+    def checkpoint(self) -> List[Any]:
+        return [
+            list(self.previous) if self.previous else None,
+            *(getattr(self, name) for name in self._SCALARS),
+        ]
+
+    def rollback(self, checkpoint: List[Any]) -> None:
+        previous, *scalars = checkpoint
+        self.previous = tuple(previous) if previous else None
+        for name, value in zip(self._SCALARS, scalars):
+            setattr(self, name, value)
+
+    @property
+    def value(self) -> Dict[str, float]:
+        plus_di, minus_di = (
+            self._directional_indices() if self.count >= self.period else (NAN, NAN)
+        )
+        return {"ADX": self.adx, "Plus_DI": plus_di, "Minus_DI": minus_di}
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "period": self.period,
+            "previous": self.previous,
+            "tr": self.tr,
+            "plus_dm": self.plus_dm,
+            "minus_dm": self.minus_dm,
+            "adx": self.adx,
+            "dx_sum": self.dx_sum,
+            "count": self.count,
+            "dx_count": self.dx_count,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingADX":
+        indicator = cls(state["period"])
+        indicator.previous = tuple(state["previous"]) if state["previous"] else None
+        for name in cls._SCALARS:
+            setattr(indicator, name, state[name])
+        return indicator
+
+
+INDICATOR_TYPES = {
+    cls.kind: cls
+    for cls in (
+        StreamingSMA,
+        StreamingEMA,
+        StreamingMACD,
+        StreamingRSI,
+        StreamingBollinger,
+        StreamingADX,
+    )
+}
+
+
+def indicator_from_state(state: Dict[str, Any]) -> StreamingIndicator:
+    """Rebuild any streaming indicator from the dict produced by ``to_state``."""
+    return INDICATOR_TYPES[state["kind"]].from_state(state)
+
+
+class IndicatorSet:
+    """
+    The TechnicalAnalysisTool indicator families for one ticker, kept hot.
+
+    Holds SMA 20/50/200, MACD 12/26/9, Wilder RSI 14, Bollinger 20/2 and
+    Wilder ADX 14, plus the timestamp of the last bar applied so replays of
+    old bars are ignored. SMA, MACD and Bollinger values match
+    ``compute_indicators``; RSI and ADX use Wilder smoothing where the tool
+    averages over rolling windows, so their values differ from the tool's.
+
+    Each indicator's checkpoint from before the last bar is kept, so a bar
+    that arrives again with the same timestamp (e.g. today's bar while the
+    market is open) replaces the last one instead of being ignored. The
+    values from before the last bar are kept as well, for crossover signals.
+    """
+
+    def __init__(self, indicators: Optional[Dict[str, StreamingIndicator]] = None):
+        self.indicators = indicators or {
+            "SMA_20": StreamingSMA(20),
+            "SMA_50": StreamingSMA(50),
+            "SMA_200": StreamingSMA(200),
+            "MACD": StreamingMACD(),
+            "RSI": StreamingRSI(14),
+            "BB": StreamingBollinger(20, 2.0),
+            "ADX": StreamingADX(14),
+        }
+        self.bars = 0
+        self.last_timestamp: Optional[str] = None
+        self.last_close = NAN
+        self.previous_timestamp: Optional[str] = None
+        self.previous_close = NAN
+        self.previous_values: Dict[str, float] = {}
+        # Indicator checkpoints from before the last bar, to revise that bar
+        self.checkpoints: Optional[Dict[str, Any]] = None
+
+    def update(
+        self,
+        close: float,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+        timestamp: Optional[pd.Timestamp] = None,
+    ) -> bool:
+        """
+        Apply one new bar to every indicator, or revise the last one.
+
+        Args:
+            close (float): Closing price of the bar
+            high (float, optional): High of the bar; defaults to the close
+            low (float, optional): Low of the bar; defaults to the close
+            timestamp (pd.Timestamp, optional): Bar time, used to skip bars
+                that were already applied and to revise the last bar
+
+        Returns:
+            bool: True if the bar was applied, False if it was skipped
+        """
+        stamp = None
+        revising = False
+        if timestamp is not None:
+            stamp = pd.Timestamp(timestamp).isoformat()
+            if self.last_timestamp is not None and stamp < self.last_timestamp:
+                return False
+            revising = stamp == self.last_timestamp
+
+        if revising:
+            for name, indicator in self.indicators.items():
+                indicator.rollback(self.checkpoints[name])
+        else:
+            self.previous_values = self.values()
+            self.previous_timestamp = self.last_timestamp
+            self.previous_close = self.last_close
+            self.bars += 1
+        self.checkpoints = {
+            name: indicator.checkpoint() for name, indicator in self.indicators.items()
+        }
+        for indicator in self.indicators.values():
+            indicator.update(close, high, low)
+        self.last_close = close
+        if stamp is not None:
+            self.last_timestamp = stamp
+        return True
+
+    def update_frame(self, frame: pd.DataFrame) -> int:
+        """
+        Apply every bar of an OHLCV frame that is newer than the last one seen.
+
+        The last bar seen before may be in the frame again with revised
+        prices; it replaces the applied one as in `update`.
+
+        Args:
+            frame (pd.DataFrame): Bars with at least a Close column
+
+        Returns:
+            int: Number of bars applied
+        """
+        applied = 0
+        highs = frame["High"] if "High" in frame.columns else frame["Close"]
+        lows = frame["Low"] if "Low" in frame.columns else frame["Close"]
+        for timestamp, close, high, low in zip(
+            frame.index, frame["Close"], highs, lows
+        ):
+            if pd.isna(close):
+                continue
+            applied += self.update(float(close), float(high), float(low), timestamp)
+        return applied
+
+    def restated(self, frame: pd.DataFrame) -> bool:
+        """
+        Tell whether `frame` holds a different close for the bar before the last.
+
+        That bar is final, so a different adjusted close means the history
+        was adjusted again (e.g. for a split) and no longer matches the
+        state built from it.
+
+        Args:
+            frame (pd.DataFrame): Bars starting at or before that bar
+
+        Returns:
+            bool: True if the indicators must be rebuilt from the new history
+        """
+        if self.previous_timestamp is None:
+            return False
+        for timestamp, close in frame["Close"].items():
+            if pd.Timestamp(timestamp).isoformat() == self.previous_timestamp:
+                return not math.isclose(close, self.previous_close, rel_tol=1e-9)
+        return False
+
+    def values(self) -> Dict[str, float]:
+        """Return the current values, named like the series of ``compute_indicators``."""
+        macd = self.indicators["MACD"].value
+        bands = self.indicators["BB"].value
+        adx = self.indicators["ADX"].value
+        return {
+            "SMA_20": self.indicators["SMA_20"].value,
+            "SMA_50": self.indicators["SMA_50"].value,
+            "SMA_200": self.indicators["SMA_200"].value,
+            "RSI": self.indicators["RSI"].value,
+            "MACD": macd["MACD"],
+            "Signal_Line": macd["Signal_Line"],
+            "MACD_Histogram": macd["Histogram"],
+            "BB_Upper": bands["Upper"],
+            "BB_Middle": bands["Middle"],
+            "BB_Lower": bands["Lower"],
+            "ADX": adx["ADX"],
+            "Plus_DI": adx["Plus_DI"],
+            "Minus_DI": adx["Minus_DI"],
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current and previous values without recomputation."""
+        return {
+            "last_price": self.last_close,
+            "date": self.last_timestamp,
+            "bars": self.bars,
+            "values": self.values(),
+            "previous_values": dict(self.previous_values),
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "bars": self.bars,
+            "last_timestamp": self.last_timestamp,
+            "last_close": self.last_close,
+            "previous_timestamp": self.previous_timestamp,
+            "previous_close": self.previous_close,
+            "previous_values": self.previous_values,
+            "checkpoints": self.checkpoints,
+            "indicators": {
+                name: indicator.to_state()
+                for name, indicator in self.indicators.items()
+            },
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "IndicatorSet":
+        indicator_set = cls(
+            {
+                name: indicator_from_state(indicator_state)
+                for name, indicator_state in state["indicators"].items()
+            }
+        )
+        for name in (
+            "bars",
+            "last_timestamp",
+            "last_close",
+            "previous_timestamp",
+            "previous_close",
+            "previous_values",
+            "checkpoints",
+        ):
+            setattr(indicator_set, name, state[name])
+        return indicator_set
+
+
+class IndicatorWatchlist:
+    """
+    Hot indicator state for a whole watchlist.
+
+    Each ticker gets an IndicatorSet that is warmed up once from the price
+    history store and afterwards only fed the bars that arrived since the
+    last sync. A set whose history was restated by the store (adjusted
+    prices change with every split or dividend) is warmed up again. State
+    can be saved to and restored from disk, so a restarted service resumes
+    without replaying history.
+
+    Tickers sync concurrently: each has its own lock around its price store
+    reads, and the watchlist lock only guards the indicator sets themselves.
+
+    Attributes:
+        state_path (Path): JSON file the watchlist is persisted to
+        warmup_period (str): History used to warm up new tickers
+    """
+
+    def __init__(self, state_path: Optional[Path] = None, warmup_period: str = "2y"):
+        """
+        Initialise the watchlist, restoring saved state if present.
+
+        Args:
+            state_path (Path, optional): Persistence file. Defaults to
+                ``<CACHE_PATH>/indicators/watchlist.json``.
+            warmup_period (str): History used to warm up new tickers. Defaults to '2y'.
+        """
+        self.state_path = (
+            Path(state_path)
+            if state_path
+            else get_cache_dir("indicators") / "watchlist.json"
+        )
+        self.warmup_period = warmup_period
+        self._lock = threading.Lock()
+        self._sets: Dict[str, IndicatorSet] = {}
+        self._ticker_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        # Lets multi-ticker syncs reach the price store concurrently so their
+        # downloads can be coalesced
+        self._executor = ThreadPoolExecutor(
+            max_workers=16, thread_name_prefix="indicator-watchlist"
+        )
+        self.load()
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._ticker_locks[key]
+
+    def sync(self, ticker: str, interval: str = "1d") -> IndicatorSet:
+        """
+        Bring one ticker's indicators up to date with the price history store.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            interval (str): Bar interval. Defaults to '1d'.
+
+        Returns:
+            IndicatorSet: The ticker's indicator set; later syncs keep
+                updating it, so read it through `snapshot`
+        """
+        from .price_store import get_price_store
+
+        key = ticker.upper()
+        store = get_price_store()
+        with self._lock_for(key):
+            with self._lock:
+                indicator_set = self._sets.get(key)
+            if indicator_set is not None and indicator_set.last_timestamp is not None:
+                # Re-read the bar before the last one too, to notice restated history
+                bars = store.get_history(
+                    ticker,
+                    start=indicator_set.previous_timestamp
+                    or indicator_set.last_timestamp,
+                    interval=interval,
+                )
+                if not indicator_set.restated(bars):
+                    with self._lock:
+                        indicator_set.update_frame(bars)
+                    return indicator_set
+                logger.info(
+                    f"Price history of {key} was restated, rebuilding indicators"
+                )
+
+            # Warm up a new set without the watchlist lock and publish it once built
+            indicator_set = IndicatorSet()
+            bars = store.get_history(
+                ticker, period=self.warmup_period, interval=interval
+            )
+            indicator_set.update_frame(bars)
+            with self._lock:
+                self._sets[key] = indicator_set
+            return indicator_set
+
+    def snapshot(self, ticker: str, interval: str = "1d") -> Dict[str, Any]:
+        """Return the ticker's current indicator values after syncing new bars."""
+        indicator_set = self.sync(ticker, interval)
+        with self._lock:
+            return indicator_set.snapshot()
+
+    def snapshots(
+        self, tickers: List[str], interval: str = "1d"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Sync several tickers concurrently and return their snapshots.
+
+        Args:
+            tickers (List[str]): Stock ticker symbols
+            interval (str): Bar interval. Defaults to '1d'.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Snapshot per ticker; tickers whose sync
+                failed are logged and left out
+        """
+        futures = {
+            ticker: self._executor.submit(self.snapshot, ticker, interval)
+            for ticker in tickers
+        }
+        snapshots = {}
+        for ticker, future in futures.items():
+            try:
+                snapshots[ticker] = future.result()
+            except Exception as e:
+                logger.warning(f"Could not sync indicators for {ticker}: {e}")
+        return snapshots
+
+    def _read_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Discarding unreadable indicator state: {e}")
+            return {}
+
+    def load(self) -> None:
+        """Restore watchlist state from disk, ignoring a missing or corrupt file."""
+        try:
+            self._sets = {
+                ticker: IndicatorSet.from_state(set_state)
+                for ticker, set_state in self._read_state().items()
+            }
+        except Exception as e:
+            logger.warning(f"Discarding unreadable indicator state: {e}")
+
+    def save(self) -> None:
+        """
+        Write the state of every indicator set to disk atomically.
+
+        Crew worker processes keep their own watchlists, so the sets are
+        merged into the file on disk instead of replacing the tickers of the
+        other processes.
+        """
+        with self._lock:
+            ours = {ticker: s.to_state() for ticker, s in self._sets.items()}
+        with file_lock(self.state_path.with_suffix(".lock")):
+            state = self._read_state()
+            state.update(ours)
+            atomic_write(self.state_path, lambda tmp: tmp.write_text(json.dumps(state)))
+
+
+@lru_cache(maxsize=1)
+def get_indicator_watchlist() -> IndicatorWatchlist:
+    """
+    Return the process-wide indicator watchlist.
+
+    Returns:
+        IndicatorWatchlist: Shared hot indicator state, restored from disk and
+            saved again when the process exits
+    """
+    watchlist = IndicatorWatchlist()
+    atexit.register(watchlist.save)
+    return watchlist
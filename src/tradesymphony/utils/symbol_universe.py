@@ -0,0 +1,311 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+
+from .api_fetch import (
+    DOW30_WIKI_URL,
+    NASDAQ100_WIKI_URL,
+    SP500_WIKI_URL,
+    parse_dow30_symbols,
+    parse_nasdaq100_symbols,
+    parse_sp500_symbols,
+)
+from .cache_paths import atomic_write, get_cache_dir
+from .http_clients import get_http_clients
+from .logger import get_logger
+
+logger = get_logger()
+
+# Index name -> (constituents page, parser for its HTML)
+INDEX_SOURCES: Dict[str, Tuple[str, Callable[[str], List[str]]]] = {
+    "sp500": (SP500_WIKI_URL, parse_sp500_symbols),
+    "nasdaq100": (NASDAQ100_WIKI_URL, parse_nasdaq100_symbols),
+    "dow30": (DOW30_WIKI_URL, parse_dow30_symbols),
+}
+
+REQUEST_HEADERS = {"User-Agent": "tradesymphony/0.1 (index constituents cache)"}
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+class SymbolUniverseStore:
+    """
+    Local copy of index constituents with a constituent-change history.
+
+    Symbols for each index are kept in memory and in a JSON file, so lookups
+    never touch the network. An index is re-checked once its copy is older
+    than `refresh_seconds` (a day by default) with a conditional request
+    (``If-None-Match`` / ``If-Modified-Since``); an unchanged page costs a
+    304 response and no HTML parsing. All indexes are checked concurrently.
+
+    Whenever a refresh changes an index, the added and removed symbols are
+    appended to its history with the date, so ``constituents(index, as_of)``
+    can reconstruct the universe on any date since tracking started.
+
+    Attributes:
+        path (Path): JSON file holding the symbols, validators and history
+        refresh_seconds (float): Age after which an index is re-checked
+    """
+
+    def __init__(
+        self, path: Optional[Path] = None, refresh_seconds: Optional[float] = None
+    ):
+        """
+        Initialise the store and load the persisted copy if present.
+
+        Args:
+            path (Path, optional): State file. Defaults to
+                ``<CACHE_PATH>/symbols/universe.json``.
+            refresh_seconds (float, optional): Maximum age of an index before
+                it is re-checked. Defaults to ``SYMBOL_UNIVERSE_REFRESH_SECONDS``
+                or one day.
+        """
+        self.path = Path(path) if path else get_cache_dir("symbols") / "universe.json"
+        self.refresh_seconds = (
+            refresh_seconds
+            if refresh_seconds is not None
+            else float(os.getenv("SYMBOL_UNIVERSE_REFRESH_SECONDS", "86400"))
+        )
+        self._lock = threading.Lock()
+        self._refreshing = threading.Lock()
+        self._indexes: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Discarding unreadable symbol universe: {e}")
+            return {}
+
+    def _save(self) -> None:
+        try:
+            with self._lock:
+                text = json.dumps(self._indexes)
+                atomic_write(self.path, lambda tmp: tmp.write_text(text))
+        except Exception as e:
+            logger.warning(f"Could not persist symbol universe: {e}")
+
+    def is_stale(self, index: str) -> bool:
+        """Return True if an index is missing or older than `refresh_seconds`."""
+        entry = self._indexes.get(index)
+        return entry is None or time.time() - entry["checked_at"] > self.refresh_seconds
+
+    def symbols(self, index: str) -> List[str]:
+        """
+        Return the stored constituents of an index without any network access.
+
+        Args:
+            index (str): One of INDEX_SOURCES
+
+        Returns:
+            List[str]: Constituent symbols, empty if the index was never loaded
+        """
+        entry = self._indexes.get(index)
+        return list(entry["symbols"]) if entry else []
+
+    def constituents(self, index: str, as_of: Optional[str] = None) -> List[str]:
+        """
+        Return the constituents of an index on a given date.
+
+        Changes recorded after `as_of` are undone, newest first. Dates before
+        the first recorded snapshot return that snapshot, the earliest
+        universe known.
+
+        Args:
+            index (str): One of INDEX_SOURCES
+            as_of (str, optional): Date as 'YYYY-MM-DD'. Defaults to today.
+
+        Returns:
+            List[str]: Sorted constituent symbols on that date
+        """
+        entry = self._indexes.get(index)
+        if not entry:
+            return []
+        if as_of is None:
+            return list(entry["symbols"])
+
+        as_of = datetime.fromisoformat(as_of).strftime("%Y-%m-%d")
+        members = set(entry["symbols"])
+        for change in reversed(entry["history"]):
+            if change["date"] <= as_of:
+                break
+            if not change.get("initial"):
+                members.difference_update(change["added"])
+                members.update(change["removed"])
+        return sorted(members)
+
+    def history(self, index: str) -> List[dict]:
+        """
+        Return the recorded constituent changes of an index, oldest first.
+
+        Args:
+            index (str): One of INDEX_SOURCES
+
+        Returns:
+            List[dict]: Entries with 'date', 'added' and 'removed' symbol lists
+        """
+        entry = self._indexes.get(index)
+        return [dict(change) for change in entry["history"]] if entry else []
+
+    def _apply(self, index: str, symbols: List[str], response) -> None:
+        """Store a freshly parsed list and record how it differs from the last one."""
+        now = time.time()
+        with self._lock:
+            entry = self._indexes.get(index)
+            previous = set(entry["symbols"]) if entry else None
+            history = entry["history"] if entry else []
+            current = set(symbols)
+            if previous is None:
+                history.append(
+                    {
+                        "date": _today(),
+                        "added": sorted(current),
+                        "removed": [],
+                        "initial": True,
+                    }
+                )
+            elif current != previous:
+                history.append(
+                    {
+                        "date": _today(),
+                        "added": sorted(current - previous),
+                        "removed": sorted(previous - current),
+                    }
+                )
+                logger.info(
+                    f"{index} constituents changed: "
+                    f"+{len(current - previous)} -{len(previous - current)}"
+                )
+            self._indexes[index] = {
+                "symbols": symbols,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "checked_at": now,
+                "history": history,
+            }
+
+    async def _refresh_index(self, index: str, session: aiohttp.ClientSession) -> None:
+        url, parser = INDEX_SOURCES[index]
+        entry = self._indexes.get(index)
+        headers = dict(REQUEST_HEADERS)
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and entry:
+                    with self._lock:
+                        entry["checked_at"] = time.time()
+                    return
+                response.raise_for_status()
+                html = await response.text()
+            symbols = parser(html)
+            if not symbols:
+                raise ValueError("no symbols found on page")
+            self._apply(index, [str(symbol).strip() for symbol in symbols], response)
+        except Exception as e:
+            logger.error(f"Error refreshing {index} constituents: {e}")
+
+    async def refresh(
+        self,
+        indexes: Optional[Iterable[str]] = None,
+        force: bool = False,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        """
+        Re-check stale indexes concurrently and persist any changes.
+
+        Failures are logged and leave the stored copy in place.
+
+        Args:
+            indexes (Iterable[str], optional): Indexes to check. Defaults to all.
+            force (bool): Check even if the stored copy is still fresh
+            session (aiohttp.ClientSession, optional): Session to use. Defaults
+                to the shared session of the HTTP client registry.
+        """
+        indexes = [
+            index
+            for index in (indexes or INDEX_SOURCES)
+            if force or self.is_stale(index)
+        ]
+        if not indexes:
+            return
+        if session is None:
+            await get_http_clients().call(
+                lambda session: self.refresh(indexes, force=True, session=session)
+            )
+            return
+
+        await asyncio.gather(
+            *(self._refresh_index(index, session) for index in indexes)
+        )
+        self._save()
+
+    def refresh_in_background(self, indexes: Optional[Iterable[str]] = None) -> bool:
+        """
+        Re-check stale indexes on a daemon thread unless a refresh is running.
+
+        Args:
+            indexes (Iterable[str], optional): Indexes to check. Defaults to all.
+
+        Returns:
+            bool: True if a new refresh was started
+        """
+        if not self._refreshing.acquire(blocking=False):
+            return False
+        indexes = list(indexes) if indexes is not None else None
+
+        def _refresh():
+            try:
+                asyncio.run(self.refresh(indexes))
+            except Exception as e:
+                logger.error(f"Background symbol universe refresh failed: {e}")
+            finally:
+                self._refreshing.release()
+
+        threading.Thread(target=_refresh, name="symbol-universe", daemon=True).start()
+        return True
+
+    async def get(self, index: str) -> List[str]:
+        """
+        Return the constituents of an index, loading it on first use.
+
+        A stale copy is returned immediately and refreshed in the background.
+
+        Args:
+            index (str): One of INDEX_SOURCES
+
+        Returns:
+            List[str]: Constituent symbols, empty if the index cannot be loaded
+        """
+        if index not in self._indexes:
+            await self.refresh([index])
+        elif self.is_stale(index):
+            self.refresh_in_background([index])
+        return self.symbols(index)
+
+
+@lru_cache(maxsize=1)
+def get_symbol_universe() -> SymbolUniverseStore:
+    """
+    Return the process-wide symbol universe store.
+
+    Returns:
+        SymbolUniverseStore: Shared store used by the symbol fetcher tool
+    """
+    return SymbolUniverseStore()